@@ -2,10 +2,28 @@ from dotenv import load_dotenv
 from flask import Flask
 from models.app_models import db
 from flask_migrate import Migrate
+from sqlalchemy import inspect
 import os
+import threading
+from itertools import chain
 from datamanager.sqlite_data_manager import SQLiteDataManager
 from routes import register_routes
 from routes.error_handlers import register_error_handlers
+from commands import register_commands
+from datamanager.job_queue import JobWorker
+from datamanager.unit_of_work import GroupCommitter
+from datamanager.enrichment import register_enrichment_jobs
+from datamanager.engine_profile import get_engine_options, configure_engine
+from datamanager.replica_routing import configure_replicas
+from datamanager.request_cache import register_request_cache
+from datamanager.page_cache import create_page_cache
+from datamanager.session_store import ServerSessionInterface, create_session_store
+from routes.metrics_routes import register_metrics
+from datamanager.profiling import configure_slow_query_log, register_request_profiler
+from datamanager.search import create_search_index, has_search_index
+from datamanager.title_index import TitleIndex
+from datamanager.utils import omdb_cache
+from datamanager.poster_mirror import PosterStore, register_poster_jobs
 
 
 load_dotenv()
@@ -23,6 +41,45 @@ def create_app():
     app.config["SECRET_KEY"] = os.getenv("SECRET_KEY")
     app.config["SQLALCHEMY_DATABASE_URI"] = os.getenv("DATABASE_URL")
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    # OMDb answer cache: SQLite file shared by worker processes (empty = memory only)
+    app.config["OMDB_CACHE_PATH"] = os.getenv("OMDB_CACHE_PATH", os.path.join(app.instance_path, "omdb_cache.sqlite"))
+    app.config["OMDB_CACHE_SIZE"] = int(os.getenv("OMDB_CACHE_SIZE", "1024"))
+    app.config["OMDB_CACHE_TTL"] = int(os.getenv("OMDB_CACHE_TTL", str(7 * 24 * 3600)))
+    app.config["OMDB_CACHE_NEGATIVE_TTL"] = int(os.getenv("OMDB_CACHE_NEGATIVE_TTL", str(24 * 3600)))
+    # Add movies immediately and fetch their OMDb details in background worker threads
+    app.config["ASYNC_ENRICHMENT"] = os.getenv("ASYNC_ENRICHMENT", "false").lower() == "true"
+    app.config["JOB_WORKERS"] = int(os.getenv("JOB_WORKERS", "2"))
+    app.config["JOB_RETENTION"] = int(os.getenv("JOB_RETENTION", str(7 * 24 * 3600)))
+    app.config["IMPORT_WORKERS"] = int(os.getenv("IMPORT_WORKERS", "8"))
+    # Group commit: writes arriving within this many milliseconds share one transaction (0 = off)
+    app.config["GROUP_COMMIT_WINDOW_MS"] = float(os.getenv("GROUP_COMMIT_WINDOW_MS", "0"))
+    app.config["GROUP_COMMIT_MAX_BATCH"] = int(os.getenv("GROUP_COMMIT_MAX_BATCH", "64"))
+    # Optional read replicas: comma-separated SQLAlchemy URLs that get_* queries are routed to
+    app.config["DATABASE_REPLICA_URLS"] = [
+        url.strip() for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if url.strip()
+    ]
+    app.config["REPLICA_STICKY_SECONDS"] = float(os.getenv("REPLICA_STICKY_SECONDS", "5"))
+    app.config["SQLITE_REPLICA_SYNC_INTERVAL"] = float(os.getenv("SQLITE_REPLICA_SYNC_INTERVAL", "0"))
+    # Rendered user, movie and review pages: "memory" (per process), "sqlite" (shared by workers) or "none"
+    app.config["PAGE_CACHE_BACKEND"] = os.getenv("PAGE_CACHE_BACKEND", "none").lower()
+    app.config["PAGE_CACHE_PATH"] = os.getenv("PAGE_CACHE_PATH", "page_cache.sqlite")
+    app.config["PAGE_CACHE_SIZE"] = int(os.getenv("PAGE_CACHE_SIZE", "512"))
+    app.config["PAGE_CACHE_TTL"] = int(os.getenv("PAGE_CACHE_TTL", "3600"))
+    # Sessions: "cookie" (Flask's signed cookie), "memory" (per process) or "sqlite" (shared by workers)
+    app.config["SESSION_BACKEND"] = os.getenv("SESSION_BACKEND", "cookie").lower()
+    app.config["SESSION_PATH"] = os.getenv("SESSION_PATH", "sessions.sqlite")
+    app.config["SESSION_TTL"] = int(os.getenv("SESSION_TTL", str(7 * 24 * 3600)))
+    # How long the user profile cached in the session is trusted before the users row is read again
+    app.config["SESSION_PROFILE_TTL"] = int(os.getenv("SESSION_PROFILE_TTL", "300"))
+    # Optional bearer token required to scrape /metrics
+    app.config["METRICS_TOKEN"] = os.getenv("METRICS_TOKEN")
+    # Profiling mode: log statements slower than SLOW_QUERY_MS, cProfile one request in PROFILE_EVERY_N_REQUESTS
+    app.config["SLOW_QUERY_MS"] = float(os.getenv("SLOW_QUERY_MS", "0"))
+    app.config["PROFILE_EVERY_N_REQUESTS"] = int(os.getenv("PROFILE_EVERY_N_REQUESTS", "0"))
+    app.config["PROFILE_DIR"] = os.getenv("PROFILE_DIR", "profiles")
+    # Mirror OMDb posters into POSTER_DIR as thumbnails served by the app, fetched by the job workers
+    app.config["POSTER_MIRROR"] = os.getenv("POSTER_MIRROR", "false").lower() == "true"
+    app.config["POSTER_DIR"] = os.getenv("POSTER_DIR", "posters")
 
     # Check for required environment variables
     if not app.config["SECRET_KEY"]:
@@ -30,16 +87,84 @@ def create_app():
     if not app.config["SQLALCHEMY_DATABASE_URI"]:
         raise RuntimeError("DATABASE_URL not set in environment variables")
 
+    # Connection pool sizing (server databases) or lock timeout (SQLite)
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = get_engine_options(app.config["SQLALCHEMY_DATABASE_URI"])
+
+    if app.config["OMDB_CACHE_PATH"]:
+        os.makedirs(os.path.dirname(os.path.abspath(app.config["OMDB_CACHE_PATH"])), exist_ok=True)
+    omdb_cache.configure(app.config["OMDB_CACHE_PATH"] or None, max_entries=app.config["OMDB_CACHE_SIZE"],
+                         ttl=app.config["OMDB_CACHE_TTL"], negative_ttl=app.config["OMDB_CACHE_NEGATIVE_TTL"])
+
     # Initialize extensions
     db.init_app(app)
     migrate.init_app(app, db)
 
     # Register Data Manager, Blueprints, and Error Handlers within context
     with app.app_context():
-        db.create_all()
-        app.data_manager = SQLiteDataManager(db)
+        configure_engine(app, db.engine)  # SQLite PRAGMAs on connect, startup log of effective settings
+        if app.config["DATABASE_REPLICA_URLS"]:
+            configure_replicas(app, app.config["DATABASE_REPLICA_URLS"],
+                               sticky_seconds=app.config["REPLICA_STICKY_SECONDS"],
+                               sync_interval=app.config["SQLITE_REPLICA_SYNC_INTERVAL"])
+        if app.config["SLOW_QUERY_MS"] > 0:
+            router = app.extensions.get("replica_router")
+            configure_slow_query_log(app, [db.engine, *(router.replica_engines if router else [])],
+                                     app.config["SLOW_QUERY_MS"])
+
+        # Databases under Alembic control are upgraded with `flask db upgrade`;
+        # create_all would otherwise pre-create new tables the migrations expect to build
+        if not inspect(db.engine).has_table("alembic_version"):
+            db.create_all()
+            if db.engine.dialect.name == "sqlite":
+                with db.engine.begin() as connection:
+                    # Databases created before search existed get their rows indexed once
+                    create_search_index(connection, rebuild=not has_search_index(connection))
+        page_cache = create_page_cache(app.config["PAGE_CACHE_BACKEND"], path=app.config["PAGE_CACHE_PATH"],
+                                       max_entries=app.config["PAGE_CACHE_SIZE"], ttl=app.config["PAGE_CACHE_TTL"])
+        if page_cache is not None:
+            app.extensions["page_cache"] = page_cache
+        # Built from catalog titles and cached OMDb answers on the first autocomplete request
+        title_index = TitleIndex(lambda: chain(app.data_manager.get_catalog_titles(), omdb_cache.iter_titles()))
+        app.extensions["title_index"] = title_index
+        app.extensions["poster_store"] = PosterStore(app.config["POSTER_DIR"])
+        session_store = create_session_store(app.config["SESSION_BACKEND"], path=app.config["SESSION_PATH"],
+                                             ttl=app.config["SESSION_TTL"])
+        if session_store is not None:
+            app.session_interface = ServerSessionInterface(session_store)
+        app.data_manager = SQLiteDataManager(db, page_cache=page_cache, title_index=title_index,
+                                             mirror_posters=app.config["POSTER_MIRROR"],
+                                             session_store=session_store)
         register_routes(app)  # Register all blueprints via the helper function (register_routes)
         register_error_handlers(app)  # Register global error handlers
+        register_commands(app)  # Register Flask CLI commands
+        register_request_cache(app)  # Report lookups answered by the request-scoped memo
+        register_metrics(app)  # Request, SQL, OMDb and template timings on /metrics
+        if app.config["PROFILE_EVERY_N_REQUESTS"] > 0:
+            register_request_profiler(app, app.config["PROFILE_EVERY_N_REQUESTS"], app.config["PROFILE_DIR"])
+
+    # Background threads start with the first request, so `flask db upgrade` and other CLI commands never run them
+    background_workers = []
+    if app.config["GROUP_COMMIT_WINDOW_MS"] > 0:
+        group_committer = GroupCommitter(app, window=app.config["GROUP_COMMIT_WINDOW_MS"] / 1000,
+                                         max_batch=app.config["GROUP_COMMIT_MAX_BATCH"])
+        app.extensions["group_committer"] = group_committer
+        background_workers.append(group_committer)
+
+    if app.config["ASYNC_ENRICHMENT"] or app.config["POSTER_MIRROR"]:
+        app.job_worker = JobWorker(app, threads=app.config["JOB_WORKERS"], retention=app.config["JOB_RETENTION"])
+        register_enrichment_jobs(app.job_worker)
+        register_poster_jobs(app.job_worker)
+        background_workers.append(app.job_worker)
+
+    if background_workers:
+        start_lock = threading.Lock()
+
+        @app.before_request
+        def start_background_workers():
+            if background_workers:
+                with start_lock:
+                    while background_workers:
+                        background_workers.pop(0).start()
 
     return app
 
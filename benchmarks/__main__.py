@@ -0,0 +1,169 @@
+"""
+Benchmark and load-test suite.
+
+    python -m benchmarks seed bench.sqlite --users 1000 --movies-per-user 20
+    python -m benchmarks run bench.sqlite --concurrency 16 --duration 30
+    python -m benchmarks compare benchmarks/results/OLD.json benchmarks/results/NEW.json
+"""
+import json
+import logging
+import os
+import subprocess
+import sys
+import threading
+from datetime import datetime
+import click
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+# Settings that change what is measured, recorded with every result
+RECORDED_SETTINGS = ("PAGE_CACHE_BACKEND", "ASYNC_ENRICHMENT", "JOB_WORKERS", "DATABASE_REPLICA_URLS",
+                     "SQLITE_JOURNAL_MODE", "SQLITE_SYNCHRONOUS", "SLOW_QUERY_MS", "PROFILE_EVERY_N_REQUESTS",
+                     "OMDB_RATE_LIMIT")
+
+
+def load_app(database_path: str, omdb_url: str = None):
+    """Import the app configured for the benchmark database (app.py builds it at import time)."""
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.abspath(database_path)}"
+    os.environ.setdefault("SECRET_KEY", "benchmark")
+    os.environ.setdefault("OMDB_API_KEY", "benchmark")
+    # Keep benchmark lookups out of the shared OMDb cache file
+    os.environ["OMDB_CACHE_PATH"] = ""
+    if omdb_url:
+        os.environ["OMDB_URL"] = omdb_url
+        # The fake server has no quota; measure the app rather than the rate limiter
+        os.environ.setdefault("OMDB_RATE_LIMIT", "0")
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from app import app
+    return app
+
+
+def current_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+@click.group()
+def cli():
+    """Seed, load-test and compare MovieWeb benchmark runs."""
+
+
+@cli.command()
+@click.argument("database", type=click.Path(dir_okay=False))
+@click.option("--users", default=1000, show_default=True)
+@click.option("--movies-per-user", default=20, show_default=True)
+@click.option("--reviews-per-movie", default=1, show_default=True, help="Average reviews per list entry.")
+@click.option("--catalog-size", default=5000, show_default=True, help="Distinct films the lists are drawn from.")
+@click.option("--seed", default=42, show_default=True)
+def seed(database, users, movies_per_user, reviews_per_movie, catalog_size, seed):
+    """Create DATABASE and fill it through the data manager."""
+    # Writes would otherwise pay for page cache invalidation nobody benefits from
+    os.environ["PAGE_CACHE_BACKEND"] = "none"
+    app = load_app(database)
+    from benchmarks.seed import seed_database
+
+    with app.app_context():
+        counts = seed_database(app.data_manager, users, movies_per_user, reviews_per_movie, catalog_size,
+                               seed=seed, progress=lambda done, total: click.echo(f"{done}/{total} users"))
+    click.echo(json.dumps(counts))
+
+
+@cli.command()
+@click.argument("database", type=click.Path(exists=True, dir_okay=False))
+@click.option("--url", help="Benchmark an already running server instead of an in-process one.")
+@click.option("--concurrency", default=16, show_default=True)
+@click.option("--duration", default=30.0, show_default=True, help="Seconds.")
+@click.option("--accounts", default=200, show_default=True, help="Users the virtual users log in as.")
+@click.option("--seed", default=42, show_default=True)
+@click.option("--metrics-token", envvar="METRICS_TOKEN")
+@click.option("--output", type=click.Path(), help="Result file (default benchmarks/results/<time>-<commit>.json).")
+def run(database, url, concurrency, duration, accounts, seed, metrics_token, output):
+    """Load-test every blueprint against DATABASE and store the results as JSON."""
+    from benchmarks.fake_omdb import FakeOMDbServer
+    from benchmarks.load import sample_accounts, read_sql_counters, run_load, summarize
+
+    server = fake_omdb = None
+    if not url:
+        from werkzeug.serving import make_server
+        # One access log line per request would dominate the run
+        logging.getLogger("werkzeug").setLevel(logging.WARNING)
+        fake_omdb = FakeOMDbServer().start()
+        app = load_app(database, omdb_url=fake_omdb.url)
+        server = make_server("127.0.0.1", 0, app, threaded=True)
+        threading.Thread(target=server.serve_forever, name="benchmark-server", daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_port}"
+
+    try:
+        sampled = sample_accounts(database, accounts, seed=seed)
+        if not sampled:
+            raise click.ClickException("No users with movies found; run `python -m benchmarks seed` first.")
+
+        from benchmarks.seed import table_counts
+        scale = None
+        if server is not None:
+            with app.app_context():
+                scale = table_counts()
+
+        sql_before = read_sql_counters(url, metrics_token)
+        samples, elapsed = run_load(url, sampled, concurrency, duration, seed=seed)
+        sql_after = read_sql_counters(url, metrics_token)
+    finally:
+        if server is not None:
+            server.shutdown()
+        if fake_omdb is not None:
+            fake_omdb.stop()
+
+    result = {
+        "commit": current_commit(),
+        "created_at": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        "scale": scale,
+        "load": {"url": url if server is None else "in-process", "concurrency": concurrency,
+                 "duration_s": round(elapsed, 2), "accounts": len(sampled)},
+        "settings": {name: os.getenv(name) for name in RECORDED_SETTINGS if os.getenv(name) is not None},
+        "endpoints": summarize(samples, elapsed, sql_before, sql_after),
+    }
+
+    if not output:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        stamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S")
+        output = os.path.join(RESULTS_DIR, f"{stamp}-{result['commit'] or 'nocommit'}.json")
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2)
+
+    click.echo(f"{'endpoint':<22}{'count':>8}{'err':>6}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'req/s':>9}{'q/req':>7}")
+    for endpoint, stats in result["endpoints"].items():
+        click.echo(f"{endpoint:<22}{stats['count']:>8}{stats['errors']:>6}{stats['p50_ms']:>9}{stats['p95_ms']:>9}"
+                   f"{stats['p99_ms']:>9}{stats['throughput_rps']:>9}{str(stats['queries_per_request']):>7}")
+    click.echo(f"Results written to {output}")
+
+
+@cli.command()
+@click.argument("baseline", type=click.File("r", encoding="utf-8"))
+@click.argument("candidate", type=click.File("r", encoding="utf-8"))
+def compare(baseline, candidate):
+    """Show the latency and throughput change of every endpoint between two result files."""
+    old, new = json.load(baseline), json.load(candidate)
+    click.echo(f"{old.get('commit')} -> {new.get('commit')}")
+
+    def change(before, after):
+        if not before:
+            return "n/a"
+        return f"{(after - before) / before * 100:+.1f}%"
+
+    for endpoint, stats in new["endpoints"].items():
+        previous = old["endpoints"].get(endpoint)
+        if previous is None:
+            click.echo(f"{endpoint:<22} new")
+            continue
+        click.echo(f"{endpoint:<22}"
+                   f" p50 {change(previous['p50_ms'], stats['p50_ms']):>8}"
+                   f" p95 {change(previous['p95_ms'], stats['p95_ms']):>8}"
+                   f" p99 {change(previous['p99_ms'], stats['p99_ms']):>8}"
+                   f" req/s {change(previous['throughput_rps'], stats['throughput_rps']):>8}"
+                   f" q/req {previous['queries_per_request']} -> {stats['queries_per_request']}")
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,71 @@
+import hashlib
+import json
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+
+def fake_movie(title: str) -> dict:
+    """
+    Build a deterministic OMDb answer for a title.
+    Titles starting with "zz" are reported as not found, like a typo would be.
+    Args:
+        title (str): Title as sent in the t= parameter.
+    Returns:
+        dict: OMDb-shaped JSON payload.
+    """
+    if title.lower().startswith("zz"):
+        return {"Response": "False", "Error": "Movie not found!"}
+    digest = int(hashlib.sha1(title.casefold().encode()).hexdigest(), 16)
+    return {
+        "Response": "True",
+        "Title": " ".join(title.split()).title(),
+        "Year": str(1950 + digest % 75),
+        "imdbRating": f"{1 + digest % 90 / 10:.1f}",
+        "Director": f"Director {digest % 997}",
+        "Poster": f"https://posters.invalid/{digest % 10 ** 8}.jpg",
+        "imdbID": f"tt{digest % 10 ** 8:08d}",
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # Keep connections open between requests like the real service, so client pooling is measured
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        title = query.get("t", [""])[0]
+        body = json.dumps(fake_movie(title) if title else {"Response": "False", "Error": "No title"}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeOMDbServer:
+    """Local stand-in for the OMDb API, served from a background thread.
+    Point OMDB_URL at url so benchmarks never depend on (or hammer) the real service.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self) -> "FakeOMDbServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-omdb", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
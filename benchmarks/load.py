@@ -0,0 +1,216 @@
+import math
+import random
+import re
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+import requests
+
+# (weight, operation name) of the request mix each virtual user draws from
+OPERATION_WEIGHTS = [
+    (5, "home"),
+    (15, "list_users"),
+    (25, "user_movies"),
+    (20, "view_reviews"),
+    (5, "movie_status"),
+    (3, "top_rated"),
+    (5, "suggest_titles"),
+    (5, "add_movie"),
+    (5, "update_movie"),
+    (8, "add_review"),
+    (2, "relogin"),
+]
+
+METRIC_LINE = re.compile(r'^(moviweb_sql_statements_total|moviweb_requests_total)\{endpoint="([^"]*)"[^}]*\} (\S+)$')
+
+
+def sample_accounts(database_path: str, count: int, seed: int = 42) -> list:
+    """
+    Pick the users the virtual users log in as, with their list entries.
+    Args:
+        database_path (str): SQLite file the server runs on.
+        count (int): Number of accounts to sample.
+        seed (int): Random seed.
+    Returns:
+        List[dict]: Accounts with id, email and movie_ids.
+    """
+    conn = sqlite3.connect(database_path)
+    try:
+        max_id = conn.execute("SELECT max(id) FROM users").fetchone()[0] or 0
+        rng = random.Random(seed)
+        accounts = []
+        for user_id in rng.sample(range(1, max_id + 1), min(count, max_id)):
+            row = conn.execute("SELECT id, email FROM users WHERE id = ?", (user_id,)).fetchone()
+            if row is None:
+                continue
+            movie_ids = [r[0] for r in conn.execute("SELECT id FROM user_movies WHERE user_id = ?", (user_id,))]
+            if movie_ids:
+                accounts.append({"id": row[0], "email": row[1], "movie_ids": movie_ids})
+        return accounts
+    finally:
+        conn.close()
+
+
+def read_sql_counters(base_url: str, token: str = None) -> dict:
+    """
+    Scrape /metrics for SQL statements and requests per endpoint.
+    Returns:
+        dict: endpoint -> {"statements": float, "requests": float}
+    """
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    text = requests.get(base_url.rstrip("/") + "/metrics", headers=headers, timeout=10).text
+    counters = defaultdict(lambda: {"statements": 0.0, "requests": 0.0})
+    for line in text.splitlines():
+        match = METRIC_LINE.match(line)
+        if match:
+            key = "statements" if match.group(1) == "moviweb_sql_statements_total" else "requests"
+            counters[match.group(2)][key] += float(match.group(3))
+    return dict(counters)
+
+
+class VirtualUser(threading.Thread):
+    """Logs in as one account and issues requests from the weighted mix until the deadline."""
+
+    def __init__(self, base_url: str, accounts: list, deadline: float, seed: int, record):
+        super().__init__(daemon=True)
+        self.base_url = base_url.rstrip("/")
+        self.accounts = accounts
+        self.deadline = deadline
+        self.rng = random.Random(seed)
+        self.record = record
+        self.session = requests.Session()
+        self.account = None
+
+    def request(self, endpoint: str, method: str, path: str, **kwargs):
+        started = time.perf_counter()
+        try:
+            response = self.session.request(method, self.base_url + path, allow_redirects=False,
+                                             timeout=30, **kwargs)
+            status = response.status_code
+        except requests.RequestException:
+            status = 0
+        self.record(endpoint, time.perf_counter() - started, status)
+
+    def login(self):
+        self.account = self.rng.choice(self.accounts)
+        self.request("auth.login", "POST", "/login", data={"email": self.account["email"]})
+
+    def run(self):
+        operations, weights = zip(*[(name, weight) for weight, name in OPERATION_WEIGHTS])
+        self.login()
+        while time.perf_counter() < self.deadline:
+            getattr(self, "op_" + self.rng.choices(operations, weights)[0])()
+
+    def _movie(self):
+        return self.rng.choice(self.account["movie_ids"])
+
+    def op_home(self):
+        self.request("main.home", "GET", "/")
+
+    def op_list_users(self):
+        after = self.rng.choice([None, None, self.rng.randint(1, max(1, self.account["id"]))])
+        self.request("user.list_users", "GET", "/users", params={"after": after} if after else None)
+
+    def op_user_movies(self):
+        self.request("user.user_movies", "GET", f"/{self.account['id']}")
+
+    def op_view_reviews(self):
+        self.request("review.view_reviews", "GET", f"/reviews/movie/{self._movie()}")
+
+    def op_movie_status(self):
+        self.request("movie.movie_status", "GET", f"/users/{self.account['id']}/movies/{self._movie()}/status")
+
+    def op_top_rated(self):
+        self.request("main.top_rated", "GET", "/top-rated")
+
+    def op_suggest_titles(self):
+        prefix = f"Bench Film {self.rng.randint(0, 999):03d}"[:self.rng.randint(2, 14)]
+        self.request("api.suggest_titles", "GET", "/api/titles/suggest", params={"q": prefix})
+
+    def op_add_movie(self):
+        # Mostly new titles (an OMDb round trip to the fake server), sometimes a typo
+        title = f"{'zz' if self.rng.random() < 0.1 else ''}Load Film {self.rng.randint(0, 10 ** 9)}"
+        self.request("movie.add_movie", "POST", f"/users/{self.account['id']}/add_movie", data={"title": title})
+
+    def op_update_movie(self):
+        self.request("movie.update_movie", "POST", f"/users/{self.account['id']}/update_movie/{self._movie()}",
+                     data={"rating": str(self.rng.randint(0, 10))})
+
+    def op_add_review(self):
+        self.request("review.add_review", "POST", f"/reviews/add/{self.account['id']}/{self._movie()}",
+                     data={"review_text": "Load test review", "rating": str(self.rng.randint(0, 10))})
+
+    def op_relogin(self):
+        self.request("auth.logout", "GET", "/logout")
+        self.login()
+
+
+def run_load(base_url: str, accounts: list, concurrency: int, duration: float, seed: int = 42) -> tuple:
+    """
+    Drive the server with concurrent virtual users for duration seconds.
+    Args:
+        base_url (str): Root URL of the running app.
+        accounts (list): Accounts from sample_accounts.
+        concurrency (int): Number of virtual users.
+        duration (float): Length of the run in seconds.
+        seed (int): Random seed of the request mix.
+    Returns:
+        tuple: (samples, elapsed) where samples maps endpoint -> list of (latency, status).
+    """
+    samples = defaultdict(list)
+    lock = threading.Lock()
+
+    def record(endpoint, latency, status):
+        with lock:
+            samples[endpoint].append((latency, status))
+
+    started = time.perf_counter()
+    users = [VirtualUser(base_url, accounts, started + duration, seed + i, record) for i in range(concurrency)]
+    for user in users:
+        user.start()
+    for user in users:
+        user.join()
+    return dict(samples), time.perf_counter() - started
+
+
+def percentile(sorted_values: list, fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(samples: dict, elapsed: float, sql_before: dict, sql_after: dict) -> dict:
+    """
+    Turn raw samples and /metrics deltas into the per-endpoint report.
+    Returns:
+        dict: endpoint -> count, errors, p50/p95/p99 (ms), throughput (req/s) and
+        queries_per_request, plus an "all" entry over every request.
+    """
+    def stats(entries, queries_per_request=None):
+        latencies = sorted(latency for latency, _ in entries)
+        return {
+            "count": len(entries),
+            "errors": sum(1 for _, status in entries if status == 0 or status >= 400),
+            "p50_ms": round(percentile(latencies, 0.50) * 1000, 2),
+            "p95_ms": round(percentile(latencies, 0.95) * 1000, 2),
+            "p99_ms": round(percentile(latencies, 0.99) * 1000, 2),
+            "throughput_rps": round(len(entries) / elapsed, 2) if elapsed else 0.0,
+            "queries_per_request": queries_per_request,
+        }
+
+    report = {}
+    total_statements = total_requests = 0.0
+    for endpoint, entries in sorted(samples.items()):
+        before = sql_before.get(endpoint, {"statements": 0.0, "requests": 0.0})
+        after = sql_after.get(endpoint, before)
+        statements = after["statements"] - before["statements"]
+        requests_served = after["requests"] - before["requests"]
+        total_statements += statements
+        total_requests += requests_served
+        report[endpoint] = stats(entries, round(statements / requests_served, 2) if requests_served else None)
+    report["all"] = stats([entry for entries in samples.values() for entry in entries],
+                          round(total_statements / total_requests, 2) if total_requests else None)
+    return report
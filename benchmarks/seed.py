@@ -0,0 +1,87 @@
+import random
+import time
+from sqlalchemy import insert, select, func
+from models.app_models import db, User, Movie, Review, CatalogMovie
+
+
+def catalog_entry(index: int) -> dict:
+    """Return the catalog fields of the index-th synthetic film."""
+    return {
+        "name": f"Bench Film {index:07d}",
+        "director": f"Director {index % 997}",
+        "year": 1950 + index % 75,
+        "rating": round(1 + index % 90 / 10, 1),
+        "poster_url": None,
+        "imdb_id": f"tb{index:08d}",
+    }
+
+
+def seed_database(data_manager, users: int, movies_per_user: int, reviews_per_movie: int,
+                  catalog_size: int, seed: int = 42, progress=None) -> dict:
+    """
+    Fill an empty database with synthetic users, list entries and reviews.
+    Users are created with add_user and each user's movies with one
+    add_movies_bulk call, so the catalog is built the way the app builds it.
+    The data manager has no bulk path for reviews, so they are written with
+    one executemany INSERT per user and the rating aggregates rebuilt at the end.
+    Args:
+        data_manager (DataManagerInterface): The application's data manager.
+        users (int): Number of users to create.
+        movies_per_user (int): Movies on each user's list.
+        reviews_per_movie (int): Average reviews written on each list entry.
+        catalog_size (int): Number of distinct films the lists are drawn from.
+        seed (int): Random seed, so runs with the same arguments build the same data.
+        progress (callable): Optional, called with (users_done, users) every 1000 users.
+    Returns:
+        dict: Row counts of the seeded tables and the seeding time in seconds.
+    """
+    if data_manager.get_all_users(limit=1):
+        raise ValueError("The benchmark database must be empty; seed a new file.")
+
+    rng = random.Random(seed)
+    movies_per_user = min(movies_per_user, catalog_size)
+    started = time.perf_counter()
+    first_user_id = None
+
+    for n in range(users):
+        user = data_manager.add_user(f"Bench User {n}", f"user{n}@bench.test")
+        user_id = user.id
+        first_user_id = first_user_id or user_id
+
+        films = rng.sample(range(catalog_size), movies_per_user)
+        data_manager.add_movies_bulk(user_id, [catalog_entry(index) for index in films])
+
+        if reviews_per_movie:
+            movie_ids = db.session.execute(select(Movie.id).where(Movie.user_id == user_id)).scalars().all()
+            reviews = [
+                {
+                    "user_id": rng.randint(first_user_id, user_id),
+                    "movie_id": movie_id,
+                    "review_text": f"Benchmark review {rng.random():.6f}",
+                    "rating": rng.randint(0, 10),
+                }
+                for movie_id in movie_ids
+                # Poisson-ish spread around the requested average
+                for _ in range(rng.choice((0, reviews_per_movie, 2 * reviews_per_movie)))
+            ]
+            if reviews:
+                db.session.execute(insert(Review), reviews)
+                db.session.commit()
+
+        if (n + 1) % 1000 == 0:
+            db.session.expunge_all()
+            if progress:
+                progress(n + 1, users)
+
+    data_manager.rebuild_title_stats()
+    return dict(table_counts(), seconds=round(time.perf_counter() - started, 1))
+
+
+def table_counts() -> dict:
+    """Return the row counts of the tables the benchmark scale is described by."""
+    return {
+        "users": db.session.scalar(select(func.count()).select_from(User)),
+        "catalog_movies": db.session.scalar(select(func.count()).select_from(CatalogMovie)),
+        "user_movies": db.session.scalar(select(func.count()).select_from(Movie)),
+        "reviews": db.session.scalar(select(func.count()).select_from(Review)),
+    }
@@ -0,0 +1,26 @@
+from commands.query_plan_commands import check_query_plans
+from commands.import_commands import import_movies_command
+from commands.rating_commands import rebuild_rating_stats
+from commands.search_commands import rebuild_search_index
+from commands.export_commands import export_table_command
+from commands.offline_index_commands import build_title_index
+from commands.poster_commands import mirror_posters_command
+
+"""
+Package initialization for the commands module.
+This module registers all Flask CLI commands for the application.
+"""
+
+def register_commands(app):
+    """
+    Register all application CLI commands to the Flask app instance.
+    Args:
+        app (Flask): The Flask application instance.
+    """
+    app.cli.add_command(check_query_plans)
+    app.cli.add_command(import_movies_command)
+    app.cli.add_command(rebuild_rating_stats)
+    app.cli.add_command(rebuild_search_index)
+    app.cli.add_command(export_table_command)
+    app.cli.add_command(build_title_index)
+    app.cli.add_command(mirror_posters_command)
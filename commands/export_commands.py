@@ -0,0 +1,28 @@
+import sys
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+from datamanager.export import EXPORT_BATCH_SIZE, EXPORT_FORMATS, stream_export
+
+
+@click.command("export-table")
+@click.argument("table")
+@click.option("--format", "export_format", type=click.Choice(EXPORT_FORMATS), default="csv", show_default=True)
+@click.option("--output", "-o", type=click.Path(dir_okay=False, writable=True),
+              help="File to write (default: standard output).")
+@click.option("--batch-size", default=EXPORT_BATCH_SIZE, show_default=True, help="Rows fetched per round trip.")
+@with_appcontext
+def export_table_command(table, export_format, output, batch_size):
+    """Stream every row of TABLE as CSV or JSON, in constant memory."""
+    try:
+        columns, rows = current_app.data_manager.export_table(table, batch_size=batch_size)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+
+    out = open(output, "w", encoding="utf-8", newline="") if output else sys.stdout
+    try:
+        for chunk in stream_export(export_format, columns, rows):
+            out.write(chunk)
+    finally:
+        if output:
+            out.close()
@@ -0,0 +1,28 @@
+from collections import Counter
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+from datamanager.bulk_import import parse_titles, import_movies
+
+
+@click.command("import-movies")
+@click.argument("user_id", type=int)
+@click.argument("file", type=click.File("r", encoding="utf-8"))
+@click.option("--workers", default=8, show_default=True, help="Concurrent OMDb lookups.")
+@with_appcontext
+def import_movies_command(user_id, file, workers):
+    """Import a CSV or JSON list of movie titles into USER_ID's list."""
+    if not current_app.data_manager.get_user_by_id(user_id):
+        raise click.ClickException(f"User {user_id} not found.")
+    try:
+        titles = parse_titles(file.read(), file.name)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+
+    outcomes = import_movies(current_app.data_manager, user_id, titles, max_workers=workers)
+    for outcome in outcomes:
+        detail = outcome.get("name") or outcome.get("error") or ""
+        click.echo(f"{outcome['status']:<10} {outcome['title']}" + (f" -> {detail}" if detail else ""))
+
+    totals = Counter(outcome["status"] for outcome in outcomes)
+    click.echo(", ".join(f"{count} {status}" for status, count in sorted(totals.items())) or "Nothing to import.")
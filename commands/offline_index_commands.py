@@ -0,0 +1,37 @@
+import os
+import time
+import click
+from flask.cli import with_appcontext
+from datamanager.offline_index import build_index, read_imdb_dump, read_omdb_dump, sniff_dump_format
+from datamanager.omdb_client import OMDbClient
+from datamanager.utils import normalize_title, offline_index, OMDB_OFFLINE_INDEX_PATH
+
+
+@click.command("build-title-index")
+@click.argument("dump", type=click.Path(exists=True, dir_okay=False))
+@click.option("--ratings", type=click.Path(exists=True, dir_okay=False),
+              help="IMDb title.ratings.tsv(.gz) to fill in ratings of an IMDb dump.")
+@click.option("--output", "-o", type=click.Path(dir_okay=False),
+              help="Index file to write (default: OMDB_OFFLINE_INDEX_PATH).")
+@with_appcontext
+def build_title_index(dump, ratings, output):
+    """Build the offline title index from DUMP (OMDb JSON Lines or IMDb title.basics TSV, optionally .gz)."""
+    output = output or OMDB_OFFLINE_INDEX_PATH
+    if not output:
+        raise click.ClickException("Set OMDB_OFFLINE_INDEX_PATH or pass --output.")
+
+    started = time.perf_counter()
+    if sniff_dump_format(dump) == "omdb":
+        records = read_omdb_dump(dump, OMDbClient.parse_details)
+    else:
+        records = read_imdb_dump(dump, ratings)
+    try:
+        count = build_index(output, records, normalize_title)
+    except (KeyError, ValueError) as e:
+        raise click.ClickException(f"Could not read {dump}: {e}")
+
+    size = os.path.getsize(output)
+    click.echo(f"Indexed {count} titles into {output} ({size / 1e6:.1f} MB) "
+               f"in {time.perf_counter() - started:.1f}s.")
+    if offline_index is None or os.path.abspath(output) != os.path.abspath(offline_index.path):
+        click.echo("Note: the app reads OMDB_OFFLINE_INDEX_PATH; point it at this file to use it.")
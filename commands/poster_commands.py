@@ -0,0 +1,20 @@
+import click
+import requests
+from flask import current_app
+from flask.cli import with_appcontext
+from datamanager.poster_mirror import mirror_poster
+
+
+@click.command("mirror-posters")
+@with_appcontext
+def mirror_posters_command():
+    """Mirror every catalog poster that has no local thumbnails yet (e.g. after enabling POSTER_MIRROR)."""
+    mirrored = failed = 0
+    for catalog_movie_id in current_app.data_manager.get_catalog_ids_missing_posters():
+        try:
+            mirror_poster(catalog_movie_id)
+            mirrored += 1
+        except (requests.RequestException, ValueError) as e:
+            failed += 1
+            click.echo(f"Film {catalog_movie_id}: {e}", err=True)
+    click.echo(f"Mirrored {mirrored} poster{'' if mirrored == 1 else 's'}, {failed} failed.")
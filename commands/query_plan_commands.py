@@ -0,0 +1,96 @@
+import re
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+from models.app_models import db
+from datamanager.query_counter import count_queries
+
+# Representative calls of every data manager read path, as the routes make them
+QUERY_PROBES = [
+    ("get_all_users", {"limit": 21}),
+    ("get_all_users", {"after_id": 1, "limit": 21}),
+    ("get_user_by_id", {"user_id": 1}),
+    ("get_user_by_email", {"email": "probe@example.com"}),
+    ("get_user_movies", {"user_id": 1, "limit": 21}),
+    ("get_user_movies", {"user_id": 1, "after_id": 1, "limit": 21}),
+    ("get_movie_by_id", {"movie_id": 1}),
+    ("get_review_by_id", {"review_id": 1}),
+    ("get_reviews_for_movie", {"movie_id": 1, "limit": 21}),
+    ("get_reviews_for_movie", {"movie_id": 1, "after_id": 1, "limit": 21}),
+    ("get_users_version", {"limit": 21}),
+    ("get_user_movies_version", {"user_id": 1, "limit": 21}),
+    ("get_reviews_version", {"movie_id": 1, "limit": 21}),
+    ("get_title_stats", {"catalog_movie_id": 1}),
+    ("get_top_rated", {"limit": 20, "min_ratings": 3}),
+    ("search", {"query": "godf", "kind": "movies", "limit": 21}),
+    ("search", {"query": "great acting", "kind": "reviews", "limit": 21}),
+    ("get_movies_by_ids", {"movie_ids": [1, 2, 3]}),
+    ("get_movies_by_ids", {"movie_ids": [1, 2, 3], "fields": ["name", "average_rating"], "user_id": 1}),
+    ("get_reviews_for_movies", {"movie_ids": [1, 2, 3], "limit_per_movie": 20}),
+    ("export_user_movies", {"user_id": 1}),
+    ("export_user_reviews", {"user_id": 1}),
+]
+
+# "SCAN <table>" without an index is a full table scan; "SCAN ... USING INDEX" is an ordered index walk
+# and "SCAN ... VIRTUAL TABLE INDEX" an FTS5 index lookup
+FULL_SCAN = re.compile(r"^SCAN (\w+)(?!.*(USING (COVERING )?INDEX|VIRTUAL TABLE INDEX))")
+# An open-ended rowid range is only a keyset page walk when it drives a single-table listing;
+# inside a join it means the planner found no index for the real filter
+ROWID_RANGE = re.compile(r"^SEARCH (\w+) USING INTEGER PRIMARY KEY \(rowid>\?\)$")
+TABLE = re.compile(r"^(?:SCAN|SEARCH) (\w+)")
+# SQLAlchemy's anonymous subqueries: scanning one reads the (already bounded) subquery result, not a table
+SUBQUERY = re.compile(r"^anon_\d+$")
+# A sort step: every matching row is read and sorted before the LIMIT applies
+TEMP_SORT = re.compile(r"^USE TEMP B-TREE FOR (RIGHT PART OF )?ORDER BY$")
+# Keyset pages must be read in page order from an index; other probes (ranked search,
+# top rated) sort an already bounded set
+KEYSET_PAGES = {"get_all_users", "get_user_movies", "get_reviews_for_movie", "get_reviews_version"}
+
+
+def find_table_scans(plan, keyset_page: bool = False):
+    """
+    Pick the steps of an EXPLAIN QUERY PLAN result that read a whole table.
+    Args:
+        plan (List[str]): The detail column of each plan row.
+        keyset_page (bool): The query reads a keyset page, so sorting counts as reading every matching row.
+    Returns:
+        List[str]: The offending plan steps.
+    """
+    tables = {m.group(1) for m in map(TABLE.match, plan) if m and not SUBQUERY.match(m.group(1))}
+    return [
+        step for step in plan
+        if (FULL_SCAN.match(step) and not SUBQUERY.match(FULL_SCAN.match(step).group(1)))
+        or (len(tables) > 1 and ROWID_RANGE.match(step))
+        or (keyset_page and TEMP_SORT.match(step))
+    ]
+
+
+@click.command("check-query-plans")
+@with_appcontext
+def check_query_plans():
+    """Fail if any data manager query falls back to a full table scan, or sorts a keyset page (SQLite only)."""
+    if db.engine.dialect.name != "sqlite":
+        raise click.ClickException("EXPLAIN QUERY PLAN checks are only supported on SQLite.")
+
+    failures = 0
+    for method, kwargs in QUERY_PROBES:
+        with count_queries() as counter:
+            getattr(current_app.data_manager, method)(**kwargs)
+        db.session.expunge_all()
+
+        for statement, parameters in zip(counter.statements, counter.parameters):
+            plan = [row[3] for row in db.session.connection().exec_driver_sql(
+                "EXPLAIN QUERY PLAN " + statement, parameters
+            )]
+            scans = find_table_scans(plan, keyset_page=method in KEYSET_PAGES)
+            label = f"{method}({', '.join(f'{k}={v!r}' for k, v in kwargs.items())})"
+            if scans:
+                failures += 1
+                click.echo(f"FAIL {label}: {'; '.join(scans)}")
+                click.echo(f"     {' '.join(statement.split())}")
+            else:
+                click.echo(f"ok   {label}: {'; '.join(plan)}")
+
+    if failures:
+        raise click.ClickException(f"{failures} quer{'y' if failures == 1 else 'ies'} use a full table scan or sort.")
+    click.echo("All data manager queries use indexes.")
@@ -0,0 +1,11 @@
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+
+
+@click.command("rebuild-rating-stats")
+@with_appcontext
+def rebuild_rating_stats():
+    """Recompute the per-title rating aggregates from the reviews table."""
+    count = current_app.data_manager.rebuild_title_stats()
+    click.echo(f"Rebuilt rating stats for {count} film{'' if count == 1 else 's'}.")
@@ -0,0 +1,15 @@
+import click
+from flask.cli import with_appcontext
+from models.app_models import db
+from datamanager.search import create_search_index
+
+
+@click.command("rebuild-search-index")
+@with_appcontext
+def rebuild_search_index():
+    """Recreate any missing FTS5 tables or triggers and re-index every movie and review (SQLite only)."""
+    if db.engine.dialect.name != "sqlite":
+        raise click.ClickException("The full-text search index is only supported on SQLite.")
+    with db.engine.begin() as connection:
+        create_search_index(connection, rebuild=True)
+    click.echo("Search index rebuilt.")
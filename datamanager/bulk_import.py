@@ -0,0 +1,96 @@
+import asyncio
+import csv
+import io
+import json
+from typing import List
+from datamanager.utils import lookup_movie_details_async, OMDbError
+
+MAX_IMPORT_ROWS = 1000
+# Imports queue behind the OMDb rate limit instead of failing fast like interactive lookups
+IMPORT_RATE_MAX_WAIT = 60.0
+
+
+def parse_titles(text: str, filename: str = "") -> List[str]:
+    """
+    Read movie titles from an uploaded CSV or JSON document.
+    CSV files use a "title" column if there is a header with one, otherwise
+    the first column. JSON files hold a list of titles or of objects with a
+    "title" key.
+    Args:
+        text (str): File contents.
+        filename (str): Original file name, used to tell JSON from CSV.
+    Raises:
+        ValueError: If the document cannot be parsed or has too many rows.
+    Returns:
+        List[str]: Non-empty titles in file order.
+    """
+    if filename.lower().endswith(".json") or text.lstrip().startswith(("[", "{")):
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON: {e}")
+        if isinstance(data, dict):
+            data = data.get("movies", [])
+        if not isinstance(data, list):
+            raise ValueError("JSON must be a list of titles or of objects with a \"title\".")
+        titles = [item.get("title", "") if isinstance(item, dict) else str(item) for item in data]
+    else:
+        rows = list(csv.reader(io.StringIO(text)))
+        column = 0
+        if rows and "title" in [cell.strip().lower() for cell in rows[0]]:
+            column = [cell.strip().lower() for cell in rows[0]].index("title")
+            rows = rows[1:]
+        titles = [row[column] if len(row) > column else "" for row in rows]
+
+    titles = [" ".join(title.split()) for title in titles if title and title.strip()]
+    if len(titles) > MAX_IMPORT_ROWS:
+        raise ValueError(f"Imports are limited to {MAX_IMPORT_ROWS} titles at a time.")
+    return titles
+
+
+def resolve_titles(titles: List[str], max_workers: int = 8) -> List[dict]:
+    """
+    Look up many titles on OMDb concurrently through the shared asyncio client.
+    Args:
+        titles (List[str]): Titles to look up.
+        max_workers (int): Maximum number of concurrent OMDb requests.
+    Returns:
+        List[dict]: One outcome per title, in order, with "title", "status"
+        ("found", "not_found" or "error") and "details" or "error".
+    """
+    async def resolve(title, slots):
+        async with slots:
+            try:
+                details = await lookup_movie_details_async(title, max_wait=IMPORT_RATE_MAX_WAIT)
+            except OMDbError as e:
+                return {"title": title, "status": "error", "error": str(e)}
+        if details is None:
+            return {"title": title, "status": "not_found"}
+        return {"title": title, "status": "found", "details": details}
+
+    async def resolve_all():
+        slots = asyncio.Semaphore(max(1, max_workers))
+        return await asyncio.gather(*(resolve(title, slots) for title in titles))
+
+    return asyncio.run(resolve_all())
+
+
+def import_movies(data_manager, user_id: int, titles: List[str], max_workers: int = 8) -> List[dict]:
+    """
+    Resolve titles on OMDb and add the ones found to a user's list in one transaction.
+    Args:
+        data_manager (DataManagerInterface): Data manager to write through.
+        user_id (int): User ID.
+        titles (List[str]): Titles to import.
+        max_workers (int): Maximum number of concurrent OMDb requests.
+    Returns:
+        List[dict]: One outcome per title with "title", "status" ("added",
+        "duplicate", "not_found" or "error") and "name" when the film was found.
+    """
+    outcomes = resolve_titles(titles, max_workers)
+    found = [outcome for outcome in outcomes if outcome["status"] == "found"]
+    statuses = data_manager.add_movies_bulk(user_id, [outcome["details"] for outcome in found])
+    for outcome, status in zip(found, statuses):
+        outcome["status"] = status
+        outcome["name"] = outcome.pop("details")["name"]
+    return outcomes
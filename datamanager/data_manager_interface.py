@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 class DataManagerInterface(ABC):
     """
@@ -8,11 +9,13 @@ class DataManagerInterface(ABC):
     within the application, including adding, retrieving, updating, and deleting
     records. Concrete data manager classes must implement all these methods to
     ensure consistent behavior across different data backends.
+    List methods use keyset pagination: pass the ID of the last item of the
+    previous page as after_id rather than an offset, so every page costs the same.
     Methods to implement:
-        - get_all_users()
+        - get_all_users(after_id, limit)
         - get_user_by_id(user_id)
         - add_user(name)
-        - get_user_movies(user_id)
+        - get_user_movies(user_id, after_id, limit)
         - get_movie_by_id(movie_id)
         - add_movie(user_id, **movie_data)
         - update_movie(movie_id, **movie_data)
@@ -21,6 +24,11 @@ class DataManagerInterface(ABC):
         -etc.
     """
 
+    @abstractmethod
+    def unit_of_work(self):
+        """Context manager running the writes made inside it in one transaction, committed when it exits."""
+        pass
+
     @abstractmethod
     def add_user(self, name: str, email: str):
         """Add a new user and return the created user object."""
@@ -37,13 +45,33 @@ class DataManagerInterface(ABC):
         pass
 
     @abstractmethod
-    def get_all_users(self) -> List:
-        """Return a list of all users."""
+    def get_all_users(self, after_id: Optional[int] = None, limit: Optional[int] = None) -> List:
+        """Return users ordered by ID, starting after after_id and capped at limit if given."""
+        pass
+
+    @abstractmethod
+    def get_user_movies(self, user_id: int, after_id: Optional[int] = None, limit: Optional[int] = None,
+                        fields: Optional[Iterable[str]] = None) -> List:
+        """Return movies associated with a user ordered by ID, starting after after_id and capped at limit if given.
+        With fields, only the columns behind those fields are loaded."""
         pass
 
     @abstractmethod
-    def get_user_movies(self, user_id: int) -> List:
-        """Return all movies associated with a user."""
+    def get_users_version(self, after_id: Optional[int] = None,
+                          limit: Optional[int] = None) -> Tuple[str, Optional[datetime]]:
+        """Return a version token and last-modified time for a page of get_all_users, without loading users."""
+        pass
+
+    @abstractmethod
+    def get_user_movies_version(self, user_id: int, after_id: Optional[int] = None,
+                                limit: Optional[int] = None) -> Tuple[str, Optional[datetime]]:
+        """Return a version token and last-modified time for a page of get_user_movies, without loading movies."""
+        pass
+
+    @abstractmethod
+    def get_reviews_version(self, movie_id: int, after_id: Optional[int] = None,
+                            limit: Optional[int] = None) -> Tuple[str, Optional[datetime]]:
+        """Return a version token and last-modified time for a review page of a movie, without loading reviews."""
         pass
 
     @abstractmethod
@@ -51,11 +79,52 @@ class DataManagerInterface(ABC):
         """Add a new movie for a user."""
         pass
 
+    @abstractmethod
+    def add_movies_bulk(self, user_id: int, movies_data: List[dict]) -> List[str]:
+        """Add many movies for a user in one transaction, returning "added" or "duplicate" per movie."""
+        pass
+
+    @abstractmethod
+    def add_pending_movie(self, user_id: int, title: str):
+        """Add a movie for a user by title only, queueing its details to be fetched in the background."""
+        pass
+
+    @abstractmethod
+    def get_catalog_titles(self) -> List[str]:
+        """Return the titles of all catalog films with known details, e.g. to build the autocomplete index."""
+        pass
+
+    @abstractmethod
+    def get_catalog_movie_by_id(self, catalog_movie_id: int):
+        """Retrieve a shared catalog entry by its ID."""
+        pass
+
+    @abstractmethod
+    def apply_movie_details(self, catalog_movie_id: int, details: Optional[dict]):
+        """Complete a pending catalog entry with fetched details, or mark it failed if details is None."""
+        pass
+
+    @abstractmethod
+    def get_catalog_ids_missing_posters(self) -> List[int]:
+        """Return the catalog films whose current poster has not been mirrored or attempted yet."""
+        pass
+
+    @abstractmethod
+    def set_poster_mirror(self, catalog_movie_id: int, source_url: str, key: Optional[str]) -> bool:
+        """Record the mirrored thumbnails (or a failed attempt) of a film's poster URL."""
+        pass
+
     @abstractmethod
     def get_movie_by_id(self, movie_id: int):
         """Retrieve a movie by its ID."""
         pass
 
+    @abstractmethod
+    def get_movies_by_ids(self, movie_ids: Iterable[int], fields: Optional[Iterable[str]] = None,
+                          user_id: Optional[int] = None) -> List:
+        """Return the movies with the given IDs (of user_id's list only, if given) in one query, loading only fields."""
+        pass
+
     @abstractmethod
     def update_movie(self, movie_id: int, **movie_data):
         """Update movie details."""
@@ -77,8 +146,50 @@ class DataManagerInterface(ABC):
         pass
 
     @abstractmethod
-    def get_reviews_for_movie(self, movie_id: int) -> List:
-        """Return all reviews for a given movie."""
+    def get_reviews_for_movie(self, movie_id: int, after_id: Optional[int] = None,
+                              limit: Optional[int] = None) -> List:
+        """Return reviews for a given movie ordered by ID, starting after after_id and capped at limit if given."""
+        pass
+
+    @abstractmethod
+    def get_reviews_for_movies(self, movie_ids: Iterable[int], limit_per_movie: int = 20,
+                               fields: Optional[Iterable[str]] = None) -> Dict[int, List]:
+        """Return up to limit_per_movie reviews for each of many movies in one query, keyed by movie ID."""
+        pass
+
+    @abstractmethod
+    def get_title_stats(self, catalog_movie_id: int):
+        """Return the maintained rating aggregates of a catalog film, or None if it has no reviews."""
+        pass
+
+    @abstractmethod
+    def get_top_rated(self, limit: int = 10, min_ratings: int = 1) -> List:
+        """Return the rating aggregates of the best rated films, highest average first."""
+        pass
+
+    @abstractmethod
+    def rebuild_title_stats(self) -> int:
+        """Recompute every film's rating aggregates from the reviews, returning the number of films."""
+        pass
+
+    @abstractmethod
+    def search(self, query: str, kind: str = "movies", limit: int = 20, offset: int = 0) -> List:
+        """Return ranked full-text matches of query among catalog films ("movies") or reviews ("reviews")."""
+        pass
+
+    @abstractmethod
+    def export_user_movies(self, user_id: int) -> Tuple[List[str], Iterator[tuple]]:
+        """Stream a user's list entries as (column names, rows) without loading them all at once."""
+        pass
+
+    @abstractmethod
+    def export_user_reviews(self, user_id: int) -> Tuple[List[str], Iterator[tuple]]:
+        """Stream the reviews a user wrote as (column names, rows) without loading them all at once."""
+        pass
+
+    @abstractmethod
+    def export_table(self, table_name: str) -> Tuple[List[str], Iterator[tuple]]:
+        """Stream every row of a database table as (column names, rows) without loading them all at once."""
         pass
 
     @abstractmethod
@@ -0,0 +1,97 @@
+import os
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+
+# PRAGMAs applied to every new SQLite connection, overridable through SQLITE_<NAME> variables
+SQLITE_PRAGMA_DEFAULTS = {
+    "journal_mode": "WAL",          # readers no longer block the writer (and vice versa)
+    "synchronous": "NORMAL",        # fsync at checkpoints only; safe with WAL
+    "busy_timeout": "5000",         # wait up to 5 s for a lock instead of failing with "database is locked"
+    "mmap_size": "268435456",       # read the first 256 MB through the page cache via mmap
+    "cache_size": "-65536",         # 64 MB page cache per connection (negative = KiB)
+    "foreign_keys": "ON",
+}
+
+# Pool options for server databases, overridable through DB_<NAME> variables
+POOL_DEFAULTS = {
+    "pool_size": 10,
+    "max_overflow": 20,
+    "pool_timeout": 30,
+    "pool_recycle": 1800,
+}
+
+
+def is_sqlite(database_uri) -> bool:
+    """Return True if the SQLAlchemy URI (string or URL) points at a SQLite database."""
+    return make_url(database_uri).get_backend_name() == "sqlite"
+
+
+def get_sqlite_pragmas() -> dict:
+    """Return the SQLite PRAGMAs to apply, with environment overrides."""
+    return {
+        name: os.getenv(f"SQLITE_{name.upper()}", default)
+        for name, default in SQLITE_PRAGMA_DEFAULTS.items()
+    }
+
+
+def get_engine_options(database_uri: str) -> dict:
+    """
+    Build SQLALCHEMY_ENGINE_OPTIONS for the configured database.
+    Args:
+        database_uri (str): SQLAlchemy database URI.
+    Returns:
+        dict: Engine options; sized connection pool settings for server
+        databases, and a matching driver-level lock timeout for SQLite.
+    """
+    if is_sqlite(database_uri):
+        busy_timeout_ms = int(get_sqlite_pragmas()["busy_timeout"])
+        return {"connect_args": {"timeout": busy_timeout_ms / 1000}}
+
+    options = {
+        name: int(os.getenv(f"DB_{name.upper()}", default))
+        for name, default in POOL_DEFAULTS.items()
+    }
+    options["pool_pre_ping"] = True
+    return options
+
+
+def apply_sqlite_pragmas(engine, pragmas: dict) -> None:
+    """
+    Register a connect hook running the PRAGMAs on every new connection of engine.
+    Args:
+        engine (Engine): SQLAlchemy engine bound to a SQLite database.
+        pragmas (dict): PRAGMA names and values.
+    """
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+def configure_engine(app, engine) -> dict:
+    """
+    Apply the tuning profile to the application's engine and log the effective settings.
+    Args:
+        app (Flask): The Flask application instance.
+        engine (Engine): The application's SQLAlchemy engine.
+    Returns:
+        dict: Effective settings, as read back from the database or pool.
+    """
+    if engine.dialect.name == "sqlite":
+        pragmas = get_sqlite_pragmas()
+        apply_sqlite_pragmas(engine, pragmas)
+        with engine.connect() as connection:
+            effective = {
+                name: connection.exec_driver_sql(f"PRAGMA {name}").scalar()
+                for name in pragmas
+            }
+    else:
+        effective = {"pool": engine.pool.status()}
+
+    app.config["DATABASE_ENGINE_PROFILE"] = effective
+    app.logger.info(f"Database engine profile ({engine.dialect.name}): {effective}")
+    return effective
@@ -0,0 +1,34 @@
+from flask import current_app
+from datamanager.utils import lookup_movie_details
+
+ENRICH_MOVIE = "enrich_movie"
+
+
+def enrich_movie(catalog_movie_id: int) -> None:
+    """
+    Fill in a pending catalog entry from OMDb.
+    OMDb errors propagate so the job queue retries with backoff; a definite
+    "not found" answer marks the entry as failed straight away.
+    Args:
+        catalog_movie_id (int): ID of the pending catalog entry.
+    """
+    data_manager = current_app.data_manager
+    catalog_movie = data_manager.get_catalog_movie_by_id(catalog_movie_id)
+    if catalog_movie is None or catalog_movie.status != "pending":
+        return
+    details = lookup_movie_details(catalog_movie.name)
+    data_manager.apply_movie_details(catalog_movie_id, details)
+
+
+def give_up_enrichment(catalog_movie_id: int) -> None:
+    """Mark a catalog entry as failed once every enrichment attempt failed."""
+    current_app.data_manager.apply_movie_details(catalog_movie_id, None)
+
+
+def register_enrichment_jobs(worker) -> None:
+    """
+    Register the movie enrichment handler on a job worker.
+    Args:
+        worker (JobWorker): The worker pool.
+    """
+    worker.register(ENRICH_MOVIE, enrich_movie, on_give_up=give_up_enrichment)
@@ -0,0 +1,83 @@
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Iterable, Iterator, List, Sequence
+
+EXPORT_FORMATS = ("csv", "json")
+EXPORT_MIMETYPES = {"csv": "text/csv", "json": "application/json"}
+
+# Rows fetched from the database per round trip, and rows written per chunk of output
+EXPORT_BATCH_SIZE = 1000
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def stream_csv(columns: Sequence[str], rows: Iterable[Sequence], chunk_rows: int = EXPORT_BATCH_SIZE) -> Iterator[str]:
+    """
+    Encode rows as CSV, one chunk of text at a time.
+    Args:
+        columns (Sequence[str]): Header row.
+        rows (Iterable[Sequence]): Row values, in column order; consumed lazily.
+        chunk_rows (int): Rows per yielded chunk.
+    Returns:
+        Iterator[str]: CSV text; only one chunk is held in memory.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    pending = 1
+    for row in rows:
+        writer.writerow(value.isoformat() if isinstance(value, datetime) else value for value in row)
+        pending += 1
+        if pending >= chunk_rows:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    if pending:
+        yield buffer.getvalue()
+
+
+def stream_json(columns: Sequence[str], rows: Iterable[Sequence], chunk_rows: int = EXPORT_BATCH_SIZE) -> Iterator[str]:
+    """
+    Encode rows as a JSON array of objects, one chunk of text at a time.
+    Args:
+        columns (Sequence[str]): Object keys.
+        rows (Iterable[Sequence]): Row values, in column order; consumed lazily.
+        chunk_rows (int): Rows per yielded chunk.
+    Returns:
+        Iterator[str]: JSON text; only one chunk is held in memory.
+    """
+    chunk, separator = ["["], "\n"
+    for row in rows:
+        chunk.append(separator + json.dumps(dict(zip(columns, row)), default=_json_default))
+        separator = ",\n"
+        if len(chunk) >= chunk_rows:
+            yield "".join(chunk)
+            chunk = []
+    chunk.append("\n]\n")
+    yield "".join(chunk)
+
+
+def stream_export(export_format: str, columns: List[str], rows: Iterable[Sequence]) -> Iterator[str]:
+    """
+    Encode rows in one of EXPORT_FORMATS.
+    Args:
+        export_format (str): "csv" or "json".
+        columns (List[str]): Column names.
+        rows (Iterable[Sequence]): Row values, in column order.
+    Raises:
+        ValueError: If the format is not supported.
+    Returns:
+        Iterator[str]: Encoded text chunks.
+    """
+    if export_format == "csv":
+        return stream_csv(columns, rows)
+    if export_format == "json":
+        return stream_json(columns, rows)
+    raise ValueError(f"Unsupported export format: {export_format}. Use one of: {', '.join(EXPORT_FORMATS)}.")
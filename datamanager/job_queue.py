@@ -0,0 +1,187 @@
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+from sqlalchemy import update, delete, or_, and_
+from models.app_models import db, Job
+from datamanager.replica_routing import primary
+
+
+def enqueue_job(kind: str, target_id: int) -> Job:
+    """
+    Queue a background job. The job is added to the current session and is
+    committed together with the caller's own changes.
+    Args:
+        kind (str): Name of the registered handler.
+        target_id (int): ID of the row the job works on.
+    Returns:
+        Job: The queued (uncommitted) Job object.
+    """
+    job = Job(kind=kind, target_id=target_id, status="queued", attempts=0, run_after=datetime.utcnow())
+    db.session.add(job)
+    return job
+
+
+class JobWorker:
+    """Pool of threads running jobs queued in the jobs table.
+    Jobs are claimed with a conditional UPDATE, so several threads and several
+    worker processes can share one table. A claimed job holds a lease; if the
+    process dies mid-job the lease expires and another worker picks it up.
+    Failed jobs are retried with exponential backoff up to max_attempts.
+    Done jobs are deleted once they are older than the retention window;
+    failed ones are kept for inspection.
+    """
+
+    def __init__(self, app, threads: int = 2, poll_interval: float = 1.0, max_attempts: int = 5,
+                 backoff: float = 2.0, lease: float = 300.0, retention: float = 7 * 24 * 3600):
+        """
+        Args:
+            app (Flask): Application whose context the jobs run in.
+            threads (int): Number of worker threads.
+            poll_interval (float): Seconds to sleep when no job is ready.
+            max_attempts (int): Attempts before a job is marked failed.
+            backoff (float): Delay in seconds before the first retry, doubled on each further attempt.
+            lease (float): Seconds a running job may take before it is considered abandoned.
+            retention (float): Seconds after being queued that a done job is deleted.
+        """
+        self.app = app
+        self.threads = threads
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.lease = lease
+        self.retention = retention
+        self.handlers = {}
+        self._stop = threading.Event()
+        self._threads = []
+        self._prune_lock = threading.Lock()
+        self._next_prune = 0.0
+
+    def register(self, kind: str, handler, on_give_up=None) -> None:
+        """
+        Register the handler for a kind of job.
+        Args:
+            kind (str): Job kind.
+            handler (callable): Called with the job's target_id; raising schedules a retry.
+            on_give_up (callable): Optional, called with the target_id once all attempts failed.
+        """
+        self.handlers[kind] = (handler, on_give_up)
+
+    def start(self) -> None:
+        """Start the worker threads."""
+        for i in range(self.threads):
+            thread = threading.Thread(target=self._loop, name=f"job-worker-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Ask the worker threads to finish their current job and exit."""
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def run_once(self) -> bool:
+        """
+        Claim and run a single ready job in the current thread.
+        Returns:
+            bool: True if a job was run, False if none was ready.
+        """
+        # Jobs act on rows that may have just been written: never read them from a replica
+        with self.app.app_context(), primary():
+            job_id = self._claim()
+            if job_id is None:
+                return False
+            self._run(job_id)
+            return True
+
+    def prune(self) -> int:
+        """
+        Delete the done jobs queued more than retention seconds ago.
+        Returns:
+            int: Number of jobs deleted.
+        """
+        cutoff = datetime.utcnow() - timedelta(seconds=self.retention)
+        with self.app.app_context(), primary():
+            deleted = db.session.execute(
+                delete(Job).where(Job.status == "done", Job.created_at < cutoff)
+            ).rowcount
+            db.session.commit()
+        return deleted
+
+    def _maybe_prune(self) -> None:
+        # One thread prunes, at most every hour (or retention, if shorter)
+        if time.monotonic() < self._next_prune or not self._prune_lock.acquire(blocking=False):
+            return
+        try:
+            self._next_prune = time.monotonic() + min(self.retention, 3600)
+            deleted = self.prune()
+            if deleted:
+                self.app.logger.info(f"Pruned {deleted} done jobs")
+        finally:
+            self._prune_lock.release()
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                ran = self.run_once()
+                if not ran:
+                    self._maybe_prune()
+            except Exception as e:
+                self.app.logger.error(f"Job worker error: {e}")
+                ran = False
+            if not ran:
+                self._stop.wait(self.poll_interval)
+
+    def _claim(self) -> Optional[int]:
+        now = datetime.utcnow()
+        ready = or_(
+            and_(Job.status == "queued", Job.run_after <= now),
+            and_(Job.status == "running", Job.run_after <= now),  # abandoned lease
+        )
+        job_id = (
+            db.session.query(Job.id)
+            .filter(ready, Job.kind.in_(list(self.handlers)))
+            .order_by(Job.run_after, Job.id)
+            .limit(1)
+            .scalar()
+        )
+        if job_id is None:
+            db.session.rollback()
+            return None
+
+        claimed = db.session.execute(
+            update(Job)
+            .where(Job.id == job_id, ready)
+            .values(status="running", attempts=Job.attempts + 1,
+                    run_after=now + timedelta(seconds=self.lease))
+        ).rowcount
+        db.session.commit()
+        # Another worker got there first
+        return job_id if claimed else None
+
+    def _run(self, job_id: int) -> None:
+        job = db.session.get(Job, job_id)
+        handler, on_give_up = self.handlers[job.kind]
+        target_id = job.target_id
+        try:
+            handler(target_id)
+        except Exception as e:
+            db.session.rollback()
+            job = db.session.get(Job, job_id)
+            job.last_error = f"{type(e).__name__}: {e}"
+            if job.attempts >= self.max_attempts:
+                job.status = "failed"
+            else:
+                job.status = "queued"
+                job.run_after = datetime.utcnow() + timedelta(seconds=self.backoff * 2 ** (job.attempts - 1))
+            db.session.commit()
+            self.app.logger.warning(f"Job {job_id} ({job.kind}) attempt {job.attempts} failed: {e}")
+            if job.status == "failed" and on_give_up:
+                on_give_up(target_id)
+            return
+
+        job = db.session.get(Job, job_id)
+        job.status = "done"
+        job.last_error = None
+        db.session.commit()
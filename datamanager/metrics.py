@@ -0,0 +1,170 @@
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from flask import g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Upper bounds (seconds) of the latency histogram buckets, Prometheus client defaults
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _format_labels(names, values) -> str:
+    if not names:
+        return ""
+    pairs = []
+    for name, value in zip(names, values):
+        value = str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        pairs.append(f'{name}="{value}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+class Counter:
+    """Monotonic counter with optional labels, kept in process memory."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labels=()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, *label_values) -> None:
+        """Add amount to the series identified by label_values."""
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def samples(self):
+        with self._lock:
+            return [(self.name, labels, value) for labels, value in sorted(self._values.items())]
+
+    def expose(self):
+        for name, labels, value in self.samples():
+            yield f"{name}{_format_labels(self.label_names, labels)} {value}"
+
+
+class Histogram:
+    """Cumulative histogram with optional labels, kept in process memory."""
+
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labels=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self.buckets = tuple(buckets)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values) -> None:
+        """Record one observation in the series identified by label_values."""
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                # Per-bucket counts (plus +Inf), running sum
+                series = self._series[label_values] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][bisect_left(self.buckets, value)] += 1
+            series[1] += value
+
+    def expose(self):
+        with self._lock:
+            series = sorted((labels, list(counts), total) for labels, (counts, total) in self._series.items())
+        names = self.label_names + ("le",)
+        for labels, counts, total in series:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                yield f"{self.name}_bucket{_format_labels(names, labels + (le,))} {cumulative}"
+            yield f"{self.name}_sum{_format_labels(self.label_names, labels)} {total}"
+            yield f"{self.name}_count{_format_labels(self.label_names, labels)} {cumulative}"
+
+
+class Registry:
+    """Ordered collection of metrics rendered together in the text exposition format."""
+
+    def __init__(self):
+        self.metrics = []
+
+    def register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def expose(self) -> str:
+        """Render every metric in the Prometheus text exposition format (version 0.0.4)."""
+        lines = []
+        for metric in self.metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type_name}")
+            lines.extend(metric.expose())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+REQUEST_DURATION = REGISTRY.register(Histogram(
+    "moviweb_request_duration_seconds", "Time spent handling a request.", labels=("endpoint", "method")))
+REQUESTS = REGISTRY.register(Counter(
+    "moviweb_requests_total", "Requests handled, by response status.", labels=("endpoint", "method", "status")))
+SQL_STATEMENTS = REGISTRY.register(Counter(
+    "moviweb_sql_statements_total", "SQL statements executed.", labels=("endpoint",)))
+SQL_DURATION = REGISTRY.register(Counter(
+    "moviweb_sql_duration_seconds_total", "Time spent executing SQL statements.", labels=("endpoint",)))
+SQL_PER_REQUEST = REGISTRY.register(Histogram(
+    "moviweb_sql_statements_per_request", "SQL statements executed per request.", labels=("endpoint",),
+    buckets=(0, 1, 2, 3, 5, 10, 25, 50, 100)))
+OMDB_DURATION = REGISTRY.register(Histogram(
+    "moviweb_omdb_request_duration_seconds", "Time spent waiting for OMDb.", labels=("outcome",)))
+OMDB_SKIPPED = REGISTRY.register(Counter(
+    "moviweb_omdb_lookups_skipped_total",
+    "OMDb lookups answered without a request of their own: coalesced with an identical lookup, "
+    "or refused by the rate limiter or the open circuit breaker.", labels=("reason",)))
+TEMPLATE_RENDER = REGISTRY.register(Histogram(
+    "moviweb_template_render_seconds", "Time spent rendering templates.", labels=("template",)))
+
+
+def current_endpoint() -> str:
+    """Return the endpoint label for the running code: the request endpoint, or "background"."""
+    if not has_request_context():
+        return "background"
+    return request.endpoint or "unmatched"
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_statement_timer(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("_metrics_started", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _record_statement_time(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get("_metrics_started")
+    if not started:
+        return
+    elapsed = time.perf_counter() - started.pop()
+    endpoint = current_endpoint()
+    SQL_STATEMENTS.inc(1, endpoint)
+    SQL_DURATION.inc(elapsed, endpoint)
+    if has_request_context():
+        g._metrics_sql_statements = g.get("_metrics_sql_statements", 0) + 1
+
+
+@event.listens_for(Engine, "handle_error")
+def _discard_statement_timer(exception_context):
+    started = exception_context.connection.info.get("_metrics_started") if exception_context.connection else None
+    if started:
+        started.pop()
+
+
+@contextmanager
+def observe_omdb_request():
+    """Time an OMDb HTTP call; the outcome label is "error" if the block raises."""
+    started = time.perf_counter()
+    outcome = "error"
+    try:
+        yield
+        outcome = "ok"
+    finally:
+        OMDB_DURATION.observe(time.perf_counter() - started, outcome)
@@ -0,0 +1,249 @@
+import csv
+import gzip
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+from typing import Callable, Iterable, Iterator, Optional, Tuple
+
+# File layout (little-endian):
+#   header   MAGIC, version, record count, position of the offset table
+#   records  per title: key length (u16), key (UTF-8), then the packed details
+#   offsets  one u64 record position per title, ordered by key bytes
+# A lookup is a binary search over the offset table comparing keys in place,
+# so only the handful of pages it touches are read from the mapped file.
+MAGIC = b"MWTI"
+VERSION = 1
+HEADER = struct.Struct("<4sHxxQQ")
+OFFSET = struct.Struct("<Q")
+KEY_LENGTH = struct.Struct("<H")
+# year (0 = unknown), rating x 10 (255 = unknown), then lengths of name, director, poster_url, imdb_id
+DETAILS = struct.Struct("<HBHHHH")
+STRING_FIELDS = ("name", "director", "poster_url", "imdb_id")
+
+# How often a process checks whether the index file was rebuilt
+RELOAD_CHECK_SECONDS = 30
+
+
+def pack_details(details: dict) -> bytes:
+    """Encode movie details (as returned by OMDbClient.parse_details) compactly."""
+    strings = [(details.get(field) or "").encode("utf-8")[:0xFFFF] for field in STRING_FIELDS]
+    rating = details.get("rating")
+    packed = DETAILS.pack(
+        details.get("year") or 0,
+        255 if rating is None else max(0, min(100, round(rating * 10))),
+        *(len(value) for value in strings),
+    )
+    return packed + b"".join(strings)
+
+
+def unpack_details(buffer, position: int) -> dict:
+    """Decode the details packed at position by pack_details."""
+    year, rating, *lengths = DETAILS.unpack_from(buffer, position)
+    position += DETAILS.size
+    details = {"year": year or None, "rating": None if rating == 255 else rating / 10}
+    for field, length in zip(STRING_FIELDS, lengths):
+        details[field] = bytes(buffer[position:position + length]).decode("utf-8") or None
+        position += length
+    return details
+
+
+def write_index(path: str, entries: Iterable[Tuple[str, dict]]) -> int:
+    """
+    Write an index file from (normalized title, details) pairs.
+    The file is written next to path and renamed over it, so processes
+    reading the previous version are never exposed to a partial file.
+    Args:
+        path (str): Index file to create or replace.
+        entries (Iterable[Tuple[str, dict]]): One entry per distinct key.
+    Returns:
+        int: Number of titles written.
+    """
+    encoded = sorted(((key.encode("utf-8")[:0xFFFF], details) for key, details in entries), key=lambda e: e[0])
+    temporary = f"{path}.tmp"
+    offsets = []
+    with open(temporary, "wb") as out:
+        out.write(b"\0" * HEADER.size)
+        for key, details in encoded:
+            offsets.append(out.tell())
+            out.write(KEY_LENGTH.pack(len(key)) + key + pack_details(details))
+        offsets_position = out.tell()
+        for offset in offsets:
+            out.write(OFFSET.pack(offset))
+        out.seek(0)
+        out.write(HEADER.pack(MAGIC, VERSION, len(offsets), offsets_position))
+    os.replace(temporary, path)
+    return len(offsets)
+
+
+def build_index(path: str, records: Iterable[Tuple[str, int, dict]], key_func: Callable[[str], str]) -> int:
+    """
+    Write an index from dump records, keeping the most popular title per key
+    (the one OMDb's title search answers with, e.g. "Heat" is the 1995 film).
+    Args:
+        path (str): Index file to create or replace.
+        records (Iterable[Tuple[str, int, dict]]): (title, popularity, details), e.g. from read_omdb_dump.
+        key_func (Callable[[str], str]): Title normalization used for lookups.
+    Returns:
+        int: Number of titles written.
+    """
+    best = {}
+    for title, popularity, details in records:
+        key = key_func(title)
+        if key and (key not in best or popularity > best[key][0]):
+            best[key] = (popularity, details)
+    return write_index(path, ((key, details) for key, (_, details) in best.items()))
+
+
+class OfflineTitleIndex:
+    """Read-only, memory-mapped index of movie details by normalized title.
+    Built by `flask build-title-index` from an OMDb or IMDb dump. Lookups need
+    no network and no parsing beyond the matched record; the mapping is shared
+    by every thread and, through the page cache, by every worker process.
+    A missing file simply means every lookup misses. A rebuilt file is picked
+    up within RELOAD_CHECK_SECONDS.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): Index file written by write_index.
+        """
+        self.path = path
+        # (mapping, record count, offset table position), swapped as a whole on reload
+        self._state = (None, 0, 0)
+        self._identity = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        self._refresh()
+        return self._state[1]
+
+    def _refresh(self) -> None:
+        now = time.monotonic()
+        if now - self._checked_at < RELOAD_CHECK_SECONDS and self._checked_at:
+            return
+        with self._lock:
+            self._checked_at = now
+            try:
+                stat = os.stat(self.path)
+            except OSError:
+                self._state, self._identity = (None, 0, 0), None
+                return
+            identity = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+            if identity == self._identity:
+                return
+            with open(self.path, "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, count, offsets_position = HEADER.unpack_from(mapped, 0)
+            if magic != MAGIC or version != VERSION:
+                mapped.close()
+                raise ValueError(f"{self.path} is not a version {VERSION} title index.")
+            # Readers holding the previous mapping keep it alive until they are done with it
+            self._state = (mapped, count, offsets_position)
+            self._identity = identity
+
+    def get(self, key: str) -> Optional[dict]:
+        """
+        Look up a normalized title.
+        Args:
+            key (str): Title normalized with datamanager.utils.normalize_title.
+        Returns:
+            dict or None: Movie details, or None if the title is not in the index.
+        """
+        self._refresh()
+        mapped, count, offsets_position = self._state
+        if mapped is None:
+            return None
+        target = key.encode("utf-8")[:0xFFFF]
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            position = OFFSET.unpack_from(mapped, offsets_position + middle * OFFSET.size)[0]
+            length = KEY_LENGTH.unpack_from(mapped, position)[0]
+            start = position + KEY_LENGTH.size
+            found = mapped[start:start + length]
+            if found == target:
+                return unpack_details(mapped, start + length)
+            if found < target:
+                low = middle + 1
+            else:
+                high = middle
+        return None
+
+
+def _open_text(path: str):
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8", newline="")
+    return open(path, "r", encoding="utf-8", newline="")
+
+
+def _votes(raw) -> int:
+    try:
+        return int(str(raw).replace(",", ""))
+    except (TypeError, ValueError):
+        return 0
+
+
+def read_omdb_dump(path: str, parse_details) -> Iterator[Tuple[str, int, dict]]:
+    """
+    Read a JSON Lines file of OMDb responses (one `?i=`/`?t=` answer per line).
+    Args:
+        path (str): Dump file, optionally gzip-compressed.
+        parse_details (Callable[[dict], Optional[dict]]): Turns a response into movie details.
+    Returns:
+        Iterator[Tuple[str, int, dict]]: (title, popularity, details) for every movie found.
+    """
+    with _open_text(path) as lines:
+        for line in lines:
+            if not line.strip():
+                continue
+            data = json.loads(line)
+            try:
+                details = parse_details(data)
+            except (ValueError, TypeError):
+                continue
+            if details and details["name"]:
+                yield details["name"], _votes(data.get("imdbVotes")), details
+
+
+def read_imdb_dump(path: str, ratings_path: Optional[str] = None) -> Iterator[Tuple[str, int, dict]]:
+    """
+    Read an IMDb title.basics TSV (movies only), with ratings from title.ratings if given.
+    The IMDb datasets have no director names or posters; those stay empty.
+    Args:
+        path (str): title.basics.tsv(.gz).
+        ratings_path (Optional[str]): title.ratings.tsv(.gz).
+    Returns:
+        Iterator[Tuple[str, int, dict]]: (title, popularity, details) per movie.
+    """
+    ratings = {}
+    if ratings_path:
+        with _open_text(ratings_path) as f:
+            for row in csv.DictReader(f, delimiter="\t", quoting=csv.QUOTE_NONE):
+                ratings[row["tconst"]] = (float(row["averageRating"]), _votes(row["numVotes"]))
+
+    with _open_text(path) as f:
+        for row in csv.DictReader(f, delimiter="\t", quoting=csv.QUOTE_NONE):
+            if row["titleType"] not in ("movie", "tvMovie") or row.get("isAdult") == "1":
+                continue
+            rating, votes = ratings.get(row["tconst"], (None, 0))
+            year = row["startYear"]
+            yield row["primaryTitle"], votes, {
+                "name": row["primaryTitle"],
+                "director": None,
+                "year": int(year) if year.isdigit() else None,
+                "rating": rating,
+                "poster_url": None,
+                "imdb_id": row["tconst"],
+            }
+
+
+def sniff_dump_format(path: str) -> str:
+    """Return "omdb" for a JSON Lines dump and "imdb" for a TSV one."""
+    with _open_text(path) as f:
+        first = f.readline()
+    return "omdb" if first.lstrip().startswith("{") else "imdb"
@@ -0,0 +1,209 @@
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Optional, Tuple
+
+# Sentinel stored for titles OMDb answered with "Response: False"
+NOT_FOUND = object()
+
+
+class OMDbCache:
+    """Two-tier cache for OMDb lookups.
+    The first tier is an in-process LRU dictionary, the second a small SQLite
+    table on disk that survives restarts and is shared by every worker process
+    on the box. Entries expire after a TTL; "not found" answers are cached too
+    (with their own, usually shorter, TTL) so repeated typos don't hit OMDb.
+    Expired rows are purged from disk every few hundred writes.
+    Attributes:
+        hits (int): Lookups answered from memory or disk.
+        misses (int): Lookups that had to go to OMDb.
+        evictions (int): Entries dropped from the in-memory LRU.
+    """
+
+    PURGE_EVERY = 256
+
+    def __init__(self, path: Optional[str] = None, max_entries: int = 1024,
+                 ttl: int = 7 * 24 * 3600, negative_ttl: int = 24 * 3600):
+        """
+        Args:
+            path (Optional[str]): SQLite file for the persistent tier, or None for memory only.
+            max_entries (int): Maximum number of entries kept in the in-memory LRU.
+            ttl (int): Lifetime in seconds of a cached movie.
+            negative_ttl (int): Lifetime in seconds of a cached "not found" answer.
+        """
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._writes = 0
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self.configure(path, max_entries=max_entries, ttl=ttl, negative_ttl=negative_ttl)
+
+    def configure(self, path: Optional[str], max_entries: int = 1024,
+                  ttl: int = 7 * 24 * 3600, negative_ttl: int = 24 * 3600) -> None:
+        """
+        (Re)configure the cache, e.g. from the application config in create_app.
+        The in-memory tier is emptied; the file is created if missing and its expired rows purged.
+        Args:
+            path (Optional[str]): SQLite file for the persistent tier, or None for memory only.
+            max_entries (int): Maximum number of entries kept in the in-memory LRU.
+            ttl (int): Lifetime in seconds of a cached movie.
+            negative_ttl (int): Lifetime in seconds of a cached "not found" answer.
+        """
+        with self._lock:
+            self.path = path
+            self.max_entries = max_entries
+            self.ttl = ttl
+            self.negative_ttl = negative_ttl
+            self._memory.clear()
+        if self.path:
+            with self._connect() as conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS omdb_cache ("
+                    " title_key TEXT PRIMARY KEY,"
+                    " payload TEXT,"
+                    " expires_at REAL NOT NULL)"
+                )
+            self.purge()
+
+    def purge(self) -> int:
+        """
+        Delete the expired rows of the persistent tier.
+        Returns:
+            int: Number of rows deleted.
+        """
+        if not self.path:
+            return 0
+        try:
+            with self._connect() as conn:
+                return conn.execute("DELETE FROM omdb_cache WHERE expires_at <= ?", (time.time(),)).rowcount
+        except sqlite3.Error as e:
+            print(f"Error purging OMDb cache: {e}")
+            return 0
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=5)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, key: str):
+        """
+        Look up a normalized title.
+        Args:
+            key (str): Normalized title.
+        Returns:
+            dict, NOT_FOUND or None: Cached details, the negative-cache sentinel,
+            or None when nothing (fresh) is cached.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._memory[key]
+
+        entry = self._load(key, now)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._remember(key, *entry)
+        return entry[0]
+
+    def set(self, key: str, details: Optional[dict]) -> None:
+        """
+        Store a lookup result.
+        Args:
+            key (str): Normalized title.
+            details (Optional[dict]): Movie details, or None for a "not found" answer.
+        """
+        value = NOT_FOUND if details is None else details
+        expires_at = time.time() + (self.negative_ttl if details is None else self.ttl)
+        with self._lock:
+            self._remember(key, value, expires_at)
+        if self.path:
+            self._writes += 1
+            try:
+                with self._connect() as conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO omdb_cache (title_key, payload, expires_at) VALUES (?, ?, ?)",
+                        (key, None if details is None else json.dumps(details), expires_at),
+                    )
+                    if self._writes % self.PURGE_EVERY == 0:
+                        conn.execute("DELETE FROM omdb_cache WHERE expires_at <= ?", (time.time(),))
+            except sqlite3.Error as e:
+                print(f"Error writing OMDb cache entry: {e}")
+
+    def iter_titles(self):
+        """
+        Yield the titles of every fresh cached movie ("not found" answers are skipped).
+        Titles in both tiers may be yielded twice.
+        Yields:
+            str: Movie title as returned by OMDb.
+        """
+        now = time.time()
+        with self._lock:
+            cached = [value for value, expires_at in self._memory.values() if expires_at > now]
+        for value in cached:
+            if value is not NOT_FOUND and value.get("name"):
+                yield value["name"]
+        if not self.path:
+            return
+        try:
+            with self._connect() as conn:
+                rows = conn.execute(
+                    "SELECT payload FROM omdb_cache WHERE payload IS NOT NULL AND expires_at > ?", (now,)
+                ).fetchall()
+        except sqlite3.Error as e:
+            print(f"Error reading OMDb cache titles: {e}")
+            return
+        for (payload,) in rows:
+            name = json.loads(payload).get("name")
+            if name:
+                yield name
+
+    def stats(self) -> dict:
+        """Return the hit/miss/eviction counters and the current LRU size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._memory),
+            }
+
+    def _remember(self, key: str, value, expires_at: float) -> None:
+        # Caller must hold self._lock
+        self._memory[key] = (value, expires_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    def _load(self, key: str, now: float) -> Optional[Tuple[object, float]]:
+        if not self.path:
+            return None
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT payload, expires_at FROM omdb_cache WHERE title_key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            print(f"Error reading OMDb cache entry: {e}")
+            return None
+        if row is None or row[1] <= now:
+            return None
+        payload, expires_at = row
+        return (NOT_FOUND if payload is None else json.loads(payload)), expires_at
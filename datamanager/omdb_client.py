@@ -0,0 +1,300 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional
+import requests
+from requests.adapters import HTTPAdapter
+from datamanager.metrics import observe_omdb_request, OMDB_SKIPPED
+
+
+def _flight_key(title: str) -> str:
+    # OMDb matches titles case-insensitively, so these lookups get the same answer
+    return " ".join(title.split()).casefold()
+
+
+class OMDbError(Exception):
+    """Raised when OMDb could not be reached or returned an invalid response."""
+
+
+class OMDbUnavailable(OMDbError):
+    """Raised without contacting OMDb while the circuit breaker is open or the rate limit is exhausted."""
+
+
+class TokenBucket:
+    """Token-bucket rate limiter shared by every thread and event loop of the process.
+    Tokens refill continuously at `rate` per second up to `capacity`, so short
+    bursts are allowed while the long-run rate never exceeds the API tier.
+    A caller that would have to wait longer than max_wait is refused instead
+    of being queued, so a web request never hangs behind a backlog.
+    """
+
+    def __init__(self, rate: float, capacity: int, max_wait: float = 2.0):
+        """
+        Args:
+            rate (float): Tokens added per second; 0 disables the limit.
+            capacity (int): Largest burst.
+            max_wait (float): Longest a caller may wait for a token, in seconds.
+        """
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self.max_wait = max_wait
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, max_wait: Optional[float] = None) -> Optional[float]:
+        """
+        Take a token, possibly one that is only available in the future.
+        Args:
+            max_wait (Optional[float]): Overrides the bucket's max_wait for this caller.
+        Returns:
+            Optional[float]: Seconds to wait before using it, or None if that
+            would exceed max_wait (no token is taken then).
+        """
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            wait = max(0.0, (1 - self._tokens) / self.rate)
+            if wait > (self.max_wait if max_wait is None else max_wait):
+                return None
+            self._tokens -= 1
+            return wait
+
+
+class CircuitBreaker:
+    """Stops calling OMDb for a while after repeated failures or slow answers.
+    Closed: calls go through. After failure_threshold consecutive failures
+    (errors, or answers slower than slow_call_seconds) the breaker opens and
+    calls fail fast for reset_timeout seconds. Then a single trial call is let
+    through (half-open); its outcome closes or re-opens the breaker.
+    """
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0, slow_call_seconds: float = 2.0):
+        """
+        Args:
+            failure_threshold (int): Consecutive failures that open the breaker.
+            reset_timeout (float): Seconds to stay open before a trial call.
+            slow_call_seconds (float): Answers slower than this count as failures.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.slow_call_seconds = slow_call_seconds
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Return True if a call may go to OMDb now."""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                return True
+            # Open, or half-open with the trial call still running
+            return False
+
+    def release(self) -> None:
+        """Give back a trial call that allow() granted but that was never made."""
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self.state = self.OPEN
+
+    def record(self, ok: bool, duration: float) -> None:
+        """
+        Report the outcome of a call that allow() let through.
+        Args:
+            ok (bool): The call returned a valid answer.
+            duration (float): How long it took, in seconds.
+        """
+        with self._lock:
+            if ok and duration <= self.slow_call_seconds:
+                self.state = self.CLOSED
+                self._failures = 0
+                return
+            self._failures += 1
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
+
+class OMDbClient:
+    """Process-wide OMDb client.
+    Requests go through one requests.Session whose connection pool keeps
+    connections to OMDb alive between lookups. Concurrent lookups of the same
+    title are coalesced into one request (single flight), every request takes
+    a token from the rate limiter, and the circuit breaker fails lookups fast
+    while OMDb is down or slow. lookup() blocks; lookup_async() awaits the same
+    machinery from asyncio code, running the HTTP call on the client's own
+    thread pool, so both interfaces share coalescing, limits and connections.
+    Caching is left to the caller (see datamanager.utils.lookup_movie_details).
+    """
+
+    def __init__(self, api_key: Optional[str], url: str, rate_limiter: TokenBucket,
+                 circuit_breaker: CircuitBreaker, max_connections: int = 8, timeout: float = 5.0):
+        """
+        Args:
+            api_key (Optional[str]): OMDb API key.
+            url (str): OMDb endpoint.
+            rate_limiter (TokenBucket): Limits the outgoing request rate.
+            circuit_breaker (CircuitBreaker): Stops requests while OMDb misbehaves.
+            max_connections (int): Keep-alive connections (and async worker threads).
+            timeout (float): Read timeout per request, in seconds.
+        """
+        self.api_key = api_key
+        self.url = url
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_connections)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._executor = ThreadPoolExecutor(max_workers=max_connections, thread_name_prefix="omdb")
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def parse_details(data: dict) -> Optional[dict]:
+        """
+        Turn an OMDb response document into the movie details used by the app.
+        Args:
+            data (dict): Decoded OMDb JSON.
+        Returns:
+            dict or None: Movie details, or None if OMDb has no such movie.
+        """
+        if data.get("Response") == "False":
+            return None
+
+        # Extract year (handle ranges)
+        year_raw = data.get("Year")
+        year = None
+        if year_raw:
+            year = int(year_raw.split("–")[0])
+
+        # Extract rating safely
+        rating_raw = data.get("imdbRating")
+        try:
+            rating = float(rating_raw) if rating_raw and rating_raw != "N/A" else None
+        except (ValueError, TypeError):
+            rating = None
+
+        return {
+            "name": data.get("Title"),
+            "director": data.get("Director"),
+            "year": year,
+            "rating": rating,
+            "poster_url": data.get("Poster"),
+            "imdb_id": data.get("imdbID")
+        }
+
+    def _join(self, key: str):
+        """Return (future, leader): leader is True if this caller must make the request for key."""
+        with self._lock:
+            future = self._in_flight.get(key)
+            if future is not None:
+                OMDB_SKIPPED.inc(1, "coalesced")
+                return future, False
+            future = self._in_flight[key] = Future()
+            return future, True
+
+    def _finish(self, key: str, future: Future, result=None, error: Optional[BaseException] = None) -> None:
+        """Hand the leader's outcome to the callers waiting on key."""
+        with self._lock:
+            self._in_flight.pop(key, None)
+        if error is None:
+            future.set_result(result)
+        else:
+            # A cancelled leader must not cancel its followers: they get an ordinary lookup error
+            future.set_exception(error if isinstance(error, Exception) else OMDbError("Lookup was cancelled."))
+
+    def _admit(self, max_wait: Optional[float]) -> float:
+        """Check the breaker and take a rate-limit token; return the seconds to wait before sending."""
+        if not self.api_key:
+            raise ValueError("OMDB_API_KEY is not set in environment variables.")
+        if not self.circuit_breaker.allow():
+            OMDB_SKIPPED.inc(1, "circuit_open")
+            raise OMDbUnavailable("OMDb is failing or slow; lookups are paused for a while.")
+        wait = self.rate_limiter.reserve(max_wait)
+        if wait is None:
+            self.circuit_breaker.release()
+            OMDB_SKIPPED.inc(1, "rate_limited")
+            raise OMDbUnavailable("OMDb rate limit reached; try again shortly.")
+        return wait
+
+    def _request(self, title: str) -> Optional[dict]:
+        """Send one request over the pooled session (the caller has been admitted)."""
+        started = time.monotonic()
+        ok = False
+        try:
+            with observe_omdb_request():
+                response = self.session.get(self.url, params={"t": title, "apikey": self.api_key},
+                                            timeout=(3.05, self.timeout))
+                response.raise_for_status()
+                data = response.json()
+            ok = True
+        except (requests.RequestException, ValueError) as e:
+            raise OMDbError(str(e)) from e
+        finally:
+            self.circuit_breaker.record(ok, time.monotonic() - started)
+        return self.parse_details(data)
+
+    def lookup(self, title: str, max_wait: Optional[float] = None) -> Optional[dict]:
+        """
+        Look up a title on OMDb, blocking until the answer arrives.
+        Args:
+            title (str): The movie title to search for.
+            max_wait (Optional[float]): Longest wait for a rate-limit token (default: the limiter's).
+        Returns:
+            dict or None: Movie details, or None if OMDb has no such movie.
+        Raises:
+            OMDbError: If the request failed, or OMDbUnavailable if it was not sent.
+        """
+        key = _flight_key(title)
+        future, leader = self._join(key)
+        if not leader:
+            return future.result()
+        try:
+            wait = self._admit(max_wait)
+            if wait:
+                time.sleep(wait)
+            result = self._request(title)
+        except BaseException as e:
+            self._finish(key, future, error=e)
+            raise
+        self._finish(key, future, result)
+        return result
+
+    async def lookup_async(self, title: str, max_wait: Optional[float] = None) -> Optional[dict]:
+        """
+        Look up a title on OMDb from asyncio code without blocking the event loop.
+        Coalesces with concurrent lookup() and lookup_async() calls for the same title.
+        Args:
+            title (str): The movie title to search for.
+            max_wait (Optional[float]): Longest wait for a rate-limit token (default: the limiter's).
+        Returns:
+            dict or None: Movie details, or None if OMDb has no such movie.
+        Raises:
+            OMDbError: If the request failed, or OMDbUnavailable if it was not sent.
+        """
+        key = _flight_key(title)
+        future, leader = self._join(key)
+        if not leader:
+            return await asyncio.wrap_future(future)
+        try:
+            wait = self._admit(max_wait)
+            if wait:
+                await asyncio.sleep(wait)
+            result = await asyncio.get_running_loop().run_in_executor(self._executor, self._request, title)
+        except BaseException as e:
+            self._finish(key, future, error=e)
+            raise
+        self._finish(key, future, result)
+        return result
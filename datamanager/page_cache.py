@@ -0,0 +1,180 @@
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
+from typing import Optional, List
+
+PAGE_CACHE_BACKENDS = ("memory", "sqlite", "none")
+
+
+class MemoryPageCache:
+    """In-process cache for rendered page fragments.
+    Entries live in an LRU dictionary. Alongside them the cache keeps a version
+    counter per scope ("users", "user:<id>", "movie:<id>"); the data manager
+    bumps the scopes a write touches, and callers build their keys from the
+    current versions, so stale fragments are simply never looked up again.
+    Only suitable for a single process: other workers, and CLI commands
+    changing the database, do not bump its versions. Fragments also expire
+    after a TTL, which bounds how long such a change can go unseen.
+    """
+
+    def __init__(self, max_entries: int = 512, ttl: int = 3600):
+        """
+        Args:
+            max_entries (int): Maximum number of fragments kept.
+            ttl (int): Lifetime in seconds of a cached fragment.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # key -> (expires_at, fragment)
+        self._entries = OrderedDict()
+        self._versions = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached fragment for key, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, value: str) -> None:
+        """Store a fragment for ttl seconds, evicting the least recently used ones beyond max_entries."""
+        with self._lock:
+            self._entries[key] = (time.time() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def versions(self, scopes: List[str]) -> List[int]:
+        """Return the current version of each scope, in order."""
+        with self._lock:
+            return [self._versions[scope] for scope in scopes]
+
+    def bump(self, *scopes: str) -> None:
+        """Invalidate every fragment built from any of the scopes."""
+        with self._lock:
+            for scope in scopes:
+                self._versions[scope] += 1
+
+
+class SQLitePageCache:
+    """Page fragment cache stored in a SQLite file.
+    Fragments and scope versions live in the same file, so every worker
+    process on the box serves the same fragments and sees the same bumps.
+    Fragments expire after a TTL; expired rows are purged every few hundred writes.
+    """
+
+    PURGE_EVERY = 256
+
+    def __init__(self, path: str, ttl: int = 3600):
+        """
+        Args:
+            path (str): SQLite file holding the cache.
+            ttl (int): Lifetime in seconds of a cached fragment.
+        """
+        self.path = path
+        self.ttl = ttl
+        self._writes = 0
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS page_cache ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " expires_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS page_cache_versions ("
+                " scope TEXT PRIMARY KEY,"
+                " version INTEGER NOT NULL)"
+            )
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=5)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached fragment for key, or None."""
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT value FROM page_cache WHERE key = ? AND expires_at > ?", (key, time.time())
+                ).fetchone()
+        except sqlite3.Error as e:
+            print(f"Error reading page cache entry: {e}")
+            return None
+        return row[0] if row else None
+
+    def set(self, key: str, value: str) -> None:
+        """Store a fragment for ttl seconds."""
+        now = time.time()
+        self._writes += 1
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO page_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, value, now + self.ttl),
+                )
+                if self._writes % self.PURGE_EVERY == 0:
+                    conn.execute("DELETE FROM page_cache WHERE expires_at <= ?", (now,))
+        except sqlite3.Error as e:
+            print(f"Error writing page cache entry: {e}")
+
+    def versions(self, scopes: List[str]) -> List[int]:
+        """Return the current version of each scope, in order."""
+        try:
+            with self._connect() as conn:
+                rows = dict(conn.execute(
+                    f"SELECT scope, version FROM page_cache_versions WHERE scope IN ({','.join('?' * len(scopes))})",
+                    scopes,
+                ).fetchall())
+        except sqlite3.Error as e:
+            print(f"Error reading page cache versions: {e}")
+            # Unknown versions: use a key nothing was stored under
+            return [-1] * len(scopes)
+        return [rows.get(scope, 0) for scope in scopes]
+
+    def bump(self, *scopes: str) -> None:
+        """Invalidate every fragment built from any of the scopes."""
+        if not scopes:
+            return
+        try:
+            with self._connect() as conn:
+                conn.executemany(
+                    "INSERT INTO page_cache_versions (scope, version) VALUES (?, 1)"
+                    " ON CONFLICT(scope) DO UPDATE SET version = version + 1",
+                    [(scope,) for scope in scopes],
+                )
+        except sqlite3.Error as e:
+            print(f"Error bumping page cache versions: {e}")
+
+
+def create_page_cache(backend: str, path: Optional[str] = None, max_entries: int = 512, ttl: int = 3600):
+    """
+    Build the configured page cache.
+    Args:
+        backend (str): "memory", "sqlite" or "none".
+        path (Optional[str]): SQLite file for the "sqlite" backend.
+        max_entries (int): LRU size for the "memory" backend.
+        ttl (int): Fragment lifetime in seconds.
+    Returns:
+        MemoryPageCache, SQLitePageCache or None: The cache, or None when caching is off.
+    """
+    if backend not in PAGE_CACHE_BACKENDS:
+        raise ValueError(f"Unknown page cache backend {backend!r}; expected one of {', '.join(PAGE_CACHE_BACKENDS)}")
+    if backend == "memory":
+        return MemoryPageCache(max_entries=max_entries, ttl=ttl)
+    if backend == "sqlite":
+        return SQLitePageCache(path or "page_cache.sqlite", ttl=ttl)
+    return None
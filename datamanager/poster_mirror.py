@@ -0,0 +1,187 @@
+import hashlib
+import io
+import os
+import re
+from typing import Optional
+import requests
+from requests.adapters import HTTPAdapter
+from flask import current_app
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional: without it posters are mirrored at their original size
+    Image = None
+
+MIRROR_POSTER = "mirror_poster"
+
+# Thumbnail widths in pixels: the movie list shows 60px posters, the review page 300px ones
+POSTER_SIZES = (60, 300)
+MAX_POSTER_BYTES = 5 * 1024 * 1024
+
+# Formats recognised from their first bytes when posters are stored unconverted
+_SIGNATURES = ((b"\xff\xd8\xff", "jpg"), (b"\x89PNG\r\n\x1a\n", "png"), (b"GIF8", "gif"))
+POSTER_NAME = re.compile(r"^(?P<digest>[0-9a-f]{32})-(?P<size>\d+)\.(?P<ext>webp|jpg|png|gif)$")
+
+
+def _image_format(data: bytes) -> Optional[str]:
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "webp"
+    for signature, ext in _SIGNATURES:
+        if data.startswith(signature):
+            return ext
+    return None
+
+
+def poster_file_name(key: str, size: int) -> str:
+    """
+    Name of the thumbnail of a mirrored poster at one of POSTER_SIZES.
+    Args:
+        key (str): CatalogMovie.poster_key, "<digest>.<ext>".
+        size (int): Thumbnail width.
+    Returns:
+        str: File name, "<digest>-<size>.<ext>".
+    """
+    digest, ext = key.split(".")
+    return f"{digest}-{size}.{ext}"
+
+
+class PosterStore:
+    """Content-addressed poster thumbnails on local disk.
+    A poster is stored under the SHA-256 of its original bytes, so films (or
+    URLs) sharing an image share the files, a file never changes once written
+    and can be cached by browsers forever. Files are spread over 256
+    subdirectories by the first two hex digits of the digest. With Pillow
+    installed every size is a WebP resized to that width; without it the
+    original image is stored once and linked under every size.
+    """
+
+    def __init__(self, root: str, max_connections: int = 4, timeout: float = 10.0):
+        """
+        Args:
+            root (str): Directory holding the thumbnails (created if missing).
+            max_connections (int): Keep-alive connections to poster hosts.
+            timeout (float): Read timeout per download, in seconds.
+        """
+        self.root = os.path.abspath(root)
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=max_connections)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def path_for(self, name: str) -> str:
+        """Return the path of a thumbnail file name (as built by poster_file_name)."""
+        return os.path.join(self.root, name[:2], name)
+
+    def download(self, url: str) -> bytes:
+        """
+        Fetch an original poster.
+        Raises:
+            requests.RequestException: If the download failed.
+            ValueError: If the response is not an image or is too large.
+        """
+        with self.session.get(url, timeout=(3.05, self.timeout), stream=True) as response:
+            response.raise_for_status()
+            content_type = response.headers.get("Content-Type", "")
+            if content_type and not content_type.startswith("image/"):
+                raise ValueError(f"{url} is not an image ({content_type}).")
+            data = bytearray()
+            for chunk in response.iter_content(64 * 1024):
+                data += chunk
+                if len(data) > MAX_POSTER_BYTES:
+                    raise ValueError(f"{url} is larger than {MAX_POSTER_BYTES} bytes.")
+        return bytes(data)
+
+    def _write(self, name: str, data: bytes) -> None:
+        path = self.path_for(name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "wb") as f:
+            f.write(data)
+        os.replace(temporary, path)
+
+    def save(self, data: bytes) -> str:
+        """
+        Store the thumbnails of an original poster (a no-op if they already exist).
+        Args:
+            data (bytes): Original image.
+        Returns:
+            str: The poster key, "<digest>.<ext>".
+        Raises:
+            ValueError: If the data is not a supported image.
+        """
+        digest = hashlib.sha256(data).hexdigest()[:32]
+        if Image is None:
+            ext = _image_format(data)
+            if ext is None:
+                raise ValueError("Unsupported poster image format.")
+        else:
+            ext = "webp"
+        key = f"{digest}.{ext}"
+        names = [poster_file_name(key, size) for size in POSTER_SIZES]
+        if all(os.path.exists(self.path_for(name)) for name in names):
+            return key
+
+        if Image is None:
+            self._write(names[-1], data)
+            for name in names[:-1]:
+                try:
+                    os.link(self.path_for(names[-1]), self.path_for(name))
+                except FileExistsError:
+                    pass
+                except OSError:
+                    # No hard links on this filesystem
+                    self._write(name, data)
+            return key
+
+        try:
+            with Image.open(io.BytesIO(data)) as original:
+                original.load()
+                image = original.convert("RGBA" if "A" in original.getbands() else "RGB")
+        except (OSError, Image.DecompressionBombError) as e:
+            raise ValueError(f"Unreadable poster image: {e}")
+        for size, name in zip(POSTER_SIZES, names):
+            width = min(size, image.width)
+            thumbnail = image.resize((width, max(1, round(image.height * width / image.width))), Image.LANCZOS)
+            buffer = io.BytesIO()
+            thumbnail.save(buffer, "WEBP", quality=80, method=4)
+            self._write(name, buffer.getvalue())
+        return key
+
+
+def mirror_poster(catalog_movie_id: int) -> None:
+    """
+    Mirror the poster of a catalog film into the poster store.
+    Download errors propagate so the job queue retries with backoff.
+    Args:
+        catalog_movie_id (int): Catalog entry ID.
+    """
+    data_manager = current_app.data_manager
+    catalog_movie = data_manager.get_catalog_movie_by_id(catalog_movie_id)
+    if catalog_movie is None or catalog_movie.poster_mirror or not is_remote_poster(catalog_movie.poster_url):
+        return
+    source = catalog_movie.poster_url
+    store = current_app.extensions["poster_store"]
+    key = store.save(store.download(source))
+    data_manager.set_poster_mirror(catalog_movie_id, source, key)
+
+
+def give_up_mirroring(catalog_movie_id: int) -> None:
+    """Record a failed mirror so the film keeps linking to the original poster."""
+    catalog_movie = current_app.data_manager.get_catalog_movie_by_id(catalog_movie_id)
+    if catalog_movie is not None:
+        current_app.data_manager.set_poster_mirror(catalog_movie_id, catalog_movie.poster_url, None)
+
+
+def is_remote_poster(url: Optional[str]) -> bool:
+    """Return True for poster URLs that can be mirrored (OMDb uses "N/A" for none)."""
+    return bool(url) and url.startswith(("http://", "https://"))
+
+
+def register_poster_jobs(worker) -> None:
+    """
+    Register the poster mirroring handler on a job worker.
+    Args:
+        worker (JobWorker): The worker pool.
+    """
+    worker.register(MIRROR_POSTER, mirror_poster, on_give_up=give_up_mirroring)
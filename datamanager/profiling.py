@@ -0,0 +1,153 @@
+import cProfile
+import itertools
+import os
+import re
+import sys
+import threading
+import time
+from datetime import datetime
+from flask import g, request
+from sqlalchemy import event
+
+# Frames from these modules are never reported as the caller of a statement
+_INTERNAL_MODULES = ("sqlalchemy", "flask_sqlalchemy", "datamanager.profiling", "datamanager.metrics",
+                     "datamanager.query_counter")
+
+# Statements EXPLAIN QUERY PLAN says something useful about
+EXPLAINABLE = re.compile(r"^\s*(SELECT|INSERT|UPDATE|DELETE|WITH)\b", re.IGNORECASE)
+
+
+def find_caller() -> str:
+    """
+    Name the code that issued the statement being executed.
+    Returns:
+        str: "SQLiteDataManager.<method>" when a data manager method is on the
+        stack, otherwise the innermost application function.
+    """
+    frame = sys._getframe(1)
+    fallback = None
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module == "datamanager.sqlite_data_manager":
+            return f"SQLiteDataManager.{frame.f_code.co_name}"
+        if fallback is None and not module.startswith(_INTERNAL_MODULES):
+            fallback = f"{module}.{frame.f_code.co_name}"
+        frame = frame.f_back
+    return fallback or "unknown"
+
+
+def explain_query_plan(dbapi_connection, statement: str, parameters) -> str:
+    """
+    Run EXPLAIN QUERY PLAN for a statement on a raw SQLite connection.
+    Going through the DBAPI cursor keeps the EXPLAIN itself out of the engine
+    events (and so out of the slow-query log, metrics and query counters).
+    Returns:
+        str: The plan steps joined by "; ", or an error note.
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("EXPLAIN QUERY PLAN " + statement, parameters or ())
+        return "; ".join(row[3] for row in cursor.fetchall())
+    except Exception as e:
+        return f"(EXPLAIN failed: {e})"
+    finally:
+        cursor.close()
+
+
+def configure_slow_query_log(app, engines, threshold_ms: float) -> None:
+    """
+    Log every statement slower than threshold_ms with its parameters, the
+    data manager method that issued it and, on SQLite, its query plan.
+    Args:
+        app (Flask): The Flask application instance (its logger is used).
+        engines (List[Engine]): Engines to watch (primary and replicas).
+        threshold_ms (float): Duration above which a statement is logged.
+    """
+    def start_timer(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._slow_query_started = time.perf_counter()
+
+    def log_if_slow(conn, cursor, statement, parameters, context, executemany):
+        started = getattr(context, "_slow_query_started", None)
+        if started is None:
+            return
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        if elapsed_ms < threshold_ms:
+            return
+        message = (f"Slow query ({elapsed_ms:.1f} ms) in {find_caller()}: "
+                   f"{' '.join(statement.split())} params={parameters!r}")
+        if conn.dialect.name == "sqlite" and not executemany and EXPLAINABLE.match(statement):
+            message += f" plan: {explain_query_plan(conn.connection.dbapi_connection, statement, parameters)}"
+        app.logger.warning(message)
+
+    for engine in engines:
+        event.listen(engine, "before_cursor_execute", start_timer)
+        event.listen(engine, "after_cursor_execute", log_if_slow)
+    app.logger.info(f"Slow query log enabled for statements over {threshold_ms} ms")
+
+
+class RequestProfiler:
+    """Profiles one request out of every N with cProfile and dumps the stats to disk.
+    Each dump is a pstats file named after the endpoint, loadable with
+    pstats, snakeviz or gprof2dot to see the route's call graph. Only one
+    request is profiled at a time; samples falling on a busy profiler are skipped.
+    """
+
+    def __init__(self, every: int, directory: str):
+        """
+        Args:
+            every (int): Profile one request out of this many.
+            directory (str): Directory the .prof files are written to.
+        """
+        self.every = every
+        self.directory = directory
+        self._requests = itertools.count(1)
+        self._busy = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def start(self) -> None:
+        """Start profiling the current request if it is a sampled one."""
+        if next(self._requests) % self.every or not self._busy.acquire(blocking=False):
+            return
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Another profiler (e.g. a debugger) is active
+            self._busy.release()
+            return
+        g._request_profile = profile
+
+    def stop(self) -> None:
+        """Stop profiling the current request, if profiled, and write its stats file."""
+        profile = g.pop("_request_profile", None)
+        if profile is None:
+            return
+        try:
+            profile.disable()
+            endpoint = (request.endpoint or "unmatched").replace(".", "-")
+            stamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S%f")
+            profile.dump_stats(os.path.join(self.directory, f"{endpoint}-{stamp}-{os.getpid()}.prof"))
+        finally:
+            self._busy.release()
+
+
+def register_request_profiler(app, every: int, directory: str) -> RequestProfiler:
+    """
+    Profile one request out of every N and dump per-route call graphs to directory.
+    Args:
+        app (Flask): The Flask application instance.
+        every (int): Sampling interval in requests.
+        directory (str): Output directory for the .prof files.
+    Returns:
+        RequestProfiler: The installed profiler.
+    """
+    profiler = RequestProfiler(every, directory)
+    app.before_request(profiler.start)
+
+    @app.teardown_request
+    def stop_request_profile(exc):
+        profiler.stop()
+
+    app.logger.info(f"Profiling one request in {every}; stats written to {directory}")
+    return profiler
@@ -0,0 +1,74 @@
+import threading
+from contextlib import contextmanager
+from functools import wraps
+from flask import current_app
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+_local = threading.local()
+
+
+class QueryCounter:
+    """Collects the SQL statements executed on the current thread while active.
+    Attributes:
+        statements (List[str]): Statements executed, in order.
+        parameters (List): Bound parameters of each statement, in the same order.
+    """
+
+    def __init__(self):
+        self.statements = []
+        self.parameters = []
+
+    @property
+    def count(self) -> int:
+        """Number of statements executed."""
+        return len(self.statements)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _record_statement(conn, cursor, statement, parameters, context, executemany):
+    for counter in getattr(_local, "active", ()):
+        counter.statements.append(statement)
+        counter.parameters.append(parameters)
+
+
+@contextmanager
+def count_queries():
+    """
+    Count the SQL statements executed on this thread inside the block.
+    Yields:
+        QueryCounter: Counter filled in as statements run.
+    """
+    counter = QueryCounter()
+    active = getattr(_local, "active", None)
+    if active is None:
+        active = _local.active = []
+    active.append(counter)
+    try:
+        yield counter
+    finally:
+        active.remove(counter)
+
+
+def query_budget(max_queries: int):
+    """
+    Decorator declaring how many SQL statements a route may execute, template
+    rendering included. Exceeding the budget logs a warning; the exact counts
+    are asserted by the test suite (tests/test_query_counts.py).
+    Args:
+        max_queries (int): Maximum number of statements per request.
+    Returns:
+        function: The decorator.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            with count_queries() as counter:
+                result = f(*args, **kwargs)
+            if counter.count > max_queries:
+                message = (f"{f.__name__} executed {counter.count} SQL statements "
+                           f"(budget {max_queries}): {counter.statements}")
+                current_app.logger.warning(message)
+            return result
+        return decorated_function
+    return decorator
@@ -0,0 +1,202 @@
+import itertools
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from flask import current_app, g, has_app_context, has_request_context, session
+from flask_sqlalchemy.session import Session
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.engine import make_url
+from sqlalchemy.sql import Select
+from datamanager.engine_profile import get_engine_options, get_sqlite_pragmas, apply_sqlite_pragmas, is_sqlite
+from datamanager.request_cache import clear_request_cache
+
+STICKY_SESSION_KEY = "_db_primary_until"
+
+
+class ReplicaRouter:
+    """Chooses the engine for read queries when read-only replicas are configured.
+    Reads go to the replicas in round-robin order unless the current code runs
+    inside a write (see writes()), the current request has already written,
+    or the client wrote within the last sticky_seconds (read-your-writes).
+    """
+
+    def __init__(self, replica_engines, sticky_seconds: float = 5.0):
+        """
+        Args:
+            replica_engines (List[Engine]): Engines bound to the read replicas.
+            sticky_seconds (float): How long a client keeps reading from the primary after a write.
+        """
+        self.replica_engines = list(replica_engines)
+        self.sticky_seconds = sticky_seconds
+        self._next = itertools.cycle(self.replica_engines)
+        self._lock = threading.Lock()
+
+    def choose(self):
+        """Return the next replica engine."""
+        with self._lock:
+            return next(self._next)
+
+    def use_primary(self) -> bool:
+        """Return True if reads must currently see the primary."""
+        if g.get("_db_primary_depth", 0) or g.get("_db_wrote"):
+            return True
+        if has_request_context():
+            return session.get(STICKY_SESSION_KEY, 0) > time.time()
+        return False
+
+    def mark_written(self) -> None:
+        """Record a write so this request and this client's next requests read from the primary."""
+        g._db_wrote = True
+        if has_request_context():
+            session[STICKY_SESSION_KEY] = time.time() + self.sticky_seconds
+
+
+class RoutingSession(Session):
+    """Flask-SQLAlchemy session sending plain SELECTs to a read replica when allowed.
+    Flushes, INSERT/UPDATE/DELETE statements and anything run while
+    ReplicaRouter.use_primary() is true go to the primary bind.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and not self._flushing and isinstance(clause, Select) and has_app_context():
+            router = current_app.extensions.get("replica_router")
+            if router is not None and not router.use_primary():
+                return router.choose()
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+@contextmanager
+def primary():
+    """Send every query in the block to the primary database."""
+    if not has_app_context():
+        yield
+        return
+    g._db_primary_depth = g.get("_db_primary_depth", 0) + 1
+    try:
+        yield
+    finally:
+        g._db_primary_depth -= 1
+
+
+def writes(f):
+    """
+    Decorator for data manager methods that modify data.
+    Their reads (existence checks, lookups) go to the primary, a
+    successful call makes the caller read its own writes afterwards, and
+    any call drops the lookups memoized for the current request.
+    In group-commit mode the call is run by the group committer's writer thread.
+    """
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        committer = current_app.extensions.get("group_committer") if has_app_context() else None
+        try:
+            if committer is not None and committer.accepts():
+                result = committer.submit(decorated_function, args, kwargs)
+                _mark_written()
+                # The replicas may not have the rows yet
+                with primary():
+                    return _rebind(result)
+            with primary():
+                result = f(*args, **kwargs)
+        finally:
+            clear_request_cache()
+        _mark_written()
+        return result
+    return decorated_function
+
+
+def _rebind(result):
+    """Load ORM objects returned by the group committer's writer thread into this thread's session."""
+    if isinstance(result, list):
+        return [_rebind(item) for item in result]
+    db = current_app.extensions["sqlalchemy"]
+    if isinstance(result, db.Model):
+        identity = inspect(result).identity
+        if identity is not None:
+            return db.session.get(type(result), identity)
+    return result
+
+
+def _mark_written() -> None:
+    if has_app_context():
+        router = current_app.extensions.get("replica_router")
+        if router is not None:
+            router.mark_written()
+
+
+def configure_replicas(app, replica_urls, sticky_seconds: float = 5.0, sync_interval: float = 0) -> ReplicaRouter:
+    """
+    Create read-only engines for the replicas and install the router on the app.
+    Args:
+        app (Flask): The Flask application instance.
+        replica_urls (List[str]): SQLAlchemy URLs of the replicas.
+        sticky_seconds (float): Read-your-writes window after a client's write.
+        sync_interval (float): If positive and every database is a SQLite file,
+            copy the primary into the replicas this often (seconds).
+    Returns:
+        ReplicaRouter: The installed router.
+    """
+    engines = []
+    for url in replica_urls:
+        engine = create_engine(url, **get_engine_options(url))
+        if engine.dialect.name == "sqlite":
+            apply_sqlite_pragmas(engine, dict(get_sqlite_pragmas(), query_only="ON"))
+        engines.append(engine)
+
+    router = ReplicaRouter(engines, sticky_seconds=sticky_seconds)
+    app.extensions["replica_router"] = router
+
+    # The engine URL has relative SQLite paths resolved against the instance folder
+    primary_url = app.extensions["sqlalchemy"].engine.url
+    if sync_interval > 0 and all(is_sqlite(url) for url in [primary_url, *replica_urls]):
+        app.extensions["replica_sync"] = SQLiteReplicaSync(primary_url, replica_urls, sync_interval, app.logger)
+        app.extensions["replica_sync"].start()
+
+    app.logger.info(f"Routing reads to {len(engines)} replica(s); sticky window {sticky_seconds}s")
+    return router
+
+
+class SQLiteReplicaSync:
+    """Keeps SQLite replica files in sync with the primary file using the backup API.
+    A daemon thread copies the primary into each replica every interval seconds;
+    the backup runs page by page so the primary is never locked for long.
+    """
+
+    def __init__(self, primary_url, replica_urls, interval: float, logger):
+        self.primary_path = make_url(primary_url).database
+        self.replica_paths = [make_url(url).database for url in replica_urls]
+        self.interval = interval
+        self.logger = logger
+        self._stop = threading.Event()
+        self._thread = None
+
+    def sync(self) -> None:
+        """Copy the primary into every replica once."""
+        source = sqlite3.connect(self.primary_path, timeout=30)
+        try:
+            for path in self.replica_paths:
+                target = sqlite3.connect(path, timeout=30)
+                try:
+                    source.backup(target, pages=1024, sleep=0.001)
+                finally:
+                    target.close()
+        finally:
+            source.close()
+
+    def start(self) -> None:
+        """Run an initial sync, then keep syncing in a daemon thread."""
+        self.sync()
+        self._thread = threading.Thread(target=self._loop, name="sqlite-replica-sync", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.sync()
+            except sqlite3.Error as e:
+                self.logger.error(f"SQLite replica sync failed: {e}")
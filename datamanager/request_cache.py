@@ -0,0 +1,53 @@
+from functools import wraps
+from flask import g, has_request_context
+
+
+def request_memoized(f):
+    """
+    Decorator memoizing a data manager getter for the rest of the current request.
+    Results are keyed by method name and arguments, so an entity fetched by
+    a route is not fetched again by the next helper or template asking for it.
+    Outside a request the getter is called directly.
+    """
+    @wraps(f)
+    def decorated_function(self, *args, **kwargs):
+        if not has_request_context():
+            return f(self, *args, **kwargs)
+
+        if "_dm_memo" not in g:
+            g._dm_memo = {}
+            g._dm_memo_hits = 0
+        key = (f.__name__, args, tuple(sorted(kwargs.items())))
+        if key in g._dm_memo:
+            g._dm_memo_hits += 1
+            return g._dm_memo[key]
+        result = g._dm_memo[key] = f(self, *args, **kwargs)
+        return result
+    return decorated_function
+
+
+def clear_request_cache() -> None:
+    """Forget every memoized result of the current request (called after writes)."""
+    if has_request_context():
+        g.pop("_dm_memo", None)
+
+
+def saved_queries() -> int:
+    """Return how many getter calls the current request answered from the memo."""
+    return g.get("_dm_memo_hits", 0) if has_request_context() else 0
+
+
+def register_request_cache(app):
+    """
+    Report saved queries in debug mode through an X-Saved-Queries response header and the debug log.
+    Args:
+        app (Flask): The Flask application instance.
+    """
+    @app.after_request
+    def report_saved_queries(response):
+        if app.debug:
+            hits = saved_queries()
+            response.headers["X-Saved-Queries"] = str(hits)
+            if hits:
+                app.logger.debug(f"{hits} data manager lookups served from the request cache")
+        return response
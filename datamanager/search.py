@@ -0,0 +1,91 @@
+import re
+from sqlalchemy import text
+
+# FTS5 indexes over catalog film names/directors and review texts. They are
+# external-content tables: the text lives only in the source tables and the
+# triggers keep the index in step with every INSERT, UPDATE and DELETE.
+# Note that a batch migration which recreates catalog_movies or reviews drops
+# their triggers; run `flask rebuild-search-index` afterwards.
+SEARCH_TABLES = {
+    "catalog_movies_fts": ("catalog_movies", ("name", "director")),
+    "reviews_fts": ("reviews", ("review_text",)),
+}
+
+# Diacritics are folded ("amelie" finds "Amélie"); 2 and 3 character prefix
+# indexes answer short prefix queries without walking the whole term list
+FTS_OPTIONS = "tokenize='unicode61 remove_diacritics 2', prefix='2 3'"
+
+SEARCH_KINDS = ("movies", "reviews")
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+
+def search_index_ddl() -> list:
+    """
+    Return the statements creating the FTS5 tables and their sync triggers.
+    Every statement uses IF NOT EXISTS, so they can be rerun on a database
+    that already has (part of) the index.
+    Returns:
+        List[str]: SQL statements, in execution order.
+    """
+    statements = []
+    for fts, (source, columns) in SEARCH_TABLES.items():
+        column_list = ", ".join(columns)
+        new_values = ", ".join(f"new.{column}" for column in columns)
+        old_values = ", ".join(f"old.{column}" for column in columns)
+        statements += [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+            f"{column_list}, content='{source}', content_rowid='id', {FTS_OPTIONS})",
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {source} BEGIN "
+            f"INSERT INTO {fts}(rowid, {column_list}) VALUES (new.id, {new_values}); END",
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {source} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, {column_list}) VALUES ('delete', old.id, {old_values}); END",
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {column_list} ON {source} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, {column_list}) VALUES ('delete', old.id, {old_values}); "
+            f"INSERT INTO {fts}(rowid, {column_list}) VALUES (new.id, {new_values}); END",
+        ]
+    return statements
+
+
+def create_search_index(connection, rebuild: bool = False) -> None:
+    """
+    Create the search index on a SQLite connection if it is missing.
+    Args:
+        connection (Connection): SQLAlchemy connection (the caller commits).
+        rebuild (bool): Also re-read every row of the source tables into the index.
+    """
+    for statement in search_index_ddl():
+        connection.execute(text(statement))
+    if rebuild:
+        for fts in SEARCH_TABLES:
+            connection.execute(text(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')"))
+
+
+def has_search_index(connection) -> bool:
+    """Return True if the FTS5 tables exist on this SQLite connection."""
+    names = set(connection.execute(text(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND name IN ('catalog_movies_fts', 'reviews_fts')"
+    )).scalars())
+    return names == set(SEARCH_TABLES)
+
+
+def search_terms(query: str) -> list:
+    """Split what a user typed into at most 16 search words, dropping punctuation and FTS5 operators."""
+    return _WORD.findall(query or "")[:16]
+
+
+def build_match_query(query: str):
+    """
+    Turn what a user typed into an FTS5 MATCH expression.
+    Every word becomes a quoted prefix term and all of them must match, so
+    "godf copp" finds "The Godfather" by Francis Ford Coppola. FTS5 operators
+    and punctuation in the input are ignored rather than raising syntax errors.
+    Args:
+        query (str): Raw search text.
+    Returns:
+        Optional[str]: MATCH expression, or None if the text contains no words.
+    """
+    words = search_terms(query)
+    if not words:
+        return None
+    return " ".join(f'"{word}"*' for word in words)
@@ -0,0 +1,241 @@
+import secrets
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Optional
+from flask.sessions import SecureCookieSession, SessionInterface, session_json_serializer
+
+SESSION_BACKENDS = ("cookie", "memory", "sqlite")
+
+
+class MemorySessionStore:
+    """In-process session store.
+    Sessions live in an LRU dictionary and expire ttl seconds after they were
+    last saved. Only suitable for a single process: a session created by one
+    worker is unknown to the others.
+    """
+
+    def __init__(self, ttl: int = 7 * 24 * 3600, max_entries: int = 10000):
+        """
+        Args:
+            ttl (int): Lifetime in seconds of a session after its last save.
+            max_entries (int): Maximum number of sessions kept.
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        # sid -> (expires_at, user_id, serialized data)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, sid: str) -> Optional[tuple]:
+        """Return (serialized data, expires_at) of a live session, or None."""
+        with self._lock:
+            entry = self._entries.get(sid)
+            if entry is None:
+                return None
+            if entry[0] <= time.time():
+                del self._entries[sid]
+                return None
+            self._entries.move_to_end(sid)
+            return entry[2], entry[0]
+
+    def set(self, sid: str, data: str, user_id: Optional[int] = None) -> None:
+        """Store a session for ttl seconds, evicting the least recently used ones beyond max_entries."""
+        with self._lock:
+            self._entries[sid] = (time.time() + self.ttl, user_id, data)
+            self._entries.move_to_end(sid)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, sid: str) -> None:
+        """Forget a session."""
+        with self._lock:
+            self._entries.pop(sid, None)
+
+    def delete_user(self, user_id: int) -> None:
+        """Log a user out everywhere (e.g. after deleting the account)."""
+        with self._lock:
+            for sid in [sid for sid, entry in self._entries.items() if entry[1] == user_id]:
+                del self._entries[sid]
+
+
+class SQLiteSessionStore:
+    """Session store kept in a SQLite file.
+    Every worker process on the box sees the same sessions. Sessions expire
+    ttl seconds after they were last saved; expired rows are purged every few
+    hundred writes.
+    """
+
+    PURGE_EVERY = 256
+
+    def __init__(self, path: str, ttl: int = 7 * 24 * 3600):
+        """
+        Args:
+            path (str): SQLite file holding the sessions.
+            ttl (int): Lifetime in seconds of a session after its last save.
+        """
+        self.path = path
+        self.ttl = ttl
+        self._writes = 0
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS sessions ("
+                " sid TEXT PRIMARY KEY,"
+                " user_id INTEGER,"
+                " data TEXT NOT NULL,"
+                " expires_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_sessions_user_id ON sessions (user_id)")
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=5)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, sid: str) -> Optional[tuple]:
+        """Return (serialized data, expires_at) of a live session, or None."""
+        try:
+            with self._connect() as conn:
+                return conn.execute(
+                    "SELECT data, expires_at FROM sessions WHERE sid = ? AND expires_at > ?", (sid, time.time())
+                ).fetchone()
+        except sqlite3.Error as e:
+            print(f"Error reading session: {e}")
+            return None
+
+    def set(self, sid: str, data: str, user_id: Optional[int] = None) -> None:
+        """Store a session for ttl seconds."""
+        now = time.time()
+        self._writes += 1
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO sessions (sid, user_id, data, expires_at) VALUES (?, ?, ?, ?)",
+                    (sid, user_id, data, now + self.ttl),
+                )
+                if self._writes % self.PURGE_EVERY == 0:
+                    conn.execute("DELETE FROM sessions WHERE expires_at <= ?", (now,))
+        except sqlite3.Error as e:
+            print(f"Error writing session: {e}")
+
+    def delete(self, sid: str) -> None:
+        """Forget a session."""
+        try:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM sessions WHERE sid = ?", (sid,))
+        except sqlite3.Error as e:
+            print(f"Error deleting session: {e}")
+
+    def delete_user(self, user_id: int) -> None:
+        """Log a user out everywhere (e.g. after deleting the account)."""
+        try:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM sessions WHERE user_id = ?", (user_id,))
+        except sqlite3.Error as e:
+            print(f"Error deleting sessions of user {user_id}: {e}")
+
+
+class ServerSideSession(SecureCookieSession):
+    """Session whose data is kept in a session store; the cookie only carries its ID."""
+
+    def __init__(self, initial=None, sid: Optional[str] = None, expires_at: float = 0.0):
+        super().__init__(initial)
+        self.sid = sid
+        self.expires_at = expires_at
+        self.previous_sid = None
+
+    def regenerate(self) -> None:
+        """Move the session to a new ID (on login, so an ID planted before it is worthless)."""
+        if self.sid is not None and self.previous_sid is None:
+            self.previous_sid = self.sid
+        self.sid = None
+        self.modified = True
+
+
+class ServerSessionInterface(SessionInterface):
+    """Flask session interface storing session data server-side.
+    The cookie holds a random session ID. Data is written back only when the
+    session changed, or when less than half its lifetime is left (so active
+    users stay logged in without a write on every request).
+    """
+
+    def __init__(self, store):
+        """
+        Args:
+            store (MemorySessionStore | SQLiteSessionStore): Where sessions are kept.
+        """
+        self.store = store
+
+    def open_session(self, app, request) -> ServerSideSession:
+        sid = request.cookies.get(self.get_cookie_name(app))
+        if sid:
+            stored = self.store.get(sid)
+            if stored is not None:
+                data, expires_at = stored
+                try:
+                    return ServerSideSession(session_json_serializer.loads(data), sid=sid, expires_at=expires_at)
+                except ValueError:
+                    pass
+        return ServerSideSession()
+
+    def save_session(self, app, session: ServerSideSession, response) -> None:
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+        if session.accessed:
+            response.vary.add("Cookie")
+        if session.previous_sid is not None:
+            self.store.delete(session.previous_sid)
+
+        if not session:
+            if session.sid is not None or session.previous_sid is not None:
+                if session.sid is not None:
+                    self.store.delete(session.sid)
+                response.delete_cookie(name, domain=domain, path=path, secure=self.get_cookie_secure(app),
+                                       samesite=self.get_cookie_samesite(app),
+                                       httponly=self.get_cookie_httponly(app))
+                response.vary.add("Cookie")
+            return
+
+        stale = session.expires_at - time.time() < self.store.ttl / 2
+        if not (session.modified or session.sid is None or stale):
+            return
+        if session.sid is None:
+            session.sid = secrets.token_urlsafe(32)
+        self.store.set(session.sid, session_json_serializer.dumps(dict(session)), user_id=session.get("user_id"))
+        response.set_cookie(
+            name,
+            session.sid,
+            expires=self.get_expiration_time(app, session),
+            httponly=self.get_cookie_httponly(app),
+            domain=domain,
+            path=path,
+            secure=self.get_cookie_secure(app),
+            samesite=self.get_cookie_samesite(app),
+        )
+        response.vary.add("Cookie")
+
+
+def create_session_store(backend: str, path: Optional[str] = None, ttl: int = 7 * 24 * 3600):
+    """
+    Build the configured session store.
+    Args:
+        backend (str): "cookie", "memory" or "sqlite".
+        path (Optional[str]): SQLite file for the "sqlite" backend.
+        ttl (int): Session lifetime in seconds after the last save.
+    Returns:
+        MemorySessionStore, SQLiteSessionStore or None: The store, or None to keep Flask's signed cookie sessions.
+    """
+    if backend not in SESSION_BACKENDS:
+        raise ValueError(f"Unknown session backend {backend!r}; expected one of {', '.join(SESSION_BACKENDS)}")
+    if backend == "memory":
+        return MemorySessionStore(ttl=ttl)
+    if backend == "sqlite":
+        return SQLiteSessionStore(path or "sessions.sqlite", ttl=ttl)
+    return None
@@ -1,18 +1,304 @@
-from typing import Optional, List
-from models.app_models import db, User, Movie, Review
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Optional, List, Tuple, Dict, Iterable, Iterator
+from flask import g
+from sqlalchemy import insert, update, delete, select, func, cast, Integer, and_, or_, table, column, literal_column
+from sqlalchemy.orm import joinedload, load_only, aliased
+from models.app_models import db, User, Movie, Review, CatalogMovie, TitleRatingStats
 from datamanager.data_manager_interface import DataManagerInterface
+from datamanager.utils import normalize_title
+from datamanager.job_queue import enqueue_job
+from datamanager.enrichment import ENRICH_MOVIE
+from datamanager.poster_mirror import MIRROR_POSTER, is_remote_poster
+from datamanager.replica_routing import primary, writes
+from datamanager.request_cache import request_memoized
+from datamanager.search import SEARCH_KINDS, build_match_query, search_terms
+from datamanager.export import EXPORT_BATCH_SIZE
+from datamanager.unit_of_work import UnitOfWork, current_unit_of_work
+
+# Columns read by each field a caller may select with fields=, so partial loads fetch only those
+MOVIE_FIELD_COLUMNS = {
+    "id": (),
+    "user_id": (Movie.user_id,),
+    "name": (CatalogMovie.name,),
+    "director": (Movie.user_director, CatalogMovie.director),
+    "year": (CatalogMovie.year,),
+    "rating": (Movie.user_rating, CatalogMovie.rating),
+    "user_rating": (Movie.user_rating,),
+    "poster_url": (Movie.user_poster_url, CatalogMovie.poster_url),
+    "status": (CatalogMovie.status,),
+    "imdb_id": (CatalogMovie.imdb_id,),
+    "average_rating": (TitleRatingStats.average_rating,),
+    "rated_count": (TitleRatingStats.rated_count,),
+    "review_count": (TitleRatingStats.review_count,),
+    "updated_at": (Movie.updated_at,),
+}
+REVIEW_FIELD_COLUMNS = {
+    "id": (),
+    "movie_id": (Review.movie_id,),
+    "user_id": (Review.user_id,),
+    "user_name": (User.name,),
+    "review_text": (Review.review_text,),
+    "rating": (Review.rating,),
+    "created_at": (Review.created_at,),
+    "updated_at": (Review.updated_at,),
+}
+
+
+def _columns_of(model, columns) -> list:
+    return [column for column in columns if column.class_ is model]
 
 class SQLiteDataManager(DataManagerInterface):
     """Handles all database operations using Flask-SQLAlchemy's db.session."""
 
-    def __init__(self, db_instance):
+    def __init__(self, db_instance, page_cache=None, title_index=None, mirror_posters: bool = False,
+                 session_store=None):
         """
         Initialize the data manager with a SQLAlchemy db instance.
         Args:
             db_instance (SQLAlchemy): The SQLAlchemy database instance.
+            page_cache (Optional): Page fragment cache whose scope versions are bumped on writes.
+            title_index (Optional[TitleIndex]): Autocomplete index told about new catalog titles.
+            mirror_posters (bool): Queue a poster mirroring job whenever a film gets a new poster URL.
+            session_store (Optional): Server-side session store whose sessions of deleted users are ended.
         """
         self.db = db_instance
+        self.page_cache = page_cache
+        self.title_index = title_index
+        self.mirror_posters = mirror_posters
+        self.session_store = session_store
+
+    @contextmanager
+    def unit_of_work(self):
+        """
+        Group several writes into one transaction.
+        Inside the block, mutators flush instead of committing and their cache
+        invalidations wait; everything is committed once when the block exits,
+        or rolled back if it raises. A write failing inside the block rolls
+        the whole unit back (and exiting it then raises). Nested blocks join
+        the outermost one.
+        Yields:
+            UnitOfWork: State of the open unit.
+        """
+        unit = current_unit_of_work()
+        if unit is not None:
+            yield unit
+            return
+        unit = g._unit_of_work = UnitOfWork()
+        try:
+            with primary():
+                self._begin_transaction()
+                yield unit
+                if unit.failed:
+                    raise RuntimeError("A write in the unit of work failed; none of its writes were committed.")
+                self.db.session.commit()
+        except BaseException:
+            self.db.session.rollback()
+            raise
+        finally:
+            g._unit_of_work = None
+        for callback in unit.after_commit:
+            callback()
+
+    def _begin_transaction(self) -> None:
+        """
+        Open the database transaction of a unit of work before its first write.
+        The sqlite3 driver only sends BEGIN by itself before an INSERT, UPDATE
+        or DELETE, so a unit starting with a savepoint would run outside any
+        transaction: each RELEASE would commit on its own, and a rollback
+        would keep the writes already released. BEGIN IMMEDIATE also takes the
+        write lock up front, waiting for it under busy_timeout.
+        """
+        connection = self.db.session.connection()
+        if connection.dialect.name == "sqlite":
+            driver_connection = connection.connection.driver_connection
+            if not driver_connection.in_transaction:
+                driver_connection.execute("BEGIN IMMEDIATE")
+
+    def _commit(self) -> None:
+        """Commit the session, or only flush it inside a unit of work (committed when the unit ends)."""
+        if current_unit_of_work() is None:
+            self.db.session.commit()
+        else:
+            self.db.session.flush()
+
+    def _rollback(self) -> None:
+        """Undo a failed write: its savepoint inside a unit of work that has one, else the transaction."""
+        unit = current_unit_of_work()
+        if unit is None:
+            self.db.session.rollback()
+        elif unit.savepoint is not None and unit.savepoint.is_active:
+            unit.savepoint.rollback()
+        else:
+            unit.failed = True
+            self.db.session.rollback()
+
+    def _after_commit(self, callback) -> None:
+        """Run callback now, or once the current unit of work has committed."""
+        unit = current_unit_of_work()
+        if unit is None:
+            callback()
+        else:
+            unit.after_commit.append(callback)
+
+    def _bump_versions(self, *scopes: str) -> None:
+        """Invalidate cached pages built from the given scopes (call after committing)."""
+        if self.page_cache is not None and scopes:
+            self._after_commit(lambda: self.page_cache.bump(*scopes))
+
+    def _index_titles(self, *titles: str) -> None:
+        """Add catalog titles to the autocomplete index (call after committing)."""
+        if self.title_index is not None and titles:
+            self._after_commit(lambda: self.title_index.add(titles))
 
+    def _queue_poster_mirror(self, *catalog_movies: CatalogMovie) -> None:
+        """Queue mirroring of the films' posters where they are not mirrored yet (not committed)."""
+        if not self.mirror_posters:
+            return
+        for catalog_movie in catalog_movies:
+            if is_remote_poster(catalog_movie.poster_url) and catalog_movie.poster_source != catalog_movie.poster_url:
+                if catalog_movie.id is None:
+                    self.db.session.flush()
+                enqueue_job(MIRROR_POSTER, catalog_movie.id)
+
+    def _film_scopes(self, catalog_movie_ids, lists: bool = True) -> List[str]:
+        """
+        Return the page cache scopes showing any of the given catalog films:
+        the review page of every list entry of the film, and with lists=True
+        the movie list of every user who added it.
+        """
+        if self.page_cache is None:
+            return []
+        catalog_movie_ids = {cid for cid in catalog_movie_ids if cid is not None}
+        if not catalog_movie_ids:
+            return []
+        rows = (
+            self.db.session.query(Movie.id, Movie.user_id)
+            .filter(Movie.catalog_movie_id.in_(catalog_movie_ids))
+            .all()
+        )
+        scopes = {f"movie:{row.id}" for row in rows}
+        if lists:
+            scopes.update(f"user:{row.user_id}" for row in rows)
+        return sorted(scopes)
+
+    def _film_scopes_of_entry(self, movie_id: int) -> List[str]:
+        """Return the review page scopes of the film a list entry points at."""
+        if self.page_cache is None:
+            return []
+        catalog_movie_id = self.db.session.query(Movie.catalog_movie_id).filter(Movie.id == movie_id).scalar()
+        return self._film_scopes([catalog_movie_id], lists=False)
+
+    def _adjust_title_stats(self, catalog_movie_id: int, added=(), removed=()) -> None:
+        """
+        Apply review changes to a film's rating aggregates (not committed).
+        Pending changes are flushed first, so on SQLite the write lock is held
+        before the aggregate row is read; elsewhere the row is locked FOR UPDATE.
+        Args:
+            catalog_movie_id (int): Catalog film the reviews belong to.
+            added (Iterable[Tuple[Optional[float], datetime]]): (rating, created_at) of new reviews.
+            removed (Iterable[Tuple[Optional[float], datetime]]): (rating, created_at) of removed reviews.
+                A changed rating is one removal plus one addition.
+        """
+        self.db.session.flush()
+        stats = (
+            TitleRatingStats.query
+            .filter_by(catalog_movie_id=catalog_movie_id)
+            .with_for_update()
+            .first()
+        )
+        if stats is None:
+            stats = TitleRatingStats(catalog_movie_id=catalog_movie_id, review_count=0, rated_count=0,
+                                     rating_sum=0.0, histogram=[0] * TitleRatingStats.BUCKETS)
+            self.db.session.add(stats)
+
+        histogram = list(stats.histogram)
+        for sign, reviews in ((1, added), (-1, removed)):
+            for rating, _ in reviews:
+                stats.review_count += sign
+                if rating is not None:
+                    stats.rated_count += sign
+                    stats.rating_sum += sign * rating
+                    histogram[TitleRatingStats.bucket(rating)] += sign
+        stats.histogram = histogram
+        # Rounding keeps repeated add/remove from accumulating float error
+        stats.rating_sum = round(stats.rating_sum, 6) if stats.rated_count else 0.0
+        stats.average_rating = round(stats.rating_sum / stats.rated_count, 6) if stats.rated_count else None
+
+        removed_times = {created_at for _, created_at in removed}
+        if stats.last_review_at is not None and stats.last_review_at in removed_times:
+            # The newest review went away: find the next newest
+            stats.last_review_at = (
+                self.db.session.query(func.max(Review.created_at))
+                .join(Movie, Review.movie_id == Movie.id)
+                .filter(Movie.catalog_movie_id == catalog_movie_id)
+                .scalar()
+            )
+        for _, created_at in added:
+            if created_at is not None and (stats.last_review_at is None or created_at > stats.last_review_at):
+                stats.last_review_at = created_at
+
+    def _recompute_title_stats(self, catalog_movie_ids: Optional[List[int]] = None) -> int:
+        """
+        Rebuild rating aggregates from the reviews table (not committed).
+        Args:
+            catalog_movie_ids (Optional[List[int]]): Films to rebuild, or None for all of them.
+        Returns:
+            int: Number of films that have reviews.
+        """
+        self.db.session.flush()
+
+        def scoped(query):
+            if catalog_movie_ids is None:
+                return query
+            return query.filter(Movie.catalog_movie_id.in_(catalog_movie_ids))
+
+        totals = scoped(
+            self.db.session.query(
+                Movie.catalog_movie_id, func.count(Review.id), func.count(Review.rating),
+                func.sum(Review.rating), func.max(Review.created_at)
+            )
+            .join(Review, Review.movie_id == Movie.id)
+        ).group_by(Movie.catalog_movie_id).all()
+        # Same rounding as TitleRatingStats.bucket, before clamping
+        bucket = cast(Review.rating + 0.5, Integer)
+        histograms = {}
+        for catalog_movie_id, point, count in scoped(
+            self.db.session.query(Movie.catalog_movie_id, bucket, func.count())
+            .join(Review, Review.movie_id == Movie.id)
+            .filter(Review.rating.isnot(None))
+        ).group_by(Movie.catalog_movie_id, bucket):
+            histogram = histograms.setdefault(catalog_movie_id, [0] * TitleRatingStats.BUCKETS)
+            histogram[TitleRatingStats.bucket(point)] += count
+
+        clear = delete(TitleRatingStats)
+        if catalog_movie_ids is not None:
+            clear = clear.where(TitleRatingStats.catalog_movie_id.in_(catalog_movie_ids))
+        self.db.session.execute(clear, execution_options={"synchronize_session": False})
+
+        now = datetime.utcnow()
+        rows = [
+            {
+                "catalog_movie_id": catalog_movie_id,
+                "review_count": review_count,
+                "rated_count": rated_count,
+                "rating_sum": round(rating_sum or 0.0, 6),
+                "average_rating": round(rating_sum / rated_count, 6) if rated_count else None,
+                "histogram": histograms.get(catalog_movie_id, [0] * TitleRatingStats.BUCKETS),
+                "last_review_at": last_review_at,
+                "updated_at": now,
+            }
+            for catalog_movie_id, review_count, rated_count, rating_sum, last_review_at in totals
+        ]
+        if rows:
+            self.db.session.execute(insert(TitleRatingStats), rows)
+        # Loaded aggregate objects no longer match their rows
+        for obj in list(self.db.session.identity_map.values()):
+            if isinstance(obj, TitleRatingStats):
+                self.db.session.expire(obj)
+        return len(rows)
+
+    @writes
     def add_user(self, name: str, email: str) -> User:
         """
         Create and add a new user to the database.
@@ -30,9 +316,11 @@ class SQLiteDataManager(DataManagerInterface):
 
         new_user = User(name=name.strip(), email=email)
         self.db.session.add(new_user)
-        self.db.session.commit()
+        self._commit()
+        self._bump_versions("users")
         return new_user
 
+    @request_memoized
     def get_user_by_id(self, user_id: int) -> Optional[User]:
         """
         Retrieve a user by their ID.
@@ -43,6 +331,7 @@ class SQLiteDataManager(DataManagerInterface):
         """
         return User.query.get(user_id)
 
+    @request_memoized
     def get_user_by_email(self, email: str) -> Optional[User]:
         """
         Retrieve a user by their email address.
@@ -53,61 +342,558 @@ class SQLiteDataManager(DataManagerInterface):
         """
         return User.query.filter_by(email=email).first()
 
-    def get_user_movies(self, user_id: int) -> List[Movie]:
+    def get_user_movies(self, user_id: int, after_id: Optional[int] = None,
+                        limit: Optional[int] = None, fields: Optional[Iterable[str]] = None) -> List[Movie]:
         """
-        Retrieve all movies associated with a user.
+        Retrieve movies associated with a user, one keyset page at a time.
         Args:
             user_id (int): User ID.
+            after_id (Optional[int]): Only return movies with an ID greater than this.
+            limit (Optional[int]): Maximum number of movies to return.
+            fields (Optional[Iterable[str]]): Only load the columns behind these
+                MOVIE_FIELD_COLUMNS fields (None loads the full entry and film).
         Returns:
-            List[Movie]: List of Movie objects.
+            List[Movie]: List of Movie objects ordered by ID.
         """
-        user = self.get_user_by_id(user_id)
-        return user.movies if user else []
+        query = Movie.query
+        if fields is not None:
+            query = query.options(*self._movie_load_options(fields))
+        return (
+            query
+            .filter(Movie.user_id == user_id, Movie.id > (after_id or 0))
+            .order_by(Movie.id)
+            .limit(limit)
+            .all()
+        )
+
+    def _movie_load_options(self, fields: Iterable[str]) -> list:
+        """
+        Build loader options that fetch only the columns behind the given movie fields.
+        Raises:
+            ValueError: If a field is not in MOVIE_FIELD_COLUMNS.
+        """
+        unknown = set(fields) - set(MOVIE_FIELD_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown movie fields: {', '.join(sorted(unknown))}")
+        columns = [column for field in fields for column in MOVIE_FIELD_COLUMNS[field]]
+        catalog = joinedload(Movie.catalog)
+        options = [
+            load_only(Movie.id, *_columns_of(Movie, columns)),
+            catalog.load_only(CatalogMovie.id, *_columns_of(CatalogMovie, columns)),
+        ]
+        stats_columns = _columns_of(TitleRatingStats, columns)
+        if stats_columns:
+            options.append(catalog.joinedload(CatalogMovie.rating_stats)
+                           .load_only(TitleRatingStats.catalog_movie_id, *stats_columns))
+        return options
 
-    def get_all_users(self) -> List[User]:
+    def get_movies_by_ids(self, movie_ids: Iterable[int], fields: Optional[Iterable[str]] = None,
+                          user_id: Optional[int] = None) -> List[Movie]:
         """
-        Retrieve all users in the database.
+        Retrieve many movies with a single IN query.
+        Args:
+            movie_ids (Iterable[int]): Movie IDs; unknown IDs are skipped.
+            fields (Optional[Iterable[str]]): Only load the columns behind these
+                MOVIE_FIELD_COLUMNS fields (None loads everything, rating stats included).
+            user_id (Optional[int]): Only return entries on this user's list; the others are skipped.
         Returns:
-            List[User]: List of all User objects.
+            List[Movie]: The movies found, ordered by ID.
+        Raises:
+            ValueError: If fields contains an unknown field.
+        """
+        movie_ids = set(movie_ids)
+        if not movie_ids:
+            return []
+        options = (
+            self._movie_load_options(fields) if fields is not None
+            else [joinedload(Movie.catalog).joinedload(CatalogMovie.rating_stats)]
+        )
+        query = Movie.query.options(*options).filter(Movie.id.in_(movie_ids))
+        if user_id is not None:
+            query = query.filter(Movie.user_id == user_id)
+        return query.order_by(Movie.id).all()
+
+    def _page_version(self, page, *extra) -> Tuple[str, Optional[datetime]]:
+        """
+        Summarize a page subquery (id and updated_at columns) plus extra scalar
+        timestamps in a single statement.
+        The token changes whenever a row on the page is added, removed or
+        updated; the last-modified time is the newest timestamp involved.
         """
-        users = self.db.session.query(User).all()
-        print("Fetched users:", users)
-        return users
+        row = self.db.session.query(
+            func.count(page.c.id), func.max(page.c.id), func.max(page.c.updated_at), *extra
+        ).one()
+        timestamps = [value for value in row[2:] if value is not None]
+        token = "-".join("" if value is None else str(value) for value in row)
+        return token, max(timestamps) if timestamps else None
 
+    def get_users_version(self, after_id: Optional[int] = None,
+                          limit: Optional[int] = None) -> Tuple[str, Optional[datetime]]:
+        """
+        Compute the validator of a page of get_all_users with one aggregate query.
+        Args:
+            after_id (Optional[int]): Same as for get_all_users.
+            limit (Optional[int]): Same as for get_all_users.
+        Returns:
+            Tuple[str, Optional[datetime]]: Version token, and always None as
+            last-modified time: deleting a user leaves no newer timestamp behind.
+        """
+        page = (
+            self.db.session.query(User.id, User.updated_at)
+            .filter(User.id > (after_id or 0))
+            .order_by(User.id)
+            .limit(limit)
+            .subquery()
+        )
+        token, _ = self._page_version(page)
+        return token, None
+
+    def get_user_movies_version(self, user_id: int, after_id: Optional[int] = None,
+                                limit: Optional[int] = None) -> Tuple[str, Optional[datetime]]:
+        """
+        Compute the validator of a page of get_user_movies with one aggregate query.
+        Covers the list entries, their catalog films and the user.
+        Args:
+            user_id (int): User ID.
+            after_id (Optional[int]): Same as for get_user_movies.
+            limit (Optional[int]): Same as for get_user_movies.
+        Returns:
+            Tuple[str, Optional[datetime]]: Version token and last-modified time.
+        """
+        page = (
+            self.db.session.query(Movie.id, Movie.updated_at, CatalogMovie.updated_at.label("catalog_updated_at"))
+            .join(CatalogMovie, Movie.catalog_movie_id == CatalogMovie.id)
+            .filter(Movie.user_id == user_id, Movie.id > (after_id or 0))
+            .order_by(Movie.id)
+            .limit(limit)
+            .subquery()
+        )
+        user_updated_at = self.db.session.query(User.updated_at).filter(User.id == user_id).scalar_subquery()
+        return self._page_version(page, func.max(page.c.catalog_updated_at), user_updated_at)
+
+    def get_reviews_version(self, movie_id: int, after_id: Optional[int] = None,
+                            limit: Optional[int] = None) -> Tuple[str, Optional[datetime]]:
+        """
+        Compute the validator of a page of get_reviews_for_movie with one aggregate query.
+        Covers the reviews, the list entry, its catalog film, the film's rating stats and its owner.
+        Args:
+            movie_id (int): Movie ID.
+            after_id (Optional[int]): Same as for get_reviews_for_movie.
+            limit (Optional[int]): Same as for get_reviews_for_movie.
+        Returns:
+            Tuple[str, Optional[datetime]]: Version token and last-modified time.
+        """
+        catalog_movie_id = (
+            self.db.session.query(Movie.catalog_movie_id)
+            .filter(Movie.id == movie_id)
+            .scalar_subquery()
+        )
+        page = (
+            self.db.session.query(Review.id, Review.updated_at)
+            .filter(Review.catalog_movie_id == catalog_movie_id, Review.id > (after_id or 0))
+            .order_by(Review.id)
+            .limit(limit)
+            .subquery()
+        )
+        movie_updated_at = self.db.session.query(Movie.updated_at).filter(Movie.id == movie_id).scalar_subquery()
+        catalog_updated_at = (
+            self.db.session.query(CatalogMovie.updated_at)
+            .filter(CatalogMovie.id == catalog_movie_id)
+            .scalar_subquery()
+        )
+        owner_updated_at = (
+            self.db.session.query(User.updated_at)
+            .join(Movie, Movie.user_id == User.id)
+            .filter(Movie.id == movie_id)
+            .scalar_subquery()
+        )
+        # Reviews on other pages change the stats shown on this one
+        stats_updated_at = (
+            self.db.session.query(TitleRatingStats.updated_at)
+            .filter(TitleRatingStats.catalog_movie_id == catalog_movie_id)
+            .scalar_subquery()
+        )
+        return self._page_version(page, movie_updated_at, catalog_updated_at, owner_updated_at, stats_updated_at)
+
+    def get_all_users(self, after_id: Optional[int] = None, limit: Optional[int] = None) -> List[User]:
+        """
+        Retrieve users in the database, one keyset page at a time.
+        Args:
+            after_id (Optional[int]): Only return users with an ID greater than this.
+            limit (Optional[int]): Maximum number of users to return.
+        Returns:
+            List[User]: List of User objects ordered by ID.
+        """
+        return (
+            self.db.session.query(User)
+            .filter(User.id > (after_id or 0))
+            .order_by(User.id)
+            .limit(limit)
+            .all()
+        )
+
+    def _get_or_create_catalog_movie(
+        self,
+        name: str,
+        director: Optional[str] = None,
+        year: Optional[int] = None,
+        rating: Optional[float] = None,
+        poster_url: Optional[str] = None,
+        imdb_id: Optional[str] = None
+    ) -> CatalogMovie:
+        """
+        Find the shared catalog entry for a film, creating it if needed.
+        Entries are matched by imdb_id first, then by normalized title and year.
+        An entry without an imdb_id is unverified (typed in by a user); when
+        matched with an imdb_id, it takes the given details. The new entry is
+        added to the session but not committed.
+        Args:
+            name (str): Title of the movie.
+            director (Optional[str]): Director of the movie.
+            year (Optional[int]): Release year.
+            rating (Optional[float]): IMDb rating.
+            poster_url (Optional[str]): Poster URL.
+            imdb_id (Optional[str]): OMDb/IMDb identifier.
+        Returns:
+            CatalogMovie: The existing or newly created catalog entry.
+        """
+        title_key = normalize_title(name)
+        catalog_movie = None
+        if imdb_id:
+            catalog_movie = CatalogMovie.query.filter_by(imdb_id=imdb_id).first()
+        if catalog_movie is None:
+            catalog_movie = CatalogMovie.query.filter_by(title_key=title_key, year=year).first()
+            if catalog_movie is not None and imdb_id and not catalog_movie.imdb_id:
+                catalog_movie.imdb_id = imdb_id
+                for field, value in (("director", director), ("rating", rating), ("poster_url", poster_url)):
+                    if value is not None:
+                        setattr(catalog_movie, field, value)
+        if catalog_movie is None:
+            catalog_movie = CatalogMovie(
+                imdb_id=imdb_id or None,
+                title_key=title_key,
+                name=name,
+                director=director,
+                year=year,
+                rating=rating,
+                poster_url=poster_url,
+            )
+            self.db.session.add(catalog_movie)
+        return catalog_movie
+
+    @writes
     def add_movie(self, user_id: int, **movie_data) -> Movie:
         """
         Add a new movie for a specific user.
+        The film's metadata is stored once in the shared catalog and the user's
+        list entry points at it.
         Args:
             user_id (int): User ID.
-            movie_data: Arbitrary keyword arguments for Movie fields (name, director, year, rating, poster_url).
+            movie_data: Arbitrary keyword arguments for catalog fields (name, director, year, rating, poster_url, imdb_id).
         Raises:
-            ValueError: If the user already added a movie with the same name.
+            ValueError: If the user already added the same movie.
         Returns:
             Movie: The newly added Movie object.
         """
-        existing = Movie.query.filter_by(user_id=user_id, name=movie_data.get('name')).first()
-        if existing:
-            raise ValueError(f'You have already added the movie "{movie_data.get("name")}".')
-
-        new_movie = Movie(user_id=user_id, **movie_data)
         try:
+            catalog_movie = self._get_or_create_catalog_movie(**movie_data)
+            if catalog_movie.id is not None:
+                existing = Movie.query.filter_by(user_id=user_id, catalog_movie_id=catalog_movie.id).first()
+                if existing:
+                    raise ValueError(f'You have already added the movie "{catalog_movie.name}".')
+
+            new_movie = Movie(user_id=user_id, catalog=catalog_movie)
             self.db.session.add(new_movie)
-            self.db.session.commit()
+            self._queue_poster_mirror(catalog_movie)
+            # A verified film shows its new details on the other lists too
+            scopes = self._film_scopes([catalog_movie.id]) if catalog_movie in self.db.session.dirty else []
+            self._commit()
         except Exception as e:
-            self.db.session.rollback()
+            self._rollback()
             raise e
+        self._bump_versions(f"user:{user_id}", *scopes)
+        self._index_titles(catalog_movie.name)
+        return new_movie
+
+    @writes
+    def add_movies_bulk(self, user_id: int, movies_data: List[dict]) -> List[str]:
+        """
+        Add many movies for a user in a single transaction.
+        Catalog entries and existing list entries are looked up with one IN
+        query each, and missing rows are inserted with executemany-style bulk
+        inserts instead of one INSERT and commit per movie.
+        Args:
+            user_id (int): User ID.
+            movies_data (List[dict]): Catalog fields of each movie (name, director, year, rating, poster_url, imdb_id).
+        Returns:
+            List[str]: "added" or "duplicate" for each movie, in order.
+        """
+        if not movies_data:
+            return []
+
+        def find_catalog_ids():
+            imdb_ids = {data["imdb_id"] for data in movies_data if data.get("imdb_id")}
+            title_keys = {normalize_title(data["name"]) for data in movies_data}
+            rows = (
+                self.db.session.query(CatalogMovie.id, CatalogMovie.imdb_id, CatalogMovie.title_key, CatalogMovie.year)
+                .filter(CatalogMovie.imdb_id.in_(imdb_ids) | CatalogMovie.title_key.in_(title_keys))
+                .all()
+            )
+            by_imdb = {row.imdb_id: row.id for row in rows if row.imdb_id}
+            by_title = {(row.title_key, row.year): row.id for row in rows}
+            return [
+                by_imdb.get(data.get("imdb_id")) or by_title.get((normalize_title(data["name"]), data.get("year")))
+                for data in movies_data
+            ]
+
+        try:
+            catalog_ids = find_catalog_ids()
+            new_catalog_rows = {}
+            for data, catalog_id in zip(movies_data, catalog_ids):
+                if catalog_id is None:
+                    title_key = normalize_title(data["name"])
+                    new_catalog_rows.setdefault(data.get("imdb_id") or (title_key, data.get("year")), {
+                        "imdb_id": data.get("imdb_id") or None,
+                        "title_key": title_key,
+                        "name": data["name"],
+                        "director": data.get("director"),
+                        "year": data.get("year"),
+                        "rating": data.get("rating"),
+                        "poster_url": data.get("poster_url"),
+                    })
+            if new_catalog_rows:
+                self.db.session.execute(insert(CatalogMovie), list(new_catalog_rows.values()))
+                known_ids, catalog_ids = set(catalog_ids), find_catalog_ids()
+                if self.mirror_posters:
+                    for data, catalog_id in zip(movies_data, catalog_ids):
+                        if catalog_id not in known_ids and is_remote_poster(data.get("poster_url")):
+                            known_ids.add(catalog_id)
+                            enqueue_job(MIRROR_POSTER, catalog_id)
+
+            already_listed = {
+                row.catalog_movie_id for row in
+                self.db.session.query(Movie.catalog_movie_id)
+                .filter(Movie.user_id == user_id, Movie.catalog_movie_id.in_(set(catalog_ids)))
+            }
+            statuses = []
+            new_movie_rows = []
+            for catalog_id in catalog_ids:
+                if catalog_id in already_listed:
+                    statuses.append("duplicate")
+                else:
+                    already_listed.add(catalog_id)
+                    new_movie_rows.append({"user_id": user_id, "catalog_movie_id": catalog_id})
+                    statuses.append("added")
+            if new_movie_rows:
+                self.db.session.execute(insert(Movie), new_movie_rows)
+            self._commit()
+        except Exception:
+            self._rollback()
+            raise
+        self._bump_versions(f"user:{user_id}")
+        self._index_titles(*(row["name"] for row in new_catalog_rows.values()))
+        return statuses
+
+    @writes
+    def add_pending_movie(self, user_id: int, title: str) -> Movie:
+        """
+        Add a movie for a user by title only.
+        If the catalog already knows the title the entry is linked straight away;
+        otherwise a "pending" catalog entry is created and an enrichment job is
+        queued in the same transaction. A film whose enrichment failed is
+        queued again; if it is already on the user's list, that entry is returned.
+        Args:
+            user_id (int): User ID.
+            title (str): Title as typed by the user.
+        Raises:
+            ValueError: If the user already added the same movie.
+        Returns:
+            Movie: The newly added Movie object.
+        """
+        title = " ".join(title.split())
+        title_key = normalize_title(title)
+        try:
+            catalog_movie = (
+                CatalogMovie.query
+                .filter_by(title_key=title_key)
+                .order_by(CatalogMovie.status != 'ready', CatalogMovie.id)
+                .first()
+            )
+            existing = None
+            if catalog_movie is not None:
+                existing = Movie.query.filter_by(user_id=user_id, catalog_movie_id=catalog_movie.id).first()
+                if existing is not None and catalog_movie.status != 'failed':
+                    raise ValueError(f'You have already added the movie "{catalog_movie.name}".')
+
+            if catalog_movie is None:
+                catalog_movie = CatalogMovie(title_key=title_key, name=title, status='pending')
+                self.db.session.add(catalog_movie)
+                self.db.session.flush()
+                enqueue_job(ENRICH_MOVIE, catalog_movie.id)
+            elif catalog_movie.status == 'failed':
+                # Someone asks again: give OMDb another chance
+                catalog_movie.status = 'pending'
+                enqueue_job(ENRICH_MOVIE, catalog_movie.id)
+
+            # Re-adding one's own failed film only retries it
+            new_movie = existing or Movie(user_id=user_id, catalog=catalog_movie)
+            self.db.session.add(new_movie)
+            # A failed entry going back to pending shows up in other users' lists too
+            scopes = self._film_scopes([catalog_movie.id])
+            self._commit()
+        except Exception:
+            self._rollback()
+            raise
+        self._bump_versions(f"user:{user_id}", *scopes)
         return new_movie
 
+    def get_catalog_titles(self) -> List[str]:
+        """
+        Return the title of every catalog film whose details are known.
+        Pending and failed entries are left out: their title is whatever the user typed.
+        Returns:
+            List[str]: Film titles, one per catalog entry.
+        """
+        return self.db.session.execute(
+            select(CatalogMovie.name).where(CatalogMovie.status == 'ready')
+        ).scalars().all()
+
+    def get_catalog_ids_missing_posters(self) -> List[int]:
+        """
+        Return the catalog films whose current poster URL has not been mirrored or attempted yet.
+        Returns:
+            List[int]: Catalog entry IDs.
+        """
+        return self.db.session.execute(
+            select(CatalogMovie.id)
+            .where(or_(CatalogMovie.poster_url.like("http://%"), CatalogMovie.poster_url.like("https://%")),
+                   or_(CatalogMovie.poster_source.is_(None), CatalogMovie.poster_source != CatalogMovie.poster_url))
+            .order_by(CatalogMovie.id)
+        ).scalars().all()
+
+    @writes
+    def set_poster_mirror(self, catalog_movie_id: int, source_url: str, key: Optional[str]) -> bool:
+        """
+        Record the mirrored thumbnails of a film's poster.
+        Nothing changes if the poster URL was edited while its old value was being mirrored.
+        Args:
+            catalog_movie_id (int): Catalog entry ID.
+            source_url (str): The poster URL that was mirrored.
+            key (Optional[str]): PosterStore key of the thumbnails, or None if mirroring failed.
+        Returns:
+            bool: True if the mirror was recorded.
+        """
+        try:
+            result = self.db.session.execute(
+                update(CatalogMovie)
+                .where(CatalogMovie.id == catalog_movie_id, CatalogMovie.poster_url == source_url)
+                .values(poster_key=key, poster_source=source_url, updated_at=datetime.utcnow())
+                .execution_options(synchronize_session="fetch")
+            )
+            scopes = self._film_scopes([catalog_movie_id]) if result.rowcount else []
+            self._commit()
+        except Exception:
+            self._rollback()
+            raise
+        self._bump_versions(*scopes)
+        return bool(result.rowcount)
+
+    @request_memoized
+    def get_catalog_movie_by_id(self, catalog_movie_id: int) -> Optional[CatalogMovie]:
+        """
+        Retrieve a shared catalog entry by its ID.
+        Args:
+            catalog_movie_id (int): Catalog entry ID.
+        Returns:
+            Optional[CatalogMovie]: CatalogMovie object if found, else None.
+        """
+        return CatalogMovie.query.get(catalog_movie_id)
+
+    @writes
+    def apply_movie_details(self, catalog_movie_id: int, details: Optional[dict]) -> Optional[CatalogMovie]:
+        """
+        Complete a pending catalog entry with details fetched from OMDb.
+        If the details identify a film the catalog already has, the pending
+        entry is merged into it: users' list entries are repointed (or, where a
+        user already had the film, folded into their existing entry along with
+        any reviews) and the pending entry is removed.
+        Args:
+            catalog_movie_id (int): Catalog entry ID.
+            details (Optional[dict]): Movie details, or None to mark the entry as failed.
+        Returns:
+            Optional[CatalogMovie]: The completed catalog entry, or None if not found.
+        """
+        catalog_movie = self.get_catalog_movie_by_id(catalog_movie_id)
+        if not catalog_movie:
+            return None
+
+        try:
+            scopes = self._film_scopes([catalog_movie.id])
+            if details is None:
+                catalog_movie.status = 'failed'
+            else:
+                title_key = normalize_title(details["name"])
+                existing = None
+                if details.get("imdb_id"):
+                    existing = CatalogMovie.query.filter_by(imdb_id=details["imdb_id"]).first()
+                if existing is None:
+                    existing = CatalogMovie.query.filter_by(title_key=title_key, year=details.get("year")).first()
+
+                if existing is not None and existing.id != catalog_movie.id:
+                    scopes += self._film_scopes([existing.id], lists=False)
+                    self._merge_catalog_movie(catalog_movie, existing)
+                    catalog_movie = existing
+                else:
+                    catalog_movie.title_key = title_key
+                    catalog_movie.name = details["name"]
+                    catalog_movie.director = details.get("director")
+                    catalog_movie.year = details.get("year")
+                    catalog_movie.rating = details.get("rating")
+                    catalog_movie.poster_url = details.get("poster_url")
+                    catalog_movie.imdb_id = details.get("imdb_id") or None
+                    catalog_movie.status = 'ready'
+                    self._queue_poster_mirror(catalog_movie)
+            self._commit()
+        except Exception:
+            self._rollback()
+            raise
+        self._bump_versions(*scopes)
+        if catalog_movie.status == 'ready':
+            self._index_titles(catalog_movie.name)
+        return catalog_movie
+
+    def _merge_catalog_movie(self, source: CatalogMovie, target: CatalogMovie) -> None:
+        """Repoint every list entry of source to target and delete source (not committed)."""
+        for movie in list(source.user_movies):
+            duplicate = Movie.query.filter_by(user_id=movie.user_id, catalog_movie_id=target.id).first()
+            for review in list(movie.reviews):
+                review.catalog = target
+                if duplicate:
+                    review.movie = duplicate
+            if duplicate:
+                self.db.session.delete(movie)
+            else:
+                movie.catalog = target
+        self.db.session.flush()
+        self.db.session.delete(source)
+        # Reviews of the source entries now belong to the target film
+        self._recompute_title_stats([target.id])
+
+    @request_memoized
     def get_movie_by_id(self, movie_id: int) -> Optional[Movie]:
         """
-        Retrieve a movie by its ID.
+        Retrieve a movie by its ID, together with its owner and the film's rating stats.
         Args:
             movie_id (int): Movie ID.
         Returns:
             Optional[Movie]: Movie object if found, else None.
         """
-        return Movie.query.get(movie_id)
+        return Movie.query.options(
+            joinedload(Movie.user),
+            joinedload(Movie.catalog).joinedload(CatalogMovie.rating_stats),
+        ).get(movie_id)
 
+    @writes
     def delete_movie(self, movie_id: int) -> None:
         """
         Delete a movie by its ID.
@@ -117,12 +903,22 @@ class SQLiteDataManager(DataManagerInterface):
         movie = self.get_movie_by_id(movie_id)
         if movie:
             try:
+                # Its reviews disappear from the review pages of the same film
+                scopes = self._film_scopes([movie.catalog_movie_id], lists=False)
+                user_id = movie.user_id
+                # Deleted rows leave no timestamp behind: mark the pages that showed them as changed
+                movie.user.updated_at = movie.catalog.updated_at = datetime.utcnow()
+                removed = [(review.rating, review.created_at) for review in movie.reviews]
                 self.db.session.delete(movie)
-                self.db.session.commit()
+                if removed:
+                    self._adjust_title_stats(movie.catalog_movie_id, removed=removed)
+                self._commit()
             except Exception:
-                self.db.session.rollback()
+                self._rollback()
                 raise
+            self._bump_versions(f"user:{user_id}", *scopes)
 
+    @writes
     def update_movie(
         self,
         movie_id: int,
@@ -137,34 +933,66 @@ class SQLiteDataManager(DataManagerInterface):
         Args:
             movie_id (int): Movie ID.
             name (Optional[str]): New name.
-            director (Optional[str]): New director.
+            director (Optional[str]): New director, shown on this user's entry only.
             year (Optional[int]): New year.
             rating (Optional[float]): New rating.
-            poster_url (Optional[str]): New poster URL.
+            poster_url (Optional[str]): New poster URL, shown on this user's entry only.
         Returns:
             Optional[Movie]: Updated Movie object or None if not found.
         """
         movie = self.get_movie_by_id(movie_id)
         if not movie:
             return None
-        if name is not None:
-            movie.name = name
-        if director is not None:
-            movie.director = director
-        if year is not None:
-            movie.year = year
-        if rating is not None:
-            movie.rating = rating
-        if poster_url is not None:
-            movie.poster_url = poster_url
 
         try:
-            self.db.session.commit()
+            catalog_movie = movie.catalog
+            old_catalog_movie_id = catalog_movie.id
+            # A new title or year identifies a different film: repoint the entry
+            if (name is not None and normalize_title(name) != catalog_movie.title_key) or \
+                    (year is not None and year != catalog_movie.year):
+                # The user's director and poster follow the entry as its own values, never into the catalog
+                if director is None:
+                    director = movie.director
+                if poster_url is None:
+                    poster_url = movie.poster_url
+                catalog_movie = self._get_or_create_catalog_movie(
+                    name=name if name is not None else catalog_movie.name,
+                    year=year if year is not None else catalog_movie.year,
+                )
+                if catalog_movie.id is not None and Movie.query.filter(
+                        Movie.user_id == movie.user_id,
+                        Movie.catalog_movie_id == catalog_movie.id,
+                        Movie.id != movie.id).first():
+                    raise ValueError(f'You have already added the movie "{catalog_movie.name}".')
+                movie.catalog = catalog_movie
+                # The entry's reviews now count towards the other film
+                moved = []
+                for review in movie.reviews:
+                    review.catalog = catalog_movie
+                    moved.append((review.rating, review.created_at))
+                if moved:
+                    self._adjust_title_stats(old_catalog_movie_id, removed=moved)
+                    self._adjust_title_stats(catalog_movie.id, added=moved)
+            # Director and poster corrections only apply to this user's entry
+            if director is not None:
+                movie.user_director = director if director != catalog_movie.director else None
+            if poster_url is not None:
+                movie.user_poster_url = poster_url if poster_url != catalog_movie.poster_url else None
+            if rating is not None:
+                movie.user_rating = rating
+            self._queue_poster_mirror(catalog_movie)
+
+            # Other users' pages only change when the entry's reviews moved to another film
+            scopes = (self._film_scopes([old_catalog_movie_id, catalog_movie.id])
+                      if catalog_movie.id != old_catalog_movie_id else [])
+            self._commit()
         except Exception:
-            self.db.session.rollback()
+            self._rollback()
             raise
+        self._bump_versions(f"user:{movie.user_id}", f"movie:{movie.id}", *scopes)
         return movie
 
+    @writes
     def add_review(self, user_id: int, movie_id: int, review_text: str, rating: Optional[float] = None) -> Review:
         """
         Add a new review for a movie by a user.
@@ -175,15 +1003,23 @@ class SQLiteDataManager(DataManagerInterface):
         Returns:
             Review: The created Review object.
         """
-        review = Review(user_id=user_id, movie_id=movie_id, review_text=review_text, rating=rating)
+        # The film is copied from the entry in the same INSERT
+        catalog_movie_id = select(Movie.catalog_movie_id).where(Movie.id == movie_id).scalar_subquery()
+        review = Review(user_id=user_id, movie_id=movie_id, catalog_movie_id=catalog_movie_id,
+                        review_text=review_text, rating=rating)
         try:
             self.db.session.add(review)
-            self.db.session.commit()
+            self.db.session.flush()
+            self._adjust_title_stats(review.catalog_movie_id, added=[(review.rating, review.created_at)])
+            scopes = self._film_scopes_of_entry(movie_id)
+            self._commit()
         except Exception:
-            self.db.session.rollback()
+            self._rollback()
             raise
+        self._bump_versions(*scopes)
         return review
 
+    @request_memoized
     def get_review_by_id(self, review_id: int) -> Optional[Review]:
         """
         Retrieve a review by its ID.
@@ -194,27 +1030,266 @@ class SQLiteDataManager(DataManagerInterface):
         """
         return Review.query.get(review_id)
 
-    def get_reviews_for_movie(self, movie_id: int) -> List[Review]:
+    def get_reviews_for_movie(self, movie_id: int, after_id: Optional[int] = None,
+                              limit: Optional[int] = None) -> List[Review]:
         """
-        Retrieve all reviews for all movie records with the same name
-        (i.e., shared reviews across users who added the same-titled movie).
+        Retrieve reviews for all movie records of the same catalog film
+        (i.e., shared reviews across users who added the same movie),
+        one keyset page at a time.
         Args:
-            movie_id (int): Movie ID used to find the shared title.
+            movie_id (int): Movie ID used to find the shared catalog entry.
+            after_id (Optional[int]): Only return reviews with an ID greater than this.
+            limit (Optional[int]): Maximum number of reviews to return.
         Returns:
-            List[Review]: List of Review objects across all matching movies.
+            List[Review]: List of Review objects across all matching movies, ordered by ID.
         """
-        # Find the movie by ID
-        movie = self.get_movie_by_id(movie_id)
-        if not movie:
+        # Single query: catalog film of the given entry -> its reviews, read in page order from
+        # ix_reviews_catalog_movie_id_id, with each reviewer loaded in the same statement for the template
+        catalog_movie_id = (
+            self.db.session.query(Movie.catalog_movie_id)
+            .filter(Movie.id == movie_id)
+            .scalar_subquery()
+        )
+        return (
+            self.db.session.query(Review)
+            .filter(Review.catalog_movie_id == catalog_movie_id, Review.id > (after_id or 0))
+            .options(joinedload(Review.user))
+            .order_by(Review.id)
+            .limit(limit)
+            .all()
+        )
+
+    def get_title_stats(self, catalog_movie_id: int) -> Optional[TitleRatingStats]:
+        """
+        Retrieve the rating aggregates of a catalog film.
+        Args:
+            catalog_movie_id (int): Catalog film ID.
+        Returns:
+            Optional[TitleRatingStats]: The film's stats, or None if it has never been reviewed.
+        """
+        return TitleRatingStats.query.get(catalog_movie_id)
+
+    def get_top_rated(self, limit: int = 10, min_ratings: int = 1) -> List[TitleRatingStats]:
+        """
+        Retrieve the catalog films with the highest average review rating.
+        Walks the average_rating index of the maintained aggregates, so the
+        cost does not grow with the number of reviews.
+        Args:
+            limit (int): Maximum number of films to return.
+            min_ratings (int): Only include films rated at least this many times.
+        Returns:
+            List[TitleRatingStats]: Stats with their catalog film, best average first.
+        """
+        return (
+            TitleRatingStats.query
+            .options(joinedload(TitleRatingStats.catalog))
+            .filter(TitleRatingStats.average_rating.isnot(None), TitleRatingStats.rated_count >= min_ratings)
+            .order_by(TitleRatingStats.average_rating.desc(), TitleRatingStats.rated_count.desc())
+            .limit(limit)
+            .all()
+        )
+
+    def search(self, query: str, kind: str = "movies", limit: int = 20, offset: int = 0) -> List:
+        """
+        Full-text search over catalog films (name and director) or review texts.
+        Every word of the query is matched as a prefix and results are ranked
+        by FTS5's bm25 score. Ranked results have no ID order to key a page on,
+        so pages are addressed by offset; FTS5 ranks all matches either way.
+        Args:
+            query (str): Text typed by the user.
+            kind (str): "movies" or "reviews".
+            limit (int): Maximum number of results to return.
+            offset (int): Number of results to skip.
+        Returns:
+            List: For "movies", (CatalogMovie, movie_id) rows where movie_id is a
+            list entry of the film whose review page can be linked to; for
+            "reviews", Review objects with their author and movie loaded.
+        """
+        if kind not in SEARCH_KINDS:
+            raise ValueError(f"Unknown search kind: {kind}")
+        match = build_match_query(query)
+        if match is None:
             return []
 
-        # Find all movies with the same name
-        matching_movies = self.db.session.query(Movie).filter_by(name=movie.name).all()
-        matching_ids = [m.id for m in matching_movies]
+        if kind == "movies":
+            entry_id = (
+                select(func.min(Movie.id))
+                .where(Movie.catalog_movie_id == CatalogMovie.id)
+                .scalar_subquery()
+            )
+            # Catalog films nobody has on their list any more have no page to show
+            results = self.db.session.query(CatalogMovie, entry_id.label("movie_id")).filter(entry_id.isnot(None))
+            fts_name, key, columns = "catalog_movies_fts", CatalogMovie.id, (CatalogMovie.name, CatalogMovie.director)
+        else:
+            results = self.db.session.query(Review).options(joinedload(Review.user), joinedload(Review.movie))
+            fts_name, key, columns = "reviews_fts", Review.id, (Review.review_text,)
+
+        if self.db.engine.dialect.name == "sqlite":
+            fts = table(fts_name, column("rowid"), column("rank"))
+            results = (
+                results.join(fts, fts.c.rowid == key)
+                .filter(literal_column(fts_name).op("MATCH")(match))
+                .order_by(fts.c.rank, key)
+            )
+        else:
+            # No FTS5 outside SQLite: fall back to substring matching, newest first
+            results = results.filter(and_(*[
+                or_(*[col.ilike(f"%{word}%") for col in columns]) for word in search_terms(query)
+            ])).order_by(key.desc())
+        return results.limit(limit).offset(offset).all()
+
+    @writes
+    def rebuild_title_stats(self) -> int:
+        """
+        Recompute every film's rating aggregates from the reviews table.
+        Returns:
+            int: Number of films with reviews.
+        """
+        try:
+            count = self._recompute_title_stats()
+            self._commit()
+        except Exception:
+            self._rollback()
+            raise
+        return count
+
+    def get_reviews_for_movies(self, movie_ids: Iterable[int], limit_per_movie: int = 20,
+                               fields: Optional[Iterable[str]] = None) -> Dict[int, List[Review]]:
+        """
+        Retrieve the first reviews of many movies in one query.
+        As on the review page, a movie's reviews are those of every list entry
+        of the same catalog film. A window function caps each movie's reviews
+        inside the same IN query, so the cost does not grow with the number of movies.
+        Args:
+            movie_ids (Iterable[int]): Movie IDs.
+            limit_per_movie (int): Maximum number of reviews per movie, oldest first.
+            fields (Optional[Iterable[str]]): Only load the columns behind these
+                REVIEW_FIELD_COLUMNS fields (None loads the review and its author).
+        Returns:
+            Dict[int, List[Review]]: Reviews by requested movie ID; every requested ID is present.
+        Raises:
+            ValueError: If fields contains an unknown field.
+        """
+        movie_ids = set(movie_ids)
+        reviews = {movie_id: [] for movie_id in movie_ids}
+        if not movie_ids:
+            return reviews
+
+        requested, entry = aliased(Movie), aliased(Movie)
+        ranked = (
+            select(
+                requested.id.label("requested_id"),
+                Review.id.label("review_id"),
+                func.row_number().over(partition_by=requested.id, order_by=Review.id).label("position"),
+            )
+            .join(entry, entry.catalog_movie_id == requested.catalog_movie_id)
+            .join(Review, Review.movie_id == entry.id)
+            .where(requested.id.in_(movie_ids))
+            .subquery()
+        )
+        query = (
+            self.db.session.query(ranked.c.requested_id, Review)
+            .join(ranked, ranked.c.review_id == Review.id)
+            .filter(ranked.c.position <= limit_per_movie)
+            .order_by(ranked.c.requested_id, Review.id)
+        )
+        if fields is None:
+            query = query.options(joinedload(Review.user))
+        else:
+            unknown = set(fields) - set(REVIEW_FIELD_COLUMNS)
+            if unknown:
+                raise ValueError(f"Unknown review fields: {', '.join(sorted(unknown))}")
+            columns = [column for field in fields for column in REVIEW_FIELD_COLUMNS[field]]
+            query = query.options(load_only(Review.id, *_columns_of(Review, columns)))
+            if _columns_of(User, columns):
+                query = query.options(joinedload(Review.user).load_only(User.id, *_columns_of(User, columns)))
 
-        # Return all reviews for those movie IDs
-        return self.db.session.query(Review).filter(Review.movie_id.in_(matching_ids)).all()
+        for requested_id, review in query:
+            reviews[requested_id].append(review)
+        return reviews
 
+    def _stream_rows(self, statement, batch_size: int) -> Tuple[List[str], Iterator[tuple]]:
+        """
+        Execute a select and return its column names and a lazy row iterator.
+        yield_per streams the result from a server-side cursor batch_size rows
+        at a time, and plain column rows bypass the identity map, so memory
+        stays flat however many rows there are.
+        """
+        result = self.db.session.execute(statement, execution_options={"yield_per": batch_size})
+        return list(result.keys()), (tuple(row) for row in result)
+
+    def export_user_movies(self, user_id: int,
+                           batch_size: int = EXPORT_BATCH_SIZE) -> Tuple[List[str], Iterator[tuple]]:
+        """
+        Stream a user's list entries together with their catalog film details.
+        Args:
+            user_id (int): User ID.
+            batch_size (int): Rows fetched per round trip.
+        Returns:
+            Tuple[List[str], Iterator[tuple]]: Column names and rows ordered by entry ID.
+            The iterator must be consumed inside the same app context.
+        """
+        return self._stream_rows(
+            select(
+                Movie.id, CatalogMovie.name,
+                func.coalesce(Movie.user_director, CatalogMovie.director).label("director"), CatalogMovie.year,
+                CatalogMovie.imdb_id, CatalogMovie.rating.label("imdb_rating"), Movie.user_rating,
+                func.coalesce(Movie.user_poster_url, CatalogMovie.poster_url).label("poster_url"),
+                CatalogMovie.status, Movie.updated_at,
+            )
+            .join(CatalogMovie, Movie.catalog_movie_id == CatalogMovie.id)
+            .where(Movie.user_id == user_id)
+            .order_by(Movie.id),
+            batch_size,
+        )
+
+    def export_user_reviews(self, user_id: int,
+                            batch_size: int = EXPORT_BATCH_SIZE) -> Tuple[List[str], Iterator[tuple]]:
+        """
+        Stream the reviews a user wrote, with the title of the reviewed film.
+        Args:
+            user_id (int): User ID.
+            batch_size (int): Rows fetched per round trip.
+        Returns:
+            Tuple[List[str], Iterator[tuple]]: Column names and rows ordered by review ID.
+            The iterator must be consumed inside the same app context.
+        """
+        return self._stream_rows(
+            select(
+                Review.id, Review.movie_id, CatalogMovie.name.label("movie_name"), CatalogMovie.year,
+                Review.rating, Review.review_text, Review.created_at, Review.updated_at,
+            )
+            .join(Movie, Review.movie_id == Movie.id)
+            .join(CatalogMovie, Movie.catalog_movie_id == CatalogMovie.id)
+            .where(Review.user_id == user_id)
+            .order_by(Review.id),
+            batch_size,
+        )
+
+    def export_table_names(self) -> List[str]:
+        """Return the tables export_table accepts: every mapped table, parents first."""
+        return [table.name for table in self.db.metadata.sorted_tables]
+
+    def export_table(self, table_name: str,
+                     batch_size: int = EXPORT_BATCH_SIZE) -> Tuple[List[str], Iterator[tuple]]:
+        """
+        Stream every row of a table, ordered by primary key.
+        Args:
+            table_name (str): One of export_table_names().
+            batch_size (int): Rows fetched per round trip.
+        Returns:
+            Tuple[List[str], Iterator[tuple]]: Column names and rows.
+            The iterator must be consumed inside the same app context.
+        Raises:
+            ValueError: If the table is unknown.
+        """
+        if table_name not in self.export_table_names():
+            raise ValueError(f"Unknown table: {table_name}. "
+                             f"Available: {', '.join(self.export_table_names())}.")
+        table = self.db.metadata.tables[table_name]
+        return self._stream_rows(select(table).order_by(*table.primary_key.columns), batch_size)
+
+    @writes
     def update_review(self, review_id: int, review_text: str, rating: Optional[float] = None) -> Optional[Review]:
         """
         Update a review's text and optional rating.
@@ -228,16 +1303,22 @@ class SQLiteDataManager(DataManagerInterface):
         review = self.get_review_by_id(review_id)
         if review:
             review.review_text = review_text
-            if rating is not None:
-                review.rating = rating
             try:
-                self.db.session.commit()
+                if rating is not None and rating != review.rating:
+                    self._adjust_title_stats(review.movie.catalog_movie_id,
+                                             added=[(rating, review.created_at)],
+                                             removed=[(review.rating, review.created_at)])
+                    review.rating = rating
+                scopes = self._film_scopes_of_entry(review.movie_id)
+                self._commit()
             except Exception:
-                self.db.session.rollback()
+                self._rollback()
                 raise
+            self._bump_versions(*scopes)
             return review
         return None
 
+    @writes
     def delete_review(self, review_id: int) -> None:
         """
         Delete a review by ID.
@@ -247,12 +1328,18 @@ class SQLiteDataManager(DataManagerInterface):
         review = self.get_review_by_id(review_id)
         if review:
             try:
+                scopes = self._film_scopes_of_entry(review.movie_id)
+                review.movie.catalog.updated_at = datetime.utcnow()
                 self.db.session.delete(review)
-                self.db.session.commit()
+                self._adjust_title_stats(review.movie.catalog_movie_id,
+                                         removed=[(review.rating, review.created_at)])
+                self._commit()
             except Exception:
-                self.db.session.rollback()
+                self._rollback()
                 raise
+            self._bump_versions(*scopes)
 
+    @writes
     def delete_user(self, user_id: int) -> None:
         """
         Delete a user and all associated data.
@@ -262,8 +1349,29 @@ class SQLiteDataManager(DataManagerInterface):
         user = self.get_user_by_id(user_id)
         if user:
             try:
+                # Their entries and reviews disappear from every review page of those films
+                listed = self.db.session.query(Movie.catalog_movie_id).filter(Movie.user_id == user_id)
+                reviewed = (
+                    self.db.session.query(Movie.catalog_movie_id)
+                    .join(Review, Review.movie_id == Movie.id)
+                    .filter(Review.user_id == user_id)
+                )
+                film_ids = [row[0] for row in listed.union(reviewed)]
+                scopes = self._film_scopes(film_ids, lists=False)
+                if film_ids:
+                    self.db.session.execute(
+                        update(CatalogMovie)
+                        .where(CatalogMovie.id.in_(film_ids))
+                        .values(updated_at=datetime.utcnow())
+                    )
                 self.db.session.delete(user)
-                self.db.session.commit()
+                if film_ids:
+                    self._recompute_title_stats(film_ids)
+                self._commit()
             except Exception:
-                self.db.session.rollback()
-                raise
\ No newline at end of file
+                self._rollback()
+                raise
+            self._bump_versions("users", f"user:{user_id}", *scopes)
+            if self.session_store is not None:
+                # Their cached session profile would otherwise keep them logged in
+                self._after_commit(lambda: self.session_store.delete_user(user_id))
\ No newline at end of file
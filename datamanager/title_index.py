@@ -0,0 +1,99 @@
+import threading
+from bisect import bisect_left, insort
+from typing import Callable, Iterable, List
+from datamanager.utils import normalize_title
+
+# Leading articles also indexed without the article, so "godf" finds "The Godfather"
+ARTICLES = ("the ", "a ", "an ")
+
+
+class TitleIndex:
+    """In-memory prefix index of movie titles for autocomplete.
+    Titles are kept as a sorted list of (normalized key, title) pairs: a prefix
+    lookup is one bisect plus a short forward scan, and adding a title is a
+    bisect insertion. The index is built lazily on first use from a loader
+    (catalog names plus cached OMDb titles) and then kept current with add().
+    Every process has its own copy; titles added by other workers appear
+    after a restart.
+    """
+
+    def __init__(self, loader: Callable[[], Iterable[str]]):
+        """
+        Args:
+            loader (Callable[[], Iterable[str]]): Returns every title to index;
+                called once, on the first lookup.
+        """
+        self._loader = loader
+        self._entries = []
+        self._keys = set()
+        self._built = False
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _ensure_built(self) -> None:
+        if self._built:
+            return
+        with self._lock:
+            if self._built:
+                return
+            entries, keys = set(), set()
+            for title in self._loader():
+                self._entries_for(title, entries, keys)
+            self._entries = sorted(entries)
+            self._keys = keys
+            self._built = True
+
+    @staticmethod
+    def _entries_for(title: str, entries, keys) -> None:
+        title = " ".join((title or "").split())
+        key = normalize_title(title)
+        if not key or key in keys:
+            return
+        keys.add(key)
+        entries.add((key, title))
+        for article in ARTICLES:
+            if key.startswith(article) and len(key) > len(article):
+                entries.add((key[len(article):], title))
+
+    def add(self, titles: Iterable[str]) -> None:
+        """
+        Index new titles (no-op until the index has been built, since the build will include them).
+        Args:
+            titles (Iterable[str]): Movie titles, e.g. of films just added to the catalog.
+        """
+        if not self._built:
+            return
+        with self._lock:
+            entries = set()
+            for title in titles:
+                self._entries_for(title, entries, self._keys)
+            for entry in entries:
+                insort(self._entries, entry)
+
+    def suggest(self, prefix: str, limit: int = 10) -> List[str]:
+        """
+        Return indexed titles starting with prefix, in alphabetical order.
+        Args:
+            prefix (str): What the user typed so far (case and spacing are ignored).
+            limit (int): Maximum number of titles to return.
+        Returns:
+            List[str]: Matching titles, without duplicates.
+        """
+        key = normalize_title(prefix)
+        if not key:
+            return []
+        self._ensure_built()
+        with self._lock:
+            results, seen = [], set()
+            i = bisect_left(self._entries, (key,))
+            while i < len(self._entries) and len(results) < limit:
+                entry_key, title = self._entries[i]
+                if not entry_key.startswith(key):
+                    break
+                if title not in seen:
+                    seen.add(title)
+                    results.append(title)
+                i += 1
+            return results
@@ -0,0 +1,150 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Optional
+from flask import g, has_app_context
+from models.app_models import db
+
+
+class UnitOfWork:
+    """State of the unit of work open in the current app context (see SQLiteDataManager.unit_of_work).
+    Attributes:
+        savepoint (Optional[SessionTransaction]): Savepoint of the write being run, if the
+            caller isolates writes from one another (the group committer does).
+        failed (bool): A write failed outside a savepoint; the unit can only be rolled back.
+        after_commit (List[callable]): Cache invalidations and index updates to run once committed.
+    """
+
+    def __init__(self):
+        self.savepoint = None
+        self.failed = False
+        self.after_commit = []
+
+
+def current_unit_of_work() -> Optional[UnitOfWork]:
+    """Return the unit of work open in the current app context, or None."""
+    return g.get("_unit_of_work") if has_app_context() else None
+
+
+class GroupCommitter:
+    """Runs data manager writes from every thread on one writer thread and commits them in groups.
+    A write submitted while the writer is idle starts a group; writes arriving
+    within the next `window` seconds (up to max_batch) join it. The group runs
+    in one unit of work, each write inside its own savepoint, so a failing
+    write is undone alone and reported to its caller, and the whole group
+    costs a single commit (one fsync on SQLite) instead of one per write.
+    Callers block until their group is committed, so a write that returned
+    is durable, as without group commit.
+    """
+
+    _STOP = object()
+
+    def __init__(self, app, window: float = 0.005, max_batch: int = 64):
+        """
+        Args:
+            app (Flask): Application whose data manager runs the writes.
+            window (float): Seconds the writer waits for more writes after the first one of a group.
+            max_batch (int): Most writes committed together.
+        """
+        self.app = app
+        self.window = window
+        self.max_batch = max_batch
+        self._queue = queue.Queue()
+        self._thread = None
+
+    def start(self) -> None:
+        """Start the writer thread."""
+        self._thread = threading.Thread(target=self._loop, name="group-commit", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Commit the writes already submitted and stop the writer thread."""
+        if self._thread is not None:
+            self._queue.put(self._STOP)
+            self._thread.join(timeout)
+            self._thread = None
+
+    def accepts(self) -> bool:
+        """Return True if a write made now by this thread should go through the writer."""
+        thread = self._thread
+        return (thread is not None and thread.is_alive() and threading.current_thread() is not thread
+                and current_unit_of_work() is None)
+
+    def submit(self, write, args: tuple, kwargs: dict):
+        """
+        Run a data manager write on the writer thread and wait until its group is committed.
+        Args:
+            write (callable): The data manager method, called with args and kwargs.
+            args (tuple): Positional arguments (the data manager first).
+            kwargs (dict): Keyword arguments.
+        Returns:
+            The write's result; ORM objects are still bound to the writer thread's session.
+        Raises:
+            Exception: Whatever the write raised, or the error of the group's commit.
+        """
+        future = Future()
+        self._queue.put((write, args, kwargs, future))
+        result = future.result()
+        # Objects this thread loaded earlier may predate the write
+        db.session.expire_all()
+        return result
+
+    def _collect(self) -> Optional[list]:
+        first = self._queue.get()
+        if first is self._STOP:
+            return None
+        batch = [first]
+        deadline = time.monotonic() + self.window
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is self._STOP:
+                # Finish this group, then stop
+                self._queue.put(item)
+                break
+            batch.append(item)
+        return batch
+
+    def _loop(self) -> None:
+        while True:
+            batch = self._collect()
+            if batch is None:
+                return
+            try:
+                self._run_group(batch)
+            except Exception as e:
+                self.app.logger.error(f"Group commit failed: {e}")
+                for *_, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+
+    def _run_group(self, batch: list) -> None:
+        outcomes = []
+        with self.app.app_context():
+            with self.app.data_manager.unit_of_work() as unit:
+                for write, args, kwargs, future in batch:
+                    pending_callbacks = len(unit.after_commit)
+                    unit.savepoint = db.session.begin_nested()
+                    try:
+                        result = write(*args, **kwargs)
+                        if unit.savepoint.is_active:
+                            unit.savepoint.commit()
+                        outcomes.append((future, result, None))
+                    except Exception as e:
+                        if unit.savepoint.is_active:
+                            unit.savepoint.rollback()
+                        del unit.after_commit[pending_callbacks:]
+                        outcomes.append((future, None, e))
+                    finally:
+                        unit.savepoint = None
+        for future, result, error in outcomes:
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)
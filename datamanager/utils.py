@@ -1,57 +1,134 @@
 import os
-import requests
 from dotenv import load_dotenv
+from datamanager.omdb_cache import OMDbCache, NOT_FOUND
+from datamanager.omdb_client import OMDbClient, OMDbError, OMDbUnavailable, TokenBucket, CircuitBreaker
+from datamanager.offline_index import OfflineTitleIndex
 
 load_dotenv()
 
 OMDB_API_KEY = os.getenv('OMDB_API_KEY')
-OMDB_URL = "http://www.omdbapi.com/"
+OMDB_URL = os.getenv("OMDB_URL", "http://www.omdbapi.com/")
 
-def fetch_movie_details(title: str) -> dict | None:
+# Cache in front of OMDb; memory only until create_app configures it from OMDB_CACHE_* settings
+omdb_cache = OMDbCache()
+
+# Local title index built by `flask build-title-index`, consulted before the cache and OMDb;
+# with OMDB_OFFLINE_ONLY titles missing from it are reported as not found without any request
+OMDB_OFFLINE_INDEX_PATH = os.getenv("OMDB_OFFLINE_INDEX_PATH", "omdb_titles.idx")
+OMDB_OFFLINE_ONLY = os.getenv("OMDB_OFFLINE_ONLY", "false").lower() == "true"
+offline_index = OfflineTitleIndex(OMDB_OFFLINE_INDEX_PATH) if OMDB_OFFLINE_INDEX_PATH else None
+
+# One client per process, shared by web requests, imports and background jobs
+omdb_client = OMDbClient(
+    OMDB_API_KEY,
+    OMDB_URL,
+    rate_limiter=TokenBucket(
+        rate=float(os.getenv("OMDB_RATE_LIMIT", "10")),
+        capacity=int(os.getenv("OMDB_RATE_BURST", "10")),
+        max_wait=float(os.getenv("OMDB_RATE_MAX_WAIT", "2")),
+    ),
+    circuit_breaker=CircuitBreaker(
+        failure_threshold=int(os.getenv("OMDB_BREAKER_FAILURES", "5")),
+        reset_timeout=float(os.getenv("OMDB_BREAKER_RESET", "30")),
+        slow_call_seconds=float(os.getenv("OMDB_SLOW_CALL_SECONDS", "2")),
+    ),
+    max_connections=int(os.getenv("OMDB_MAX_CONNECTIONS", "8")),
+    timeout=float(os.getenv("OMDB_TIMEOUT", "5")),
+)
+
+
+def normalize_title(title: str) -> str:
     """
-    Fetch movie details from the OMDb API based on the movie title.
+    Normalize a movie title for use as a lookup key.
+    Args:
+        title (str): Title as typed by the user or returned by OMDb.
+    Returns:
+        str: Case-folded title with surrounding and repeated whitespace removed.
+    """
+    return " ".join(title.split()).casefold()
+
+
+def _local_details(key: str):
+    """Return (hit, details) for a normalized title from the offline index, then omdb_cache."""
+    if offline_index is not None:
+        details = offline_index.get(key)
+        if details is not None:
+            return True, details
+        if OMDB_OFFLINE_ONLY:
+            return True, None
+    cached = omdb_cache.get(key)
+    if cached is NOT_FOUND:
+        return True, None
+    if cached is not None:
+        return True, dict(cached)
+    return False, None
+
+
+def lookup_movie_details(title: str, max_wait: float | None = None) -> dict | None:
+    """
+    Look up movie details in the offline title index, then omdb_cache, then on OMDb through omdb_client.
+    Unlike fetch_movie_details, transport failures are raised rather than
+    reported as "not found", so callers that retry can tell the two apart.
     Args:
         title (str): The movie title to search for.
+        max_wait (float | None): Longest wait for an OMDb rate-limit token (default: OMDB_RATE_MAX_WAIT).
     Returns:
-        dict or None: A dictionary of movie details if found, otherwise None.
+        dict or None: A dictionary of movie details if found, None if OMDb has no such movie.
+    Raises:
+        OMDbError: If the request to OMDb failed or was not sent (OMDbUnavailable).
     """
+    key = normalize_title(title)
+    hit, details = _local_details(key)
+    if hit:
+        return details
 
     if not OMDB_API_KEY:
         raise ValueError("OMDB_API_KEY is not set in environment variables.")
 
-    params = {"t": title, "apikey": OMDB_API_KEY}
+    # Failures are not cached so the next attempt retries
+    details = omdb_client.lookup(title, max_wait=max_wait)
+    omdb_cache.set(key, details)
+    return dict(details) if details else None
+
 
+async def lookup_movie_details_async(title: str, max_wait: float | None = None) -> dict | None:
+    """
+    Asyncio version of lookup_movie_details, sharing its index, cache and client.
+    Args:
+        title (str): The movie title to search for.
+        max_wait (float | None): Longest wait for an OMDb rate-limit token (default: OMDB_RATE_MAX_WAIT).
+    Returns:
+        dict or None: A dictionary of movie details if found, None if OMDb has no such movie.
+    Raises:
+        OMDbError: If the request to OMDb failed or was not sent (OMDbUnavailable).
+    """
+    key = normalize_title(title)
+    hit, details = _local_details(key)
+    if hit:
+        return details
+
+    if not OMDB_API_KEY:
+        raise ValueError("OMDB_API_KEY is not set in environment variables.")
+
+    details = await omdb_client.lookup_async(title, max_wait=max_wait)
+    omdb_cache.set(key, details)
+    return dict(details) if details else None
+
+
+def fetch_movie_details(title: str) -> dict | None:
+    """
+    Fetch movie details from the OMDb API based on the movie title.
+    Titles in the offline title index, and results (including "not found"
+    answers) with a fresh omdb_cache entry, are answered locally, so OMDb is
+    only contacted when both miss.
+    Args:
+        title (str): The movie title to search for.
+    Returns:
+        dict or None: A dictionary of movie details if found, otherwise None.
+    """
     try:
-        response = requests.get(OMDB_URL, params=params, timeout=5)
-        response.raise_for_status()
-        data = response.json()
-
-        if data.get("Response") == "False":
-            # Movie not found
-            return None
-
-        # Extract year (handle ranges)
-        year_raw = data.get("Year")
-        year = None
-        if year_raw:
-            year = int(year_raw.split("–")[0])
-
-        # Extract rating safely
-        rating_raw = data.get("imdbRating")
-        try:
-            rating = float(rating_raw) if rating_raw and rating_raw != "N/A" else None
-        except (ValueError, TypeError):
-            rating = None
-
-        return {
-            "name": data.get("Title"),
-            "director": data.get("Director"),
-            "year": year,
-            "rating": rating,
-            "poster_url": data.get("Poster")
-        }
-
-    except requests.RequestException as e:
+        return lookup_movie_details(title)
+    except OMDbError as e:
         # Log the error
         print(f"Error fetching movie data from OMDb API: {e}")
-        return None
\ No newline at end of file
+        return None
@@ -0,0 +1,62 @@
+"""Add FTS5 search index over catalog movies and reviews
+
+Revision ID: 5a7d2e9c4b61
+Revises: c3e1f0a9d27b
+Create Date: 2026-10-18 17:05:12.660318
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5a7d2e9c4b61'
+down_revision = 'c3e1f0a9d27b'
+branch_labels = None
+depends_on = None
+
+# fts table -> (source table, indexed columns)
+SEARCH_TABLES = {
+    'catalog_movies_fts': ('catalog_movies', ('name', 'director')),
+    'reviews_fts': ('reviews', ('review_text',)),
+}
+
+
+def upgrade():
+    # FTS5 is SQLite only; other databases fall back to LIKE matching in the data manager
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    for fts, (source, columns) in SEARCH_TABLES.items():
+        column_list = ', '.join(columns)
+        new_values = ', '.join(f'new.{column}' for column in columns)
+        old_values = ', '.join(f'old.{column}' for column in columns)
+        op.execute(
+            f"CREATE VIRTUAL TABLE {fts} USING fts5({column_list}, content='{source}', content_rowid='id', "
+            f"tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+        )
+        op.execute(
+            f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {source} BEGIN "
+            f"INSERT INTO {fts}(rowid, {column_list}) VALUES (new.id, {new_values}); END"
+        )
+        op.execute(
+            f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {source} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, {column_list}) VALUES ('delete', old.id, {old_values}); END"
+        )
+        op.execute(
+            f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {column_list} ON {source} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, {column_list}) VALUES ('delete', old.id, {old_values}); "
+            f"INSERT INTO {fts}(rowid, {column_list}) VALUES (new.id, {new_values}); END"
+        )
+        # Index the rows that already exist
+        op.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    for fts in reversed(list(SEARCH_TABLES)):
+        for suffix in ('au', 'ad', 'ai'):
+            op.execute(f"DROP TRIGGER IF EXISTS {fts}_{suffix}")
+        op.execute(f"DROP TABLE IF EXISTS {fts}")
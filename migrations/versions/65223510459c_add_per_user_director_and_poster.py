@@ -0,0 +1,32 @@
+"""Add per-user director and poster columns to user_movies
+
+Revision ID: 65223510459c
+Revises: e8b4c2d61f03
+Create Date: 2026-10-18 21:05:37.402118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '65223510459c'
+down_revision = 'e8b4c2d61f03'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # dfcdcf6aedb1 now keeps these columns with each user's own values; only databases
+    # upgraded by its earlier version, which dropped them, still need them added back.
+    # Plain ADD COLUMN rather than a batch migration: recreating user_movies
+    # on SQLite would have to rebuild the reviews foreign keys pointing at it
+    existing = {column['name'] for column in sa.inspect(op.get_bind()).get_columns('user_movies')}
+    for name in ('director', 'poster_url'):
+        if name not in existing:
+            op.add_column('user_movies', sa.Column(name, sa.String(length=255), nullable=True))
+
+
+def downgrade():
+    # The columns belong to dfcdcf6aedb1, whose downgrade folds them back into movies
+    pass
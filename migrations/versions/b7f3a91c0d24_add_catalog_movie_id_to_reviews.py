@@ -0,0 +1,33 @@
+"""Add catalog_movie_id to reviews for paging a film's reviews
+
+Revision ID: b7f3a91c0d24
+Revises: 65223510459c
+Create Date: 2026-10-18 22:14:51.630447
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7f3a91c0d24'
+down_revision = '65223510459c'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Plain ADD COLUMN rather than a batch migration: recreating reviews
+    # on SQLite would drop the FTS5 triggers defined on it. The column has
+    # no REFERENCES clause here, so the downgrade can still drop it
+    op.add_column('reviews', sa.Column('catalog_movie_id', sa.Integer(), nullable=True))
+    op.execute(
+        "UPDATE reviews SET catalog_movie_id = "
+        "(SELECT catalog_movie_id FROM user_movies WHERE user_movies.id = reviews.movie_id)"
+    )
+    op.create_index('ix_reviews_catalog_movie_id_id', 'reviews', ['catalog_movie_id', 'id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_reviews_catalog_movie_id_id', table_name='reviews')
+    op.drop_column('reviews', 'catalog_movie_id')
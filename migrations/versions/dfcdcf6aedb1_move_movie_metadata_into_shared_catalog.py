@@ -0,0 +1,119 @@
+"""Move movie metadata into a shared catalog_movies table
+
+Revision ID: dfcdcf6aedb1
+Revises: 9278610d82bf
+Create Date: 2026-10-18 10:12:41.502318
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'dfcdcf6aedb1'
+down_revision = '9278610d82bf'
+branch_labels = None
+depends_on = None
+
+
+def _title_key(name):
+    # Frozen copy of datamanager.utils.normalize_title at the time of this revision
+    return " ".join(name.split()).casefold()
+
+
+def upgrade():
+    catalog_movies = op.create_table('catalog_movies',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('imdb_id', sa.String(length=20), nullable=True),
+    sa.Column('title_key', sa.String(length=255), nullable=False),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('director', sa.String(length=255), nullable=True),
+    sa.Column('year', sa.Integer(), nullable=True),
+    sa.Column('rating', sa.Float(), nullable=True),
+    sa.Column('poster_url', sa.String(length=255), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('imdb_id'),
+    sa.UniqueConstraint('title_key', 'year', name='uix_catalog_title_year')
+    )
+    with op.batch_alter_table('movies', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('catalog_movie_id', sa.Integer(), nullable=True))
+
+    # Deduplicate existing per-user rows into one catalog entry per normalized title and year
+    conn = op.get_bind()
+    rows = conn.execute(sa.text(
+        "SELECT id, user_id, name, director, year, rating, poster_url FROM movies ORDER BY id"
+    )).fetchall()
+
+    catalog_rows = {}
+    kept_by_user = {}
+    for row in rows:
+        key = (_title_key(row.name), row.year)
+        if key not in catalog_rows:
+            catalog_rows[key] = {
+                'id': len(catalog_rows) + 1,
+                'imdb_id': None,
+                'title_key': key[0],
+                'name': row.name,
+                'director': row.director,
+                'year': row.year,
+                'rating': row.rating,
+                'poster_url': row.poster_url,
+            }
+    op.bulk_insert(catalog_movies, list(catalog_rows.values()))
+
+    for row in rows:
+        catalog = catalog_rows[(_title_key(row.name), row.year)]
+        kept_id = kept_by_user.setdefault((row.user_id, catalog['id']), row.id)
+        if kept_id != row.id:
+            # Same user added the same film twice under different spellings
+            conn.execute(sa.text("UPDATE reviews SET movie_id = :kept WHERE movie_id = :dup"),
+                         {'kept': kept_id, 'dup': row.id})
+            conn.execute(sa.text("DELETE FROM movies WHERE id = :dup"), {'dup': row.id})
+            continue
+        # Details copied from OMDb now live on the catalog; keep only the values that differ from it
+        overrides = {field: None if row._mapping[field] == catalog[field] else row._mapping[field]
+                     for field in ('rating', 'director', 'poster_url')}
+        conn.execute(sa.text("UPDATE movies SET catalog_movie_id = :catalog_id, rating = :rating, "
+                             "director = :director, poster_url = :poster_url WHERE id = :id"),
+                     {'catalog_id': catalog['id'], 'id': row.id, **overrides})
+
+    with op.batch_alter_table('movies', schema=None) as batch_op:
+        batch_op.drop_constraint('uix_user_movie', type_='unique')
+        batch_op.alter_column('catalog_movie_id',
+               existing_type=sa.Integer(),
+               nullable=False)
+        batch_op.create_foreign_key('fk_user_movies_catalog_movie_id', 'catalog_movies', ['catalog_movie_id'], ['id'])
+        batch_op.create_unique_constraint('uix_user_movie', ['user_id', 'catalog_movie_id'])
+        batch_op.drop_column('name')
+        batch_op.drop_column('year')
+
+    op.rename_table('movies', 'user_movies')
+
+
+def downgrade():
+    op.rename_table('user_movies', 'movies')
+
+    with op.batch_alter_table('movies', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('name', sa.String(length=255), nullable=True))
+        batch_op.add_column(sa.Column('year', sa.Integer(), nullable=True))
+
+    op.execute(
+        "UPDATE movies SET "
+        "name = (SELECT name FROM catalog_movies c WHERE c.id = movies.catalog_movie_id), "
+        "director = COALESCE(director, (SELECT director FROM catalog_movies c WHERE c.id = movies.catalog_movie_id)), "
+        "year = (SELECT year FROM catalog_movies c WHERE c.id = movies.catalog_movie_id), "
+        "poster_url = COALESCE(poster_url, "
+        "(SELECT poster_url FROM catalog_movies c WHERE c.id = movies.catalog_movie_id)), "
+        "rating = COALESCE(rating, (SELECT rating FROM catalog_movies c WHERE c.id = movies.catalog_movie_id))"
+    )
+
+    with op.batch_alter_table('movies', schema=None) as batch_op:
+        batch_op.drop_constraint('uix_user_movie', type_='unique')
+        batch_op.drop_constraint('fk_user_movies_catalog_movie_id', type_='foreignkey')
+        batch_op.alter_column('name',
+               existing_type=sa.String(length=255),
+               nullable=False)
+        batch_op.create_unique_constraint('uix_user_movie', ['user_id', 'name'])
+        batch_op.drop_column('catalog_movie_id')
+
+    op.drop_table('catalog_movies')
@@ -0,0 +1,28 @@
+"""Add poster mirror columns to catalog_movies
+
+Revision ID: e8b4c2d61f03
+Revises: 5a7d2e9c4b61
+Create Date: 2026-10-18 19:42:08.113902
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e8b4c2d61f03'
+down_revision = '5a7d2e9c4b61'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Plain ADD COLUMN rather than a batch migration: recreating catalog_movies
+    # on SQLite would drop the FTS5 triggers defined on it
+    op.add_column('catalog_movies', sa.Column('poster_key', sa.String(length=80), nullable=True))
+    op.add_column('catalog_movies', sa.Column('poster_source', sa.String(length=255), nullable=True))
+
+
+def downgrade():
+    op.drop_column('catalog_movies', 'poster_source')
+    op.drop_column('catalog_movies', 'poster_key')
@@ -1,7 +1,9 @@
 from flask_sqlalchemy import SQLAlchemy
 from datetime import datetime
+from datamanager.replica_routing import RoutingSession
 
-db = SQLAlchemy()
+# RoutingSession sends reads to read replicas when DATABASE_REPLICA_URLS is set
+db = SQLAlchemy(session_options={"class_": RoutingSession})
 
 class User(db.Model):
     """Represents a user of the MovieWeb app.
@@ -9,6 +11,7 @@ class User(db.Model):
         id (int): Primary key, unique identifier for the user.
         name (str): The name of the user.
         email (str): User's unique email address.
+        updated_at (datetime): Timestamp of the last change, used to validate cached pages.
         movies (List[Movie]): List of movies added by the user.
         reviews (List[Review]): List of reviews written by the user.
     """
@@ -18,6 +21,7 @@ class User(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
     email = db.Column(db.String(120), unique=True, nullable=False)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships:
     # movies: One-to-many relationship with Movie, deletes movies if user is deleted
@@ -29,41 +33,134 @@ class User(db.Model):
         return f"<User {self.id}: {self.name}>"
 
 
-class Movie(db.Model):
-    """Represents a movie entry created by a user.
+class CatalogMovie(db.Model):
+    """Represents a film in the shared movie catalog.
+    Metadata fetched from OMDb is stored once per film here instead of once
+    per user; users reference catalog entries through Movie rows.
     Attributes:
-        id (int): Primary key, unique identifier for the movie.
-        user_id (int): Foreign key to the user who added the movie.
+        id (int): Primary key, unique identifier for the catalog entry.
+        imdb_id (str): OMDb/IMDb identifier, if known.
+        title_key (str): Normalized title used to match entries without an imdb_id.
         name (str): Title of the movie.
         director (str): Director of the movie.
         year (int): Release year of the movie.
-        rating (float): Rating given to the movie by the user.
+        rating (float): IMDb rating reported by OMDb.
         poster_url (str): URL to the movie poster image.
-        user (User): The user who added the movie.
-        reviews (List[Review]): List of reviews associated with this movie
+        poster_key (str): Content-addressed name of the locally mirrored poster thumbnails, if any.
+        poster_source (str): The poster_url that was mirrored (or last attempted); the mirror
+            is only used while it still matches poster_url.
+        status (str): "ready", or "pending"/"failed" while details are fetched in the background.
+        updated_at (datetime): Timestamp of the last change, used to validate cached pages.
+        user_movies (List[Movie]): Users' list entries pointing at this film.
+        rating_stats (TitleRatingStats): Review aggregates of the film, if it has been reviewed.
     Notes:
-        - There is a uniqueness constraint ensuring a user cannot add the same movie name twice.
-        - Cascade delete is enabled so deleting a movie removes its reviews automatically..
+        - Entries are unique by imdb_id, and by normalized title plus year.
     """
 
-    __tablename__ = 'movies'
+    __tablename__ = 'catalog_movies'
     id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    imdb_id = db.Column(db.String(20), unique=True)
+    title_key = db.Column(db.String(255), nullable=False)
     name = db.Column(db.String(255), nullable=False)
     director = db.Column(db.String(255))
     year = db.Column(db.Integer)
     rating = db.Column(db.Float)
     poster_url = db.Column(db.String(255))
+    poster_key = db.Column(db.String(80))
+    poster_source = db.Column(db.String(255))
+    status = db.Column(db.String(20), nullable=False, default='ready', server_default='ready')
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     __table_args__ = (
-        db.UniqueConstraint('user_id', 'name', name='uix_user_movie'),
+        db.UniqueConstraint('title_key', 'year', name='uix_catalog_title_year'),
+    )
+
+    user_movies = db.relationship("Movie", back_populates="catalog")
+    rating_stats = db.relationship("TitleRatingStats", back_populates="catalog", uselist=False,
+                                   cascade="all, delete-orphan")
+
+    @property
+    def poster_mirror(self):
+        """Key of the mirrored thumbnails of the current poster, or None to use poster_url."""
+        if self.poster_key and self.poster_source == self.poster_url:
+            return self.poster_key
+        return None
+
+    def __repr__(self):
+        return f"<CatalogMovie {self.id}: {self.name} ({self.year})>"
+
+
+class Movie(db.Model):
+    """Represents a movie on a user's list.
+    This is a thin join row between a user and a CatalogMovie; the film's
+    metadata is read through from the catalog entry, except where the user
+    corrected it for their own list.
+    Attributes:
+        id (int): Primary key, unique identifier for the list entry.
+        user_id (int): Foreign key to the user who added the movie.
+        catalog_movie_id (int): Foreign key to the shared catalog entry.
+        user_rating (float): Rating given to the movie by the user, if any.
+        user_director (str): Director as corrected by the user, if it differs from the catalog.
+        user_poster_url (str): Poster URL chosen by the user, if it differs from the catalog.
+        updated_at (datetime): Timestamp of the last change, used to validate cached pages.
+        user (User): The user who added the movie.
+        catalog (CatalogMovie): The shared catalog entry.
+        reviews (List[Review]): List of reviews associated with this movie
+    Notes:
+        - There is a uniqueness constraint ensuring a user cannot add the same film twice.
+        - Cascade delete is enabled so deleting a movie removes its reviews automatically.
+        - name and year come from the catalog; rating, director and poster_url are
+          the user's own values, falling back to the catalog's.
+    """
+
+    __tablename__ = 'user_movies'
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False, index=True)
+    catalog_movie_id = db.Column(db.Integer, db.ForeignKey('catalog_movies.id'), nullable=False, index=True)
+    user_rating = db.Column('rating', db.Float)
+    user_director = db.Column('director', db.String(255))
+    user_poster_url = db.Column('poster_url', db.String(255))
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        db.UniqueConstraint('user_id', 'catalog_movie_id', name='uix_user_movie'),
     )
 
     # user: Many-to-one relationship back to User
+    # catalog: Many-to-one relationship to CatalogMovie, always needed to display the movie
     # reviews: One-to-many relationship with Review, deletes reviews if movie is deleted
     user = db.relationship("User", back_populates="movies")
+    catalog = db.relationship("CatalogMovie", back_populates="user_movies", lazy="joined")
     reviews = db.relationship("Review", back_populates="movie", cascade="all, delete-orphan")
 
+    @property
+    def name(self):
+        return self.catalog.name
+
+    @property
+    def director(self):
+        return self.user_director if self.user_director is not None else self.catalog.director
+
+    @property
+    def year(self):
+        return self.catalog.year
+
+    @property
+    def poster_url(self):
+        return self.user_poster_url if self.user_poster_url is not None else self.catalog.poster_url
+
+    @property
+    def poster_mirror(self):
+        # Only the catalog poster is mirrored
+        return self.catalog.poster_mirror if self.user_poster_url is None else None
+
+    @property
+    def rating(self):
+        return self.user_rating if self.user_rating is not None else self.catalog.rating
+
+    @property
+    def status(self):
+        return self.catalog.status
 
     def __repr__(self):
         return f"<Movie {self.id}: {self.name} ({self.year}) - Rating: {self.rating}>"
@@ -75,25 +172,113 @@ class Review(db.Model):
         id (int): Primary key, unique identifier for the review.
         review_text (str): The written review content.
         created_at (datetime): Timestamp when the review was created.
+        updated_at (datetime): Timestamp of the last change, used to validate cached pages.
         user_id (int): Foreign key referencing the reviewing user.
         movie_id (int): Foreign key referencing the reviewed movie.
+        catalog_movie_id (int): Catalog film of the reviewed movie, copied from it so a
+            film's reviews are paged through one index.
         user (User): The user who wrote the review.
         movie (Movie): The movie being reviewed.
+        catalog (CatalogMovie): The catalog film of the reviewed movie.
+    Notes:
+        - catalog_movie_id is kept equal to movie.catalog_movie_id by the data manager.
     """
 
     __tablename__ = "reviews"
 
     id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
-    movie_id = db.Column(db.Integer, db.ForeignKey("movies.id"), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False, index=True)
+    movie_id = db.Column(db.Integer, db.ForeignKey("user_movies.id"), nullable=False, index=True)
+    catalog_movie_id = db.Column(db.Integer, db.ForeignKey("catalog_movies.id"))
     review_text = db.Column(db.Text, nullable=False)
     rating = db.Column(db.Float, nullable=True)  # Allow users to skip if they want
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        # Keyset pages of a film's reviews: equality on the film, then in ID order
+        db.Index('ix_reviews_catalog_movie_id_id', 'catalog_movie_id', 'id'),
+    )
+
     # Relationships:
     # user: Many-to-one relationship back to User
     # movie: Many-to-one relationship back to Movie
+    # catalog: Many-to-one relationship to CatalogMovie
     user = db.relationship("User", back_populates="reviews")
     movie = db.relationship("Movie", back_populates="reviews")
+    catalog = db.relationship("CatalogMovie")
+
+    def __repr__(self):
+        return f"<Review {self.id} - User {self.user_id} - Movie {self.movie_id}>"
+
+
+class TitleRatingStats(db.Model):
+    """Review aggregates of a catalog film across every user's list entry.
+    Maintained incrementally by the data manager whenever reviews change, so
+    per-title stats and the top rated list are read without touching reviews.
+    Attributes:
+        catalog_movie_id (int): Primary key, the catalog film the stats describe.
+        review_count (int): Number of reviews of the film.
+        rated_count (int): Number of those reviews that carry a rating.
+        rating_sum (float): Sum of the ratings.
+        average_rating (float): rating_sum / rated_count, or None without ratings.
+        histogram (List[int]): Number of ratings per whole point, 0 to 10.
+        last_review_at (datetime): Creation time of the newest review.
+        updated_at (datetime): Timestamp of the last change, used to validate cached pages.
+        catalog (CatalogMovie): The catalog film.
+    """
+
+    __tablename__ = "title_rating_stats"
+
+    BUCKETS = 11
+
+    catalog_movie_id = db.Column(db.Integer, db.ForeignKey("catalog_movies.id"), primary_key=True)
+    review_count = db.Column(db.Integer, nullable=False, default=0)
+    rated_count = db.Column(db.Integer, nullable=False, default=0)
+    rating_sum = db.Column(db.Float, nullable=False, default=0.0)
+    average_rating = db.Column(db.Float, index=True)
+    histogram = db.Column(db.JSON, nullable=False, default=lambda: [0] * TitleRatingStats.BUCKETS)
+    last_review_at = db.Column(db.DateTime)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    catalog = db.relationship("CatalogMovie", back_populates="rating_stats")
+
+    @staticmethod
+    def bucket(rating: float) -> int:
+        """Return the histogram bucket of a rating (rounded half up, clamped to 0-10)."""
+        return min(TitleRatingStats.BUCKETS - 1, max(0, int(rating + 0.5)))
+
+    def __repr__(self):
+        return f"<TitleRatingStats {self.catalog_movie_id}: {self.average_rating} from {self.rated_count}>"
+
+
+class Job(db.Model):
+    """Represents a unit of background work in the local job queue.
+    Attributes:
+        id (int): Primary key, unique identifier for the job.
+        kind (str): Name of the handler that runs the job (e.g. "enrich_movie").
+        target_id (int): ID of the row the job works on.
+        status (str): "queued", "running", "done" or "failed".
+        attempts (int): Number of times the job has been started.
+        run_after (datetime): Earliest time the job may (re)run, used for backoff.
+        last_error (str): Error message of the last failed attempt.
+        created_at (datetime): Timestamp when the job was queued.
+    """
+
+    __tablename__ = "jobs"
+
+    id = db.Column(db.Integer, primary_key=True)
+    kind = db.Column(db.String(50), nullable=False)
+    target_id = db.Column(db.Integer, nullable=False)
+    status = db.Column(db.String(20), nullable=False, default="queued")
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    run_after = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    last_error = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        db.Index('ix_jobs_status_run_after', 'status', 'run_after'),
+    )
 
     def __repr__(self):
-        return f"<Review {self.id} - User {self.user_id} - Movie {self.movie_id}>"
\ No newline at end of file
+        return f"<Job {self.id}: {self.kind}({self.target_id}) - {self.status}>"
@@ -3,6 +3,10 @@ from routes.movie_routes import movie_bp
 from routes.main_routes import main_bp
 from routes.auth_routes import auth_bp
 from routes.review_routes import review_bp
+from routes.search_routes import search_bp
+from routes.api_routes import api_bp
+from routes.api_v1_routes import api_v1_bp
+from routes.poster_routes import poster_bp
 
 """
 Package initialization for the routes module.
@@ -20,4 +24,8 @@ def register_routes(app):
     app.register_blueprint(movie_bp)
     app.register_blueprint(main_bp)
     app.register_blueprint(review_bp)
+    app.register_blueprint(search_bp)
+    app.register_blueprint(api_bp)
+    app.register_blueprint(api_v1_bp)
+    app.register_blueprint(poster_bp)
 
@@ -0,0 +1,23 @@
+from flask import Blueprint, jsonify, request, current_app
+
+api_bp = Blueprint("api", __name__, url_prefix="/api")
+
+MAX_SUGGESTIONS = 20
+
+
+@api_bp.route("/titles/suggest")
+def suggest_titles():
+    """
+    Suggest movie titles starting with what was typed, for the add-movie form.
+    Answered from the in-memory title index without touching the database
+    or OMDb. Query string: q (the prefix) and limit (default 10, at most 20).
+    Returns:
+        JSON object with the query and a list of matching titles.
+    """
+    query = request.args.get("q", "")
+    limit = max(1, min(request.args.get("limit", 10, type=int), MAX_SUGGESTIONS))
+    suggestions = current_app.extensions["title_index"].suggest(query, limit=limit)
+    response = jsonify(query=query, suggestions=suggestions)
+    # New titles show up within a minute for repeated keystrokes
+    response.headers["Cache-Control"] = "public, max-age=60"
+    return response
@@ -0,0 +1,213 @@
+from functools import wraps
+from flask import Blueprint, jsonify, request, abort, current_app, g
+from werkzeug.exceptions import HTTPException
+from datamanager.query_counter import query_budget
+from datamanager.sqlite_data_manager import MOVIE_FIELD_COLUMNS, REVIEW_FIELD_COLUMNS
+from routes.pagination import get_page_args, paginate
+from routes.auth_utils import current_user
+
+api_v1_bp = Blueprint("api_v1", __name__, url_prefix="/api/v1")
+
+# Most IDs a batch request may ask for
+MAX_BATCH_IDS = 100
+MAX_REVIEWS_PER_MOVIE = 100
+
+
+def _isoformat(value):
+    return value.isoformat() if value is not None else None
+
+
+def _stats(movie, name):
+    stats = movie.catalog.rating_stats
+    return getattr(stats, name) if stats is not None else (0 if name.endswith("count") else None)
+
+
+# How every selectable field is read from a loaded object
+MOVIE_FIELDS = {
+    "id": lambda m: m.id,
+    "user_id": lambda m: m.user_id,
+    "name": lambda m: m.name,
+    "director": lambda m: m.director,
+    "year": lambda m: m.year,
+    "rating": lambda m: m.rating,
+    "user_rating": lambda m: m.user_rating,
+    "poster_url": lambda m: m.poster_url,
+    "status": lambda m: m.status,
+    "imdb_id": lambda m: m.catalog.imdb_id,
+    "average_rating": lambda m: _stats(m, "average_rating"),
+    "rated_count": lambda m: _stats(m, "rated_count"),
+    "review_count": lambda m: _stats(m, "review_count"),
+    "updated_at": lambda m: _isoformat(m.updated_at),
+}
+REVIEW_FIELDS = {
+    "id": lambda r: r.id,
+    "movie_id": lambda r: r.movie_id,
+    "user_id": lambda r: r.user_id,
+    "user_name": lambda r: r.user.name,
+    "review_text": lambda r: r.review_text,
+    "rating": lambda r: r.rating,
+    "created_at": lambda r: _isoformat(r.created_at),
+    "updated_at": lambda r: _isoformat(r.updated_at),
+}
+# Email addresses are never exposed
+USER_FIELDS = {
+    "id": lambda u: u.id,
+    "name": lambda u: u.name,
+}
+assert set(MOVIE_FIELDS) == set(MOVIE_FIELD_COLUMNS) and set(REVIEW_FIELDS) == set(REVIEW_FIELD_COLUMNS)
+
+
+def get_fields(available: dict):
+    """
+    Read the sparse field selection (?fields=id,name) for a resource.
+    Returns:
+        List[str]: The selected fields (id always included), or all of them if none were given.
+    """
+    raw = request.args.get("fields")
+    if not raw:
+        return list(available)
+    fields = ["id"] + [field.strip() for field in raw.split(",") if field.strip() and field.strip() != "id"]
+    unknown = [field for field in fields if field not in available]
+    if unknown:
+        abort(400, description=f"Unknown fields: {', '.join(unknown)}. "
+                               f"Available: {', '.join(available)}.")
+    return fields
+
+
+def logged_in_only(f):
+    """
+    Answer 401 unless a user is logged in; the endpoint finds them in g.current_user.
+    The user is resolved here, outside the endpoint's query budget, as login_required does for pages.
+    """
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        if current_user() is None:
+            abort(401, description="Log in to access this resource.")
+        return f(*args, **kwargs)
+    return decorated_function
+
+
+def own_data_only(f):
+    """Restrict an endpoint taking a user_id to that user, answering 401 or 403 otherwise."""
+    @wraps(f)
+    @logged_in_only
+    def decorated_function(*args, **kwargs):
+        if g.current_user.id != kwargs.get("user_id"):
+            abort(403, description="You can only access your own data.")
+        return f(*args, **kwargs)
+    return decorated_function
+
+
+def get_ids(name: str) -> list:
+    """
+    Read a comma-separated list of IDs (?ids=1,2,3) from the query string.
+    Returns:
+        List[int]: The distinct IDs, in the order given.
+    """
+    raw = request.args.get(name, "")
+    try:
+        ids = list(dict.fromkeys(int(part) for part in raw.split(",") if part.strip()))
+    except ValueError:
+        abort(400, description=f"{name} must be a comma-separated list of integers.")
+    if not ids:
+        abort(400, description=f"{name} is required.")
+    if len(ids) > MAX_BATCH_IDS:
+        abort(400, description=f"At most {MAX_BATCH_IDS} {name} per request.")
+    return ids
+
+
+def serialize(obj, getters: dict, fields: list) -> dict:
+    """Turn a model object into a dict of the selected fields."""
+    return {field: getters[field](obj) for field in fields}
+
+
+@api_v1_bp.errorhandler(HTTPException)
+def api_error(e):
+    """Answer errors raised by API views as JSON instead of HTML pages."""
+    return jsonify(error={"status": e.code, "message": e.description}), e.code
+
+
+@api_v1_bp.route("/users")
+@query_budget(1)
+def list_users():
+    """
+    List users by ID with keyset pagination (?after=&limit=).
+    Returns:
+        JSON with users (id and name) and next_after, the cursor of the next page or null.
+    """
+    after, limit = get_page_args()
+    fields = get_fields(USER_FIELDS)
+    users, next_after = paginate(current_app.data_manager.get_all_users, after, limit)
+    return jsonify(users=[serialize(user, USER_FIELDS, fields) for user in users], next_after=next_after)
+
+
+@api_v1_bp.route("/users/<int:user_id>/movies")
+@own_data_only
+@query_budget(1)
+def user_movies(user_id):
+    """
+    List the logged-in user's movies with keyset pagination and sparse fields.
+    As on the HTML page, users can only list their own movies.
+    Returns:
+        JSON with movies and next_after; 401 when not logged in, 403 for another user's list.
+    """
+    after, limit = get_page_args()
+    fields = get_fields(MOVIE_FIELDS)
+    movies, next_after = paginate(current_app.data_manager.get_user_movies, after, limit,
+                                  user_id=user_id, fields=fields)
+    return jsonify(movies=[serialize(movie, MOVIE_FIELDS, fields) for movie in movies], next_after=next_after)
+
+
+@api_v1_bp.route("/movies")
+@logged_in_only
+@query_budget(1)
+def get_movies():
+    """
+    Fetch many of the logged-in user's movies at once: ?ids=1,2,3 (at most 100) and optional ?fields=.
+    Resolved with a single IN query that only reads the selected columns.
+    Returns:
+        JSON with the movies found (ordered by ID) and the requested IDs that were not found
+        (other users' entries are reported missing); 401 when not logged in.
+    """
+    ids = get_ids("ids")
+    fields = get_fields(MOVIE_FIELDS)
+    movies = current_app.data_manager.get_movies_by_ids(ids, fields=fields, user_id=g.current_user.id)
+    found = {movie.id for movie in movies}
+    return jsonify(movies=[serialize(movie, MOVIE_FIELDS, fields) for movie in movies],
+                   missing=[movie_id for movie_id in ids if movie_id not in found])
+
+
+@api_v1_bp.route("/movies/<int:movie_id>")
+@logged_in_only
+@query_budget(1)
+def get_movie(movie_id):
+    """
+    Fetch one of the logged-in user's movies, with optional ?fields=.
+    Returns:
+        JSON with the movie; 404 if it is not on the user's list, 401 when not logged in.
+    """
+    fields = get_fields(MOVIE_FIELDS)
+    movies = current_app.data_manager.get_movies_by_ids([movie_id], fields=fields, user_id=g.current_user.id)
+    if not movies:
+        abort(404, description="Movie not found.")
+    return jsonify(movie=serialize(movies[0], MOVIE_FIELDS, fields))
+
+
+@api_v1_bp.route("/reviews")
+@query_budget(1)
+def get_reviews():
+    """
+    Fetch the reviews of many movies at once: ?movie_ids=1,2,3 (at most 100),
+    ?limit= reviews per movie (default 20, at most 100) and optional ?fields=.
+    As on the review page, a movie's reviews are those of everyone who listed the same film.
+    Returns:
+        JSON mapping every requested movie ID to its reviews, oldest first.
+    """
+    movie_ids = get_ids("movie_ids")
+    limit = max(1, min(request.args.get("limit", 20, type=int), MAX_REVIEWS_PER_MOVIE))
+    fields = get_fields(REVIEW_FIELDS)
+    reviews = current_app.data_manager.get_reviews_for_movies(movie_ids, limit_per_movie=limit, fields=fields)
+    return jsonify(reviews={
+        str(movie_id): [serialize(review, REVIEW_FIELDS, fields) for review in reviews[movie_id]]
+        for movie_id in movie_ids
+    })
@@ -1,5 +1,6 @@
-from flask import (Blueprint, render_template, request, redirect, url_for, flash, session,
+from flask import (Blueprint, render_template, request, redirect, url_for, flash,
                    current_app)
+from routes.auth_utils import login_user, logout_user
 
 auth_bp = Blueprint("auth", __name__)
 
@@ -21,7 +22,7 @@ def login():
 
         user = current_app.data_manager.get_user_by_email(email)
         if user:
-            session["user_id"] = user.id
+            login_user(user)
             flash(f"Welcome back, {user.name}!", "success")
             return redirect(url_for("user.user_movies", user_id=user.id))
         else:
@@ -36,7 +37,7 @@ def logout():
     Flashes a logout confirmation message and redirects to the home page.
     """
     try:
-        session.pop("user_id", None)
+        logout_user()
         flash("Logged out successfully.", "info")
     except Exception as e:
         flash(f"An error occurred while logging out: {e}", "danger")
@@ -61,7 +62,7 @@ def register():
 
         try:
             user = current_app.data_manager.add_user(name=name, email=email)
-            session["user_id"] = user.id
+            login_user(user)
             flash("Registration successful. Welcome!", "success")
             return redirect(url_for("user.user_movies", user_id=user.id))
         except Exception as e:
@@ -1,31 +1,101 @@
+import time
 from functools import wraps
-from flask import session, redirect, url_for, flash
+from typing import NamedTuple, Optional
+from flask import session, redirect, url_for, flash, g, current_app
 
-def login_required(f):
+# Session key of the cached profile of the logged-in user
+PROFILE_KEY = "user"
+
+
+class SessionUser(NamedTuple):
+    """Minimal profile of the logged-in user, cached in the session."""
+    id: int
+    name: str
+    email: str
+
+
+def _cache_profile(user) -> SessionUser:
+    session[PROFILE_KEY] = {"id": user.id, "name": user.name, "email": user.email, "checked_at": time.time()}
+    g.current_user = SessionUser(user.id, user.name, user.email)
+    return g.current_user
+
+
+def login_user(user) -> None:
+    """
+    Start a session for a user and cache their profile in it.
+    Args:
+        user (User): The authenticated user.
+    """
+    # Server-side sessions move to a new ID, so one planted before login is worthless
+    regenerate = getattr(session, "regenerate", None)
+    if regenerate is not None:
+        regenerate()
+    session["user_id"] = user.id
+    _cache_profile(user)
+
+
+def logout_user() -> None:
+    """End the current user's session (pending flash messages are kept)."""
+    session.pop("user_id", None)
+    session.pop(PROFILE_KEY, None)
+    g.current_user = None
+
+
+def current_user() -> Optional[SessionUser]:
+    """
+    Resolve the logged-in user, once per request.
+    The profile cached in the session is trusted for SESSION_PROFILE_TTL
+    seconds; after that (or for sessions started before profiles were cached)
+    the users row is read again, and a session whose user no longer exists is
+    ended.
+    Returns:
+        Optional[SessionUser]: The user, or None if nobody is logged in.
+    """
+    if "current_user" in g:
+        return g.current_user
+    user_id = session.get("user_id")
+    profile = session.get(PROFILE_KEY)
+    resolved = None
+    if user_id is not None:
+        fresh = (profile is not None and profile.get("id") == user_id
+                 and time.time() - profile.get("checked_at", 0) < current_app.config.get("SESSION_PROFILE_TTL", 300))
+        if fresh:
+            resolved = SessionUser(profile["id"], profile["name"], profile["email"])
+        else:
+            user = current_app.data_manager.get_user_by_id(user_id)
+            if user is None:
+                logout_user()
+            else:
+                resolved = _cache_profile(user)
+    g.current_user = resolved
+    return resolved
+
+
+def login_required(f=None, *, owner_message: Optional[str] = None):
     """
     Decorator to ensure that a user is logged in before accessing a route.
-    This decorator checks for the presence of 'user_id' in the Flask session.
-    If the user is not logged in, it flashes a warning message and redirects
-    to the login page. It also handles unexpected exceptions gracefully by
-    flashing an error message and redirecting to the login page.
+    The user is resolved with current_user() and available to the view as
+    g.current_user. If nobody is logged in, it flashes a warning message and
+    redirects to the login page. With owner_message, routes taking a user_id
+    are also restricted to that user: anyone else is shown the message and
+    sent to their own movie list.
     Args:
         f (function): The route function to decorate.
+        owner_message (Optional[str]): Message for users opening another user's route.
     Returns:
         function: The wrapped function that includes the login check.
-    Raises:
-        None: Exceptions are caught and handled internally.
     """
-    # decorator implementation
-    @wraps(f)
-    def decorated_function(*args, **kwargs):
-        try:
-            if "user_id" not in session:
+    def decorator(view):
+        @wraps(view)
+        def decorated_function(*args, **kwargs):
+            user = current_user()
+            if user is None:
                 flash("Please log in to access this page.", "warning")
                 return redirect(url_for("auth.login"))
-            return f(*args, **kwargs)
-        except Exception as e:
-            flash(f"An unexpected error occurred: {e}", "danger")
-            return redirect(url_for("auth.login"))
-    return decorated_function
-
+            if owner_message is not None and kwargs.get("user_id") != user.id:
+                flash(owner_message, "danger")
+                return redirect(url_for("user.user_movies", user_id=user.id))
+            return view(*args, **kwargs)
+        return decorated_function
 
+    return decorator(f) if f is not None else decorator
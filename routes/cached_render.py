@@ -0,0 +1,58 @@
+import json
+import time
+from flask import current_app, render_template
+from datamanager.replica_routing import primary
+from datamanager.metrics import TEMPLATE_RENDER
+
+# Blocks of a page template that are cached; the rest of base.html (navbar,
+# flashed messages) depends on the session and is rendered on every request
+CACHED_BLOCKS = ("title", "content")
+
+
+def render_cached(template_name: str, scopes, key, load):
+    """
+    Render a page whose title and content blocks are served from the page cache.
+    The cache key combines the template, the current version of every scope
+    the page shows and the caller's key (page arguments, viewer, ...). On a
+    miss load() is called for the template context; the blocks are rendered
+    and stored, and any write bumping one of the scopes retires the entry.
+    Args:
+        template_name (str): Page template extending base.html.
+        scopes (List[str]): Version scopes the page depends on, e.g. ["user:3"].
+        key (tuple): Extra values the rendered blocks depend on.
+        load (callable): Returns the template context, or a response to send uncached.
+    Returns:
+        The rendered page, or whatever load() returned instead of a context.
+    """
+    cache = current_app.extensions.get("page_cache")
+    if cache is None:
+        context = load()
+        return render_template(template_name, **context) if isinstance(context, dict) else context
+
+    versions = cache.versions(scopes)
+    cache_key = "|".join([template_name, *(f"{scope}={version}" for scope, version in zip(scopes, versions)),
+                          *(str(part) for part in key)])
+    cached = cache.get(cache_key)
+    if cached is not None:
+        blocks = json.loads(cached)
+    else:
+        # A replica may lag behind the versions just read: fill the cache from the primary
+        with primary():
+            context = load()
+        if not isinstance(context, dict):
+            return context
+        blocks = _render_blocks(template_name, context)
+        cache.set(cache_key, json.dumps(blocks))
+    return render_template("_cached_page.html", blocks=blocks)
+
+
+def _render_blocks(template_name: str, context: dict) -> dict:
+    started = time.perf_counter()
+    template = current_app.jinja_env.get_or_select_template(template_name)
+    context = dict(context)
+    current_app.update_template_context(context)
+    template_context = template.new_context(context)
+    blocks = {name: "".join(template.blocks[name](template_context)) for name in CACHED_BLOCKS}
+    # Rendered outside render_template, so the template signals don't time it
+    TEMPLATE_RENDER.observe(time.perf_counter() - started, template_name)
+    return blocks
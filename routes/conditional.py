@@ -0,0 +1,39 @@
+import hashlib
+from flask import request, session, make_response
+from werkzeug.http import is_resource_modified
+
+
+def conditional_response(version, render):
+    """
+    Answer a GET with 304 Not Modified when the client's copy is still current.
+    The ETag is derived from the data version and the viewer (the navbar and
+    edit buttons differ per session); the Last-Modified date, when known, is
+    sent as well. render() is only called when a full response is needed.
+    Args:
+        version (Tuple[str, Optional[datetime]]): Version token and last-modified
+            time from one of the data manager's *_version methods.
+        render (callable): Produces the full response.
+    Returns:
+        Response: A 304 response, or the rendered response with validators set.
+    """
+    # A pending flash message is only shown by rendering the page
+    if session.get("_flashes"):
+        return render()
+
+    token, last_modified = version
+    etag = hashlib.sha1(f"{token}|{session.get('user_id')}".encode()).hexdigest()
+
+    if not is_resource_modified(request.environ, etag=etag, last_modified=last_modified):
+        response = make_response("", 304)
+    else:
+        response = make_response(render())
+        if response.status_code != 200:
+            return response
+    response.set_etag(etag, weak=True)
+    if last_modified is not None:
+        response.last_modified = last_modified
+    # Let browsers keep the page but check back on every visit
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    response.vary.add("Cookie")
+    return response
@@ -1,6 +1,7 @@
-from flask import Blueprint, render_template, session, redirect, url_for, current_app, flash
+from flask import Blueprint, render_template, session, redirect, url_for, current_app, flash, request
 from models.app_models import db, User
 from flask_sqlalchemy import SQLAlchemy
+from routes.auth_utils import current_user
 
 main_bp = Blueprint("main", __name__)
 
@@ -9,16 +10,24 @@ main_bp = Blueprint("main", __name__)
 def home():
     """
     Render the welcome page.
-    Redirects to dashboard if session exists and user is valid.
+    Redirects to dashboard if session exists and user is valid
+    (sessions of users that no longer exist are ended by current_user).
     """
-    user_id = session.get("user_id")
+    user = current_user()
+    if user:
+        return redirect(url_for("user.user_movies", user_id=user.id))
 
-    if user_id:
-        user = current_app.data_manager.get_user_by_id(user_id)
-        if user:
-            return redirect(url_for("user.user_movies", user_id=user.id))
-        else:
-            # Clear invalid session if user doesn't exist
-            session.pop("user_id", None)
+    return render_template("index.html")
 
-    return render_template("index.html")
\ No newline at end of file
+
+@main_bp.route("/top-rated")
+def top_rated():
+    """
+    Display the best rated films across all users' reviews.
+    Reads the maintained per-title rating aggregates, so the page costs the
+    same however many reviews there are. ?min_ratings=<n> (default 3) hides
+    films with fewer ratings.
+    """
+    min_ratings = max(1, request.args.get("min_ratings", 3, type=int))
+    top = current_app.data_manager.get_top_rated(limit=20, min_ratings=min_ratings)
+    return render_template("top_rated.html", top_rated=top, min_ratings=min_ratings)
\ No newline at end of file
@@ -0,0 +1,53 @@
+import time
+from flask import Blueprint, Response, current_app, g, request, abort, before_render_template, template_rendered
+from datamanager.metrics import (REGISTRY, REQUEST_DURATION, REQUESTS, SQL_PER_REQUEST, TEMPLATE_RENDER,
+                                 current_endpoint)
+
+metrics_bp = Blueprint("metrics", __name__)
+
+
+@metrics_bp.route("/metrics")
+def metrics():
+    """
+    Expose the process's metrics in the Prometheus text exposition format.
+    If METRICS_TOKEN is set, the scraper must send it as a bearer token.
+    """
+    token = current_app.config.get("METRICS_TOKEN")
+    if token and request.headers.get("Authorization") != f"Bearer {token}":
+        abort(403)
+    return Response(REGISTRY.expose(), mimetype="text/plain; version=0.0.4")
+
+
+def register_metrics(app):
+    """
+    Record request latency, SQL statements per request and template render
+    time for every request, and register the /metrics endpoint.
+    Args:
+        app (Flask): The Flask application instance.
+    """
+    @app.before_request
+    def start_request_timer():
+        g._metrics_started = time.perf_counter()
+
+    @app.after_request
+    def record_request(response):
+        started = g.pop("_metrics_started", None)
+        if started is not None:
+            endpoint = current_endpoint()
+            REQUEST_DURATION.observe(time.perf_counter() - started, endpoint, request.method)
+            REQUESTS.inc(1, endpoint, request.method, str(response.status_code))
+            SQL_PER_REQUEST.observe(g.get("_metrics_sql_statements", 0), endpoint)
+        return response
+
+    def start_render_timer(sender, template, context, **extra):
+        g.setdefault("_metrics_render_started", []).append(time.perf_counter())
+
+    def record_render(sender, template, context, **extra):
+        started = g.get("_metrics_render_started")
+        if started:
+            TEMPLATE_RENDER.observe(time.perf_counter() - started.pop(), template.name or "<string>")
+
+    before_render_template.connect(start_render_timer, app, weak=False)
+    template_rendered.connect(record_render, app, weak=False)
+
+    app.register_blueprint(metrics_bp)
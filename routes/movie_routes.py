@@ -1,24 +1,24 @@
-from flask import Blueprint, render_template, request, redirect, url_for, flash, abort, session, current_app
-from routes.auth_utils import login_required
+from flask import (Blueprint, render_template, request, redirect, url_for, flash, abort, g, current_app,
+                   jsonify, Response, stream_with_context)
+from routes.auth_utils import current_user, login_required
 from datamanager.sqlite_data_manager import SQLiteDataManager
 from datamanager.utils import fetch_movie_details
+from datamanager.bulk_import import parse_titles, import_movies
+from datamanager.export import EXPORT_FORMATS, EXPORT_MIMETYPES, stream_export
 
 movie_bp = Blueprint("movie", __name__)
 
 @movie_bp.route("/users/<int:user_id>/add_movie", methods=["GET", "POST"])
+@login_required(owner_message="You can only add movies to your own list.")
 def add_movie(user_id):
     """
     Add a new movie to the logged-in user's movie list.
     Ensures only the current user can add to their own list, fetches movie
     details from OMDb, and handles any errors that may occur.
+    With ASYNC_ENRICHMENT enabled the movie is saved as "pending" right away
+    and its details are fetched by the background job workers.
     """
-    if session.get("user_id") != user_id:
-        flash("You can only add movies to your own list.", "danger")
-        return redirect(url_for("user.user_movies", user_id=session.get("user_id")))
-
-    user = current_app.data_manager.get_user_by_id(user_id)
-    if not user:
-        abort(404, description="User not found")
+    user = g.current_user
 
     if request.method == "POST":
         title = request.form.get("title", "").strip()
@@ -27,6 +27,21 @@ def add_movie(user_id):
             flash("Please enter a movie title.", "warning")
             return redirect(url_for("movie.add_movie", user_id=user_id))
 
+        if current_app.config.get("ASYNC_ENRICHMENT"):
+            try:
+                movie = current_app.data_manager.add_pending_movie(user_id, title)
+                if movie.status == "pending":
+                    flash(f'Movie "{movie.name}" added. Fetching its details...', "info")
+                else:
+                    flash(f'Movie "{movie.name}" added successfully!', "success")
+                return redirect(url_for("user.user_movies", user_id=user_id))
+            except ValueError as ve:
+                flash(str(ve), "warning")
+            except Exception as e:
+                current_app.logger.error(f"Movie addition failed: {e}")
+                flash("An unexpected error occurred while adding the movie.", "danger")
+            return redirect(url_for("movie.add_movie", user_id=user_id))
+
         movie_data = fetch_movie_details(title)
         if not movie_data:
             flash("Movie not found in OMDb or an error occurred.", "danger")
@@ -49,18 +64,102 @@ def add_movie(user_id):
     return render_template("add_movie.html", user=user)
 
 
+@movie_bp.route("/users/<int:user_id>/import", methods=["GET", "POST"])
+@login_required(owner_message="You can only import movies into your own list.")
+def import_movies_upload(user_id):
+    """
+    Import many movies at once from an uploaded CSV or JSON file of titles.
+    Titles are looked up on OMDb concurrently and added in one transaction;
+    the page then lists the outcome of every row.
+    """
+    user = g.current_user
+
+    if request.method == "POST":
+        upload = request.files.get("file")
+        if not upload or not upload.filename:
+            flash("Please choose a CSV or JSON file to import.", "warning")
+            return redirect(url_for("movie.import_movies_upload", user_id=user_id))
+
+        try:
+            titles = parse_titles(upload.read().decode("utf-8-sig"), upload.filename)
+        except (ValueError, UnicodeDecodeError) as e:
+            flash(f"Could not read the file: {e}", "danger")
+            return redirect(url_for("movie.import_movies_upload", user_id=user_id))
+
+        try:
+            outcomes = import_movies(current_app.data_manager, user_id, titles,
+                                     max_workers=current_app.config.get("IMPORT_WORKERS", 8))
+        except Exception as e:
+            current_app.logger.error(f"Movie import failed: {e}")
+            flash("An unexpected error occurred while importing movies.", "danger")
+            return redirect(url_for("movie.import_movies_upload", user_id=user_id))
+
+        added = sum(1 for outcome in outcomes if outcome["status"] == "added")
+        flash(f"Imported {added} of {len(outcomes)} movies.", "success" if added else "info")
+        return render_template("import_movies.html", user=user, outcomes=outcomes)
+
+    return render_template("import_movies.html", user=user)
+
+
+@movie_bp.route("/users/<int:user_id>/export/<dataset>.<export_format>")
+@login_required(owner_message="You can only export your own data.")
+def export_data(user_id, dataset, export_format):
+    """
+    Download the user's movie list ("movies") or their reviews ("reviews") as CSV or JSON.
+    Rows are streamed from the database straight into the response, so the
+    export never holds the whole list in memory.
+    """
+    exports = {
+        "movies": current_app.data_manager.export_user_movies,
+        "reviews": current_app.data_manager.export_user_reviews,
+    }
+    if dataset not in exports or export_format not in EXPORT_FORMATS:
+        abort(404)
+
+    columns, rows = exports[dataset](user_id)
+    return Response(
+        stream_with_context(stream_export(export_format, columns, rows)),
+        mimetype=EXPORT_MIMETYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="moviweb-{dataset}.{export_format}"',
+            "Cache-Control": "private, no-store",
+        },
+    )
+
+
+@movie_bp.route("/users/<int:user_id>/movies/<int:movie_id>/status")
+def movie_status(user_id, movie_id):
+    """
+    Report the enrichment status of a movie on the user's list as JSON.
+    Used by the movie list page to poll movies whose details are still being fetched.
+    """
+    user = current_user()
+    if user is None or user.id != user_id:
+        return jsonify(error="You can only view your own movies."), 403
+
+    movie = current_app.data_manager.get_movie_by_id(movie_id)
+    if not movie or movie.user_id != user_id:
+        return jsonify(error="Movie not found"), 404
+
+    return jsonify(
+        id=movie.id,
+        status=movie.status,
+        name=movie.name,
+        director=movie.director,
+        year=movie.year,
+        rating=movie.rating,
+        poster_url=movie.poster_url,
+    )
+
+
 @movie_bp.route("/users/<int:user_id>/update_movie/<int:movie_id>", methods=["GET", "POST"])
+@login_required(owner_message="You can only update your own movies.")
 def update_movie(user_id, movie_id):
     """
     Update an existing movie in a user's collection.
     Only the owner of the movie (logged-in user) can update it.
     """
-    # Ensure only the logged-in user can update their own movies
-    if session.get("user_id") != user_id:
-        flash("You can only update your own movies.", "danger")
-        return redirect(url_for("user.user_movies", user_id=session.get("user_id")))
-
-    user = current_app.data_manager.get_user_by_id(user_id)
+    user = g.current_user
     movie = current_app.data_manager.get_movie_by_id(movie_id)
 
     # Ensure the movie exists and belongs to the user
@@ -104,16 +203,12 @@ def update_movie(user_id, movie_id):
 
 
 @movie_bp.route("/users/<int:user_id>/delete_movie/<int:movie_id>", methods=["POST"])
+@login_required(owner_message="You can only delete your own movies.")
 def delete_movie(user_id, movie_id):
     """
     Delete a movie from a user's list. Restricted to the movie's owner.
     """
-    # Ensure the logged-in user is the owner
-    if session.get("user_id") != user_id:
-        flash("You can only delete your own movies.", "danger")
-        return redirect(url_for("user.user_movies", user_id=session.get("user_id")))
-
-    user = current_app.data_manager.get_user_by_id(user_id)
+    user = g.current_user
     movie = current_app.data_manager.get_movie_by_id(movie_id)
 
     # Handle case where user or movie doesn't exist, or mismatch
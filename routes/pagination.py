@@ -0,0 +1,49 @@
+from flask import request
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+def get_page_args():
+    """
+    Read the keyset pagination arguments from the query string.
+    Returns:
+        tuple: (after, limit) where after is the last ID of the previous page
+        (or None for the first page) and limit is clamped to MAX_PAGE_SIZE.
+    """
+    after = request.args.get("after", type=int)
+    limit = request.args.get("limit", default=DEFAULT_PAGE_SIZE, type=int)
+    return after, max(1, min(limit, MAX_PAGE_SIZE))
+
+
+def paginate(fetch, after, limit, **kwargs):
+    """
+    Fetch one page from a data manager list method.
+    One extra row is requested to find out whether a next page exists.
+    Args:
+        fetch (callable): Data manager method accepting after_id and limit.
+        after (Optional[int]): Last ID of the previous page.
+        limit (int): Page size.
+        **kwargs: Further arguments passed to fetch.
+    Returns:
+        tuple: (items, next_after) where next_after is the cursor for the next
+        page, or None on the last page.
+    """
+    items = fetch(after_id=after, limit=limit + 1, **kwargs)
+    if len(items) > limit:
+        return items[:limit], items[limit - 1].id
+    return items, None
+
+
+def page_version(fetch_version, after, limit, **kwargs):
+    """
+    Get the validator of the page paginate() would fetch with the same arguments.
+    Args:
+        fetch_version (callable): Data manager *_version method accepting after_id and limit.
+        after (Optional[int]): Last ID of the previous page.
+        limit (int): Page size.
+        **kwargs: Further arguments passed to fetch_version.
+    Returns:
+        tuple: (token, last_modified) as returned by fetch_version.
+    """
+    return fetch_version(after_id=after, limit=limit + 1, **kwargs)
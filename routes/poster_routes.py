@@ -0,0 +1,36 @@
+import os
+from flask import Blueprint, abort, current_app, send_from_directory, url_for
+from datamanager.poster_mirror import POSTER_NAME, POSTER_SIZES, is_remote_poster, poster_file_name
+
+poster_bp = Blueprint("posters", __name__)
+
+# Thumbnails are content-addressed, so a URL always serves the same bytes
+POSTER_MAX_AGE = 365 * 24 * 3600
+
+
+@poster_bp.route("/posters/<name>")
+def poster(name):
+    """Serve a mirrored poster thumbnail, cacheable by browsers and proxies for a year."""
+    match = POSTER_NAME.match(name)
+    store = current_app.extensions.get("poster_store")
+    if not match or int(match["size"]) not in POSTER_SIZES or store is None:
+        abort(404)
+    response = send_from_directory(os.path.dirname(store.path_for(name)), name, max_age=POSTER_MAX_AGE)
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    return response
+
+
+@poster_bp.app_template_global()
+def poster_src(movie, size: int):
+    """
+    Return the image URL to show for a movie's poster at a thumbnail width.
+    Args:
+        movie (Movie | CatalogMovie): Anything with poster_url and poster_mirror.
+        size (int): One of POSTER_SIZES.
+    Returns:
+        Optional[str]: The local thumbnail once mirrored, else the original poster URL, or None without a poster.
+    """
+    if movie.poster_mirror:
+        return url_for("posters.poster", name=poster_file_name(movie.poster_mirror, size))
+    return movie.poster_url if is_remote_poster(movie.poster_url) else None
@@ -1,11 +1,16 @@
-from flask import Blueprint, render_template, request, redirect, session, url_for, flash, abort, current_app
-from flask_login import login_required, current_user
+from flask import Blueprint, render_template, request, redirect, session, url_for, flash, abort, current_app, g
+from routes.auth_utils import login_required
+from datamanager.query_counter import query_budget
+from routes.pagination import get_page_args, paginate, page_version
+from routes.cached_render import render_cached
+from routes.conditional import conditional_response
 
 
 review_bp = Blueprint("review", __name__, url_prefix="/reviews")
 
 
 @review_bp.route("/add/<int:user_id>/<int:movie_id>", methods=["GET", "POST"])
+@login_required(owner_message="You can only add reviews for your own movies.")
 def add_review(user_id, movie_id):
     """
     Allow a logged-in user to add a review to one of their movies.
@@ -15,19 +20,10 @@ def add_review(user_id, movie_id):
     Returns:
         Rendered template for adding a review or redirect to user's movies page on success.
     """
-    # Ensure the logged-in user matches the user_id in URL
-    if "user_id" not in session:
-        flash("You must be logged in to add a review.", "danger")
-        return redirect(url_for("auth.login"))
-
-    if session["user_id"] != user_id:
-        flash("You can only add reviews for your own movies.", "danger")
-        return redirect(url_for("user.user_movies", user_id=current_user.id))
-
-    user = current_app.data_manager.get_user_by_id(user_id)
+    user = g.current_user
     movie = current_app.data_manager.get_movie_by_id(movie_id)
 
-    if not user or not movie or movie.user_id != user_id:
+    if not movie or movie.user_id != user_id:
         abort(404, description="User or Movie not found or mismatch")
 
     if request.method == "POST":
@@ -57,25 +53,38 @@ def add_review(user_id, movie_id):
 
 
 @review_bp.route("/movie/<int:movie_id>")
+@query_budget(3)
 def view_reviews(movie_id):
     """
-    Display all reviews for a given movie.
+    Display a page of reviews for a given movie.
+    Supports ?after=<last review id>&limit=<page size> keyset pagination,
+    and answers conditional GETs with 304 when the page has not changed.
     Args:
         movie_id (int): The ID of the movie whose reviews are to be displayed.
     Returns:
         Rendered template showing the movie and its reviews.
         Raises 404 if the movie is not found.
     """
-    movie = current_app.data_manager.get_movie_by_id(movie_id)
-    if not movie:
-        flash("Movie not found.", "danger")
-        return redirect(url_for("main.home"))
+    after, limit = get_page_args()
 
-    reviews = current_app.data_manager.get_reviews_for_movie(movie_id)
-    return render_template("view_reviews.html", movie=movie, reviews=reviews)
+    def load():
+        movie = current_app.data_manager.get_movie_by_id(movie_id)
+        if not movie:
+            flash("Movie not found.", "danger")
+            return redirect(url_for("main.home"))
+
+        reviews, next_after = paginate(current_app.data_manager.get_reviews_for_movie, after, limit,
+                                       movie_id=movie_id)
+        return dict(movie=movie, reviews=reviews, after=after, next_after=next_after, limit=limit)
+
+    version = page_version(current_app.data_manager.get_reviews_version, after, limit, movie_id=movie_id)
+    # Edit and delete buttons depend on who is looking
+    return conditional_response(version, lambda: render_cached(
+        "view_reviews.html", [f"movie:{movie_id}"], (after, limit, session.get("user_id")), load))
 
 
 @review_bp.route("/edit/<int:review_id>", methods=["GET", "POST"])
+@login_required
 def edit_review(review_id):
     """
     Allow the owner of a review to edit their review.
@@ -88,22 +97,17 @@ def edit_review(review_id):
         404: If the review does not exist.
         Redirects with flash message if user attempts to edit someone else's review.
     """
-    # Ensure the logged-in user matches the user_id in URL
-    if "user_id" not in session:
-        flash("You must be logged in to edit reviews.", "danger")
-        return redirect(url_for("auth.login"))
-
     review = current_app.data_manager.get_review_by_id(review_id)
     if not review:
         abort(404, description="Review not found")
 
     # Check that the logged-in user owns the review before allowing edit
-    if session.get("user_id") != review.user_id:
+    if g.current_user.id != review.user_id:
         flash("You can only edit your own reviews.", "danger")
         return redirect(url_for("review.view_reviews", movie_id=review.movie_id))
 
     movie = review.movie
-    user = review.user
+    user = g.current_user
 
     if request.method == "POST":
         review_text = request.form.get("review_text", "").strip()
@@ -132,11 +136,13 @@ def edit_review(review_id):
 
 
 @review_bp.route("/delete/<int:review_id>", methods=["POST"])
+@login_required
 def delete_review(review_id):
     """
     Delete a specific review from the database.
     This route handles POST requests to delete a review by its ID.
     If the review does not exist, it returns a 404 error.
+    Only the author of the review may delete it.
     Upon successful deletion, the user is redirected to the movie's reviews page.
     Args:
         review_id (int): The ID of the review to be deleted.
@@ -148,6 +154,9 @@ def delete_review(review_id):
         abort(404, description="Review not found")
 
     movie_id = review.movie_id
+    if g.current_user.id != review.user_id:
+        flash("You can only delete your own reviews.", "danger")
+        return redirect(url_for("review.view_reviews", movie_id=movie_id))
 
     try:
         current_app.data_manager.delete_review(review_id)
@@ -0,0 +1,37 @@
+from flask import Blueprint, render_template, request, current_app
+from datamanager.query_counter import query_budget
+from datamanager.search import SEARCH_KINDS
+from routes.pagination import DEFAULT_PAGE_SIZE
+
+search_bp = Blueprint("search", __name__)
+
+# Ranked results are paged by offset; deep pages are not useful and cost a full ranking each
+MAX_SEARCH_PAGE = 50
+
+
+@search_bp.route("/search")
+@query_budget(1)
+def search():
+    """
+    Search catalog films by name or director, or reviews by their text.
+    Query string: q (words, each matched as a prefix), type ("movies" or
+    "reviews") and page (1-based). Results are ranked best match first.
+    Returns:
+        Rendered search page with one page of results.
+    """
+    query = request.args.get("q", "").strip()
+    kind = request.args.get("type", "movies")
+    if kind not in SEARCH_KINDS:
+        kind = "movies"
+    page = max(1, min(request.args.get("page", 1, type=int), MAX_SEARCH_PAGE))
+
+    results, has_next = [], False
+    if query:
+        # One extra row tells whether there is a next page
+        results = current_app.data_manager.search(query, kind=kind, limit=DEFAULT_PAGE_SIZE + 1,
+                                                  offset=(page - 1) * DEFAULT_PAGE_SIZE)
+        has_next = len(results) > DEFAULT_PAGE_SIZE and page < MAX_SEARCH_PAGE
+        results = results[:DEFAULT_PAGE_SIZE]
+
+    return render_template("search.html", query=query, kind=kind, kinds=SEARCH_KINDS,
+                           results=results, page=page, has_next=has_next)
@@ -1,44 +1,58 @@
 from flask import (Blueprint, render_template, request, redirect, url_for,
-                   flash, abort, session, current_app,)
+                   flash, g, current_app,)
+from datamanager.query_counter import query_budget
+from routes.pagination import get_page_args, paginate, page_version
+from routes.cached_render import render_cached
+from routes.conditional import conditional_response
+from routes.auth_utils import current_user, login_required, login_user
 
 user_bp = Blueprint("user", __name__)
 
 @user_bp.route("/users")
+@query_budget(2)
 def list_users():
-    """Display a list of all users.
-    Only accessible after login."""
+    """Display a page of users.
+    Only accessible after login.
+    Supports ?after=<last user id>&limit=<page size> keyset pagination,
+    and answers conditional GETs with 304 when the page has not changed."""
+    after, limit = get_page_args()
+
+    def load():
+        users, next_after = paginate(current_app.data_manager.get_all_users, after, limit)
+        return dict(users=users, after=after, next_after=next_after, limit=limit)
+
     try:
-        users = current_app.data_manager.get_all_users()
-        return render_template("users.html", users=users)
+        version = page_version(current_app.data_manager.get_users_version, after, limit)
+        return conditional_response(version, lambda: render_cached("users.html", ["users"], (after, limit), load))
     except Exception as e:
         current_app.logger.error(f"Failed to load users: {e}")
         return render_template("error.html", message="Unable to load users at the moment.")
 
 
 @user_bp.route("/<int:user_id>")
+@login_required(owner_message="Access denied: You can only view your own movies.")
+@query_budget(2)
 def user_movies(user_id):
     """
-    Display a list of movies for the currently logged-in user.
+    Display a page of movies for the currently logged-in user.
     Ensures that users can only access their own movie list.
+    Supports ?after=<last movie id>&limit=<page size> keyset pagination,
+    and answers conditional GETs with 304 when the page has not changed.
     """
-    current_user_id = session.get("user_id")
+    after, limit = get_page_args()
+    user = g.current_user
+    current_user_id = user.id
 
-    if not current_user_id:
-        flash("You need to log in first.", "warning")
-        return redirect(url_for("auth.login"))
-
-    # Redirect to the correct user's own page if mismatch
-    if current_user_id != user_id:
-        flash("Access denied: You can only view your own movies.", "danger")
-        return redirect(url_for("user.user_movies", user_id=current_user_id))
+    def load():
+        movies, next_after = paginate(current_app.data_manager.get_user_movies, after, limit,
+                                      user_id=current_user_id)
+        return dict(user=user, movies=movies, after=after, next_after=next_after, limit=limit)
 
     try:
-        user = current_app.data_manager.get_user_by_id(current_user_id)
-        if not user:
-            abort(404, description="User not found")
-
-        movies = current_app.data_manager.get_user_movies(current_user_id)
-        return render_template("user_movies.html", user=user, movies=movies)
+        version = page_version(current_app.data_manager.get_user_movies_version, after, limit,
+                               user_id=current_user_id)
+        return conditional_response(version, lambda: render_cached(
+            "user_movies.html", [f"user:{current_user_id}"], (after, limit), load))
 
     except Exception as e:
         current_app.logger.error(f"Error loading movies for user {current_user_id}: {e}")
@@ -53,9 +67,10 @@ def add_user():
     Prevents logged-in users from re-registering. Validates form inputs
     and handles user creation errors gracefully.
     """
-    if session.get("user_id"):
+    user = current_user()
+    if user:
         flash("You are already logged in.", "info")
-        return redirect(url_for("user.user_movies", user_id=session["user_id"]))
+        return redirect(url_for("user.user_movies", user_id=user.id))
 
     if request.method == "POST":
         name = request.form.get("name", "").strip()
@@ -68,7 +83,7 @@ def add_user():
         try:
             user = current_app.data_manager.add_user(name, email)
             # Set session so user is logged in immediately
-            session["user_id"] = user.id
+            login_user(user)
 
             flash(f"User {user.name} added successfully!", "success")
             return redirect(url_for("user.user_movies", user_id=user.id))
@@ -0,0 +1,54 @@
+import os
+import pytest
+
+# Settings read when the application modules are imported
+os.environ.update(
+    SECRET_KEY="test",
+    DATABASE_URL="sqlite://",
+    OMDB_API_KEY="test",
+    OMDB_CACHE_PATH="",
+    OMDB_OFFLINE_INDEX_PATH="",
+    PAGE_CACHE_BACKEND="none",
+)
+
+from app import create_app  # noqa: E402
+
+
+@pytest.fixture
+def make_app(monkeypatch, tmp_path):
+    """Build an application on a fresh in-memory database, with extra environment settings."""
+    apps = []
+
+    def factory(**settings):
+        monkeypatch.setenv("POSTER_DIR", str(tmp_path / "posters"))
+        for name, value in settings.items():
+            monkeypatch.setenv(name, str(value))
+        application = create_app()
+        application.config["TESTING"] = True
+        apps.append(application)
+        return application
+
+    yield factory
+    for application in apps:
+        for name in ("group_committer",):
+            if name in application.extensions:
+                application.extensions[name].stop()
+        if hasattr(application, "job_worker"):
+            application.job_worker.stop()
+
+
+@pytest.fixture
+def app(make_app):
+    return make_app()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def data_manager(app):
+    with app.app_context():
+        yield app.data_manager
+
@@ -0,0 +1,21 @@
+import zlib
+
+
+def add_film(data_manager, user_id: int, name: str, **details):
+    """Add a film with made-up OMDb details to a user's list and return the entry."""
+    return data_manager.add_movie(
+        user_id,
+        name=name,
+        director=details.get("director", "Director"),
+        year=details.get("year", 2000),
+        rating=details.get("rating", 7.0),
+        poster_url=details.get("poster_url"),
+        imdb_id=details.get("imdb_id", f"tt{zlib.crc32(name.encode()):07d}"),
+    )
+
+
+def log_in(client, email: str):
+    """Log a test client in through the login form."""
+    response = client.post("/login", data={"email": email})
+    assert response.status_code == 302
+    return response
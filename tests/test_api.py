@@ -0,0 +1,30 @@
+import pytest
+from helpers import add_film, log_in
+
+
+@pytest.fixture
+def entries(app):
+    with app.app_context():
+        data_manager = app.data_manager
+        ann = data_manager.add_user("Ann", "ann@example.com")
+        bob = data_manager.add_user("Bob", "bob@example.com")
+        anns = add_film(data_manager, ann.id, "Heat")
+        bobs = add_film(data_manager, bob.id, "Heat")
+        data_manager.update_movie(bobs.id, rating=3.0)
+        return anns.id, bobs.id
+
+
+def test_movie_endpoints_require_login(client, entries):
+    anns, _ = entries
+    assert client.get(f"/api/v1/movies?ids={anns}").status_code == 401
+    assert client.get(f"/api/v1/movies/{anns}").status_code == 401
+
+
+def test_movie_endpoints_only_return_own_entries(client, entries):
+    anns, bobs = entries
+    log_in(client, "ann@example.com")
+
+    body = client.get(f"/api/v1/movies?ids={anns},{bobs}&fields=user_rating").get_json()
+    assert body == {"movies": [{"id": anns, "user_rating": None}], "missing": [bobs]}
+    assert client.get(f"/api/v1/movies/{anns}").status_code == 200
+    assert client.get(f"/api/v1/movies/{bobs}").status_code == 404
@@ -0,0 +1,47 @@
+import pytest
+from datamanager.query_counter import count_queries
+from helpers import add_film, log_in
+
+
+@pytest.fixture
+def movie_id(app):
+    with app.app_context():
+        user = app.data_manager.add_user("Ann", "ann@example.com")
+        movie = add_film(app.data_manager, user.id, "Heat")
+        app.data_manager.add_review(user.id, movie.id, "Great", 9)
+        return movie.id
+
+
+def test_unchanged_page_answers_304_after_the_version_check(client, movie_id):
+    url = f"/reviews/movie/{movie_id}"
+    first = client.get(url)
+    assert first.status_code == 200 and first.headers["ETag"].startswith('W/"')
+    assert "private" in first.headers["Cache-Control"] and "no-cache" in first.headers["Cache-Control"]
+
+    with count_queries() as counter:
+        again = client.get(url, headers={"If-None-Match": first.headers["ETag"]})
+    assert again.status_code == 304 and again.data == b""
+    assert again.headers["ETag"] == first.headers["ETag"]
+    assert counter.count == 1
+
+
+def test_write_changes_the_etag(app, client, movie_id):
+    url = f"/reviews/movie/{movie_id}"
+    etag = client.get(url).headers["ETag"]
+    with app.app_context():
+        app.data_manager.add_review(1, movie_id, "Second look", 8)
+
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200 and b"Second look" in response.data
+    assert response.headers["ETag"] != etag
+
+
+def test_etag_differs_per_viewer(client, movie_id):
+    url = f"/reviews/movie/{movie_id}"
+    anonymous = client.get(url).headers["ETag"]
+    log_in(client, "ann@example.com")
+    client.get("/users")  # shows the welcome message, rendered instead of answered with validators
+
+    response = client.get(url, headers={"If-None-Match": anonymous})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != anonymous
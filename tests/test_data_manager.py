@@ -0,0 +1,103 @@
+from models.app_models import CatalogMovie, Review, TitleRatingStats
+from helpers import add_film
+
+
+def test_director_and_poster_edits_stay_on_the_users_entry(data_manager):
+    ann = data_manager.add_user("Ann", "ann@example.com")
+    bob = data_manager.add_user("Bob", "bob@example.com")
+    anns = add_film(data_manager, ann.id, "Heat", director="Michael Mann", poster_url="https://img/heat.jpg")
+    bobs = add_film(data_manager, bob.id, "Heat")
+    assert anns.catalog_movie_id == bobs.catalog_movie_id
+
+    data_manager.update_movie(anns.id, director="Someone Else", poster_url="https://img/mine.jpg")
+
+    anns, bobs = data_manager.get_movie_by_id(anns.id), data_manager.get_movie_by_id(bobs.id)
+    assert (anns.director, anns.poster_url) == ("Someone Else", "https://img/mine.jpg")
+    assert (bobs.director, bobs.poster_url) == ("Michael Mann", "https://img/heat.jpg")
+    catalog_movie = data_manager.db.session.get(CatalogMovie, anns.catalog_movie_id)
+    assert (catalog_movie.director, catalog_movie.poster_url) == ("Michael Mann", "https://img/heat.jpg")
+
+    # Going back to the catalog's values drops the correction
+    data_manager.update_movie(anns.id, director="Michael Mann", poster_url="https://img/heat.jpg")
+    anns = data_manager.get_movie_by_id(anns.id)
+    assert (anns.user_director, anns.user_poster_url) == (None, None)
+
+
+def stats_snapshot(data_manager) -> dict:
+    data_manager.db.session.expire_all()
+    return {
+        stats.catalog_movie_id: (stats.review_count, stats.rated_count, round(stats.rating_sum, 6),
+                                 stats.average_rating and round(stats.average_rating, 6), list(stats.histogram),
+                                 stats.last_review_at)
+        for stats in TitleRatingStats.query.all() if stats.review_count
+    }
+
+
+def assert_stats_match_reviews(data_manager):
+    """The incrementally maintained stats equal a rebuild from the reviews table."""
+    maintained = stats_snapshot(data_manager)
+    data_manager._recompute_title_stats()
+    rebuilt = stats_snapshot(data_manager)
+    data_manager.db.session.rollback()
+    assert maintained == rebuilt
+    # Each review's copy of its film follows the entry it belongs to
+    assert all(review.catalog_movie_id == review.movie.catalog_movie_id for review in Review.query.all())
+    return maintained
+
+
+def test_mutators_keep_title_stats_consistent(data_manager):
+    ann = data_manager.add_user("Ann", "ann@example.com")
+    bob = data_manager.add_user("Bob", "bob@example.com")
+    anns_heat = add_film(data_manager, ann.id, "Heat")
+    bobs_heat = add_film(data_manager, bob.id, "Heat")
+    anns_alien = add_film(data_manager, ann.id, "Alien", year=1979)
+    heat, alien = anns_heat.catalog_movie_id, anns_alien.catalog_movie_id
+
+    first = data_manager.add_review(ann.id, anns_heat.id, "Great", 9)
+    data_manager.add_review(bob.id, bobs_heat.id, "Fine", 6.4)
+    data_manager.add_review(bob.id, bobs_heat.id, "No rating")
+    data_manager.add_review(ann.id, anns_alien.id, "Scary", 8)
+    stats = assert_stats_match_reviews(data_manager)
+    assert stats[heat][:3] == (3, 2, 15.4)
+
+    data_manager.update_review(first.id, "Still great", 10)
+    assert assert_stats_match_reviews(data_manager)[heat][:3] == (3, 2, 16.4)
+
+    # Retitling the entry moves its reviews to the other film
+    data_manager.update_movie(bobs_heat.id, name="Alien", year=1979)
+    stats = assert_stats_match_reviews(data_manager)
+    assert stats[heat][:3] == (1, 1, 10) and stats[alien][:3] == (3, 2, 14.4)
+    assert [review.review_text for review in data_manager.get_reviews_for_movie(anns_alien.id)] == [
+        "Fine", "No rating", "Scary"]
+
+    data_manager.delete_review(first.id)
+    assert heat not in assert_stats_match_reviews(data_manager)
+
+    data_manager.delete_movie(anns_alien.id)
+    assert assert_stats_match_reviews(data_manager)[alien][:3] == (2, 1, 6.4)
+
+    data_manager.delete_user(bob.id)
+    assert assert_stats_match_reviews(data_manager) == {}
+
+
+def test_renaming_an_entry_never_writes_its_details_into_the_catalog(data_manager):
+    ann = data_manager.add_user("Ann", "ann@example.com")
+    bob = data_manager.add_user("Bob", "bob@example.com")
+    anns = add_film(data_manager, ann.id, "Heat", director="Michael Mann", poster_url="https://img/heat.jpg")
+    data_manager.add_review(ann.id, anns.id, "Great", 9)
+
+    data_manager.update_movie(anns.id, name="Alien", year=1979)
+    anns = data_manager.get_movie_by_id(anns.id)
+    alien = data_manager.db.session.get(CatalogMovie, anns.catalog_movie_id)
+    assert (alien.name, alien.year, alien.director, alien.poster_url, alien.imdb_id) == ("Alien", 1979, None, None, None)
+    # Ann keeps what her entry showed
+    assert (anns.director, anns.poster_url) == ("Michael Mann", "https://img/heat.jpg")
+
+    # Bob adding the real film verifies the catalog entry with OMDb's details
+    bobs = add_film(data_manager, bob.id, "Alien", year=1979, director="Ridley Scott",
+                    poster_url="https://img/alien.jpg")
+    assert bobs.catalog_movie_id == alien.id
+    bobs, anns = data_manager.get_movie_by_id(bobs.id), data_manager.get_movie_by_id(anns.id)
+    assert (bobs.director, bobs.poster_url) == ("Ridley Scott", "https://img/alien.jpg")
+    assert (anns.director, anns.poster_url) == ("Michael Mann", "https://img/heat.jpg")
+    assert assert_stats_match_reviews(data_manager)[alien.id][:3] == (1, 1, 9)
@@ -0,0 +1,71 @@
+import pytest
+from datetime import datetime, timedelta
+from datamanager.job_queue import JobWorker
+from models.app_models import db, Job
+from helpers import add_film
+
+
+def test_background_workers_start_with_first_request(make_app):
+    app = make_app(ASYNC_ENRICHMENT="true", GROUP_COMMIT_WINDOW_MS=5)
+    committer = app.extensions["group_committer"]
+    # Building the app, as every flask command does, starts no thread
+    assert app.job_worker._threads == []
+    assert committer._thread is None
+
+    app.test_client().get("/users")
+    assert len(app.job_worker._threads) == app.config["JOB_WORKERS"]
+    assert committer._thread.is_alive()
+
+
+def test_prune_deletes_old_done_jobs_only(app):
+    old = datetime.utcnow() - timedelta(days=8)
+    with app.app_context():
+        for status, created_at in [("done", old), ("done", datetime.utcnow()), ("failed", old), ("queued", old)]:
+            db.session.add(Job(kind="enrich_movie", target_id=1, status=status, created_at=created_at))
+        db.session.commit()
+
+    assert JobWorker(app, retention=7 * 24 * 3600).prune() == 1
+    with app.app_context():
+        remaining = sorted((job.status, job.created_at == old) for job in Job.query.all())
+    assert remaining == [("done", False), ("failed", True), ("queued", True)]
+
+
+def test_re_adding_own_failed_film_retries_it(make_app):
+    app = make_app(ASYNC_ENRICHMENT="true")
+    with app.app_context():
+        data_manager = app.data_manager
+        user = data_manager.add_user("Ann", "ann@example.com")
+        entry = data_manager.add_pending_movie(user.id, "Some  Obscure Film")
+        entry.catalog.status = "failed"
+        db.session.commit()
+
+        again = data_manager.add_pending_movie(user.id, "some obscure film")
+        assert again.id == entry.id and again.status == "pending"
+        assert Job.query.filter_by(kind="enrich_movie", target_id=entry.catalog_movie_id,
+                                   status="queued").count() == 2
+
+        with pytest.raises(ValueError, match="already added"):
+            data_manager.add_pending_movie(user.id, "Some Obscure Film")
+
+
+def test_merged_film_keeps_its_reviews_on_one_page(make_app):
+    app = make_app(ASYNC_ENRICHMENT="true")
+    with app.app_context():
+        data_manager = app.data_manager
+        ann = data_manager.add_user("Ann", "ann@example.com")
+        bob = data_manager.add_user("Bob", "bob@example.com")
+        bobs_heat = add_film(data_manager, bob.id, "Heat", year=1995)
+        anns_pending = data_manager.add_pending_movie(ann.id, "Heat (film)")
+        bobs_pending = data_manager.add_pending_movie(bob.id, "Heat (film)")
+        data_manager.add_review(bob.id, bobs_heat.id, "First")
+        data_manager.add_review(ann.id, anns_pending.id, "Second")
+        data_manager.add_review(bob.id, bobs_pending.id, "Third")
+
+        # OMDb identifies the pending title as the film Bob already has
+        data_manager.apply_movie_details(anns_pending.catalog_movie_id, {
+            "name": "Heat", "year": 1995, "director": "Michael Mann", "imdb_id": bobs_heat.catalog.imdb_id})
+
+        for movie_id in (bobs_heat.id, anns_pending.id):
+            reviews = data_manager.get_reviews_for_movie(movie_id)
+            assert [review.review_text for review in reviews] == ["First", "Second", "Third"]
+            assert {review.catalog_movie_id for review in reviews} == {bobs_heat.catalog_movie_id}
@@ -0,0 +1,104 @@
+import os
+import sqlite3
+from alembic.script import ScriptDirectory
+from flask_migrate import downgrade, upgrade
+from sqlalchemy import inspect
+from models.app_models import db, CatalogMovie, Movie, TitleRatingStats
+
+MIGRATIONS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "migrations")
+BASELINE_REVISION = "9278610d82bf"
+
+# Schema of a database created by the baseline application (db.create_all), stamped at its last migration
+BASELINE_SCHEMA = """
+CREATE TABLE users (
+    id INTEGER NOT NULL PRIMARY KEY,
+    name VARCHAR(100) NOT NULL,
+    email VARCHAR(120) NOT NULL UNIQUE
+);
+CREATE TABLE movies (
+    id INTEGER NOT NULL PRIMARY KEY,
+    user_id INTEGER NOT NULL REFERENCES users (id),
+    name VARCHAR(255) NOT NULL,
+    director VARCHAR(255),
+    year INTEGER,
+    rating FLOAT,
+    poster_url VARCHAR(255),
+    CONSTRAINT uix_user_movie UNIQUE (user_id, name)
+);
+CREATE TABLE reviews (
+    id INTEGER NOT NULL PRIMARY KEY,
+    user_id INTEGER NOT NULL REFERENCES users (id),
+    movie_id INTEGER NOT NULL REFERENCES movies (id),
+    review_text TEXT NOT NULL,
+    rating FLOAT,
+    created_at DATETIME
+);
+CREATE TABLE alembic_version (
+    version_num VARCHAR(32) NOT NULL,
+    CONSTRAINT alembic_version_pkc PRIMARY KEY (version_num)
+);
+"""
+
+
+def create_baseline_database(path):
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.executescript(BASELINE_SCHEMA)
+        conn.execute("INSERT INTO alembic_version VALUES (?)", (BASELINE_REVISION,))
+        conn.executemany("INSERT INTO users VALUES (?, ?, ?)",
+                         [(1, "Ann", "ann@example.com"), (2, "Bob", "bob@example.com")])
+        conn.executemany("INSERT INTO movies VALUES (?, ?, ?, ?, ?, ?, ?)", [
+            (1, 1, "Heat", "Michael Mann", 1995, 8.3, "https://img/heat.jpg"),
+            (2, 1, "Alien", "Ridley Scott", 1979, 8.5, None),
+            (3, 2, "heat", "M. Mann", 1995, 6.0, "https://img/heat-bob.jpg"),
+        ])
+        conn.executemany("INSERT INTO reviews VALUES (?, ?, ?, ?, ?, ?)", [
+            (1, 1, 1, "Great heist", 9, "2024-01-01 10:00:00"),
+            (2, 2, 3, "Too long", 5, "2024-01-02 10:00:00"),
+            (3, 2, 2, "No rating", None, "2024-01-03 10:00:00"),
+        ])
+    conn.close()
+
+
+def test_baseline_database_upgrades_through_every_migration(make_app, tmp_path):
+    path = tmp_path / "baseline.sqlite"
+    create_baseline_database(path)
+    app = make_app(DATABASE_URL=f"sqlite:///{path}")
+
+    with app.app_context():
+        upgrade(directory=MIGRATIONS)
+        head = ScriptDirectory.from_config(app.extensions["migrate"].migrate.get_config(MIGRATIONS)).get_current_head()
+        assert db.session.execute(db.text("SELECT version_num FROM alembic_version")).scalar() == head
+        # Every mapped table and column exists
+        inspector = inspect(db.engine)
+        for table in db.metadata.sorted_tables:
+            assert {column.name for column in table.columns} <= {c["name"] for c in inspector.get_columns(table.name)}
+
+        # Both users' Heat became one catalog film; details differing from it stay on the entry
+        heat = CatalogMovie.query.filter_by(title_key="heat").one()
+        entries = {movie.id: movie for movie in Movie.query.all()}
+        assert entries[1].catalog_movie_id == entries[3].catalog_movie_id == heat.id
+        assert (heat.director, heat.year, heat.poster_url) == ("Michael Mann", 1995, "https://img/heat.jpg")
+        assert (entries[1].user_rating, entries[1].user_director, entries[1].user_poster_url) == (None, None, None)
+        assert (entries[3].rating, entries[3].director, entries[3].poster_url) == (6.0, "M. Mann",
+                                                                                  "https://img/heat-bob.jpg")
+
+        # Reviews carry the film of their entry
+        assert dict(db.session.execute(db.text("SELECT id, catalog_movie_id FROM reviews")).all()) == {
+            1: heat.id, 2: heat.id, 3: entries[2].catalog_movie_id}
+
+        stats = db.session.get(TitleRatingStats, heat.id)
+        assert (stats.review_count, stats.rated_count, stats.rating_sum) == (2, 2, 14)
+        assert [catalog_movie.name for catalog_movie, _ in app.data_manager.search("hea", kind="movies")] == ["Heat"]
+
+        downgrade(directory=MIGRATIONS, revision=BASELINE_REVISION)
+        assert sorted(inspect(db.engine).get_table_names()) == ["alembic_version", "movies", "reviews", "users"]
+        assert db.session.execute(db.text("SELECT id, director, rating, poster_url FROM movies WHERE name LIKE 'heat'"
+                                          " ORDER BY id")).all() == [
+            (1, "Michael Mann", 8.3, "https://img/heat.jpg"), (3, "M. Mann", 6.0, "https://img/heat-bob.jpg")]
+
+    client = app.test_client()
+    with app.app_context():
+        upgrade(directory=MIGRATIONS)
+    assert client.get("/users").status_code == 200
+    assert client.get("/reviews/movie/3").status_code == 200
@@ -0,0 +1,19 @@
+import time
+from datamanager.page_cache import MemoryPageCache
+
+
+def test_memory_fragments_expire(monkeypatch):
+    cache = MemoryPageCache(ttl=60)
+    cache.set("users:1", "<ul></ul>")
+    assert cache.get("users:1") == "<ul></ul>"
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 61)
+    assert cache.get("users:1") is None
+
+
+def test_page_cache_is_off_by_default(make_app, monkeypatch):
+    monkeypatch.delenv("PAGE_CACHE_BACKEND")
+    app = make_app()
+    assert app.config["PAGE_CACHE_BACKEND"] == "none"
+    assert "page_cache" not in app.extensions
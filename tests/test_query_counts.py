@@ -0,0 +1,51 @@
+import pytest
+from datamanager.query_counter import count_queries
+from helpers import add_film, log_in
+
+USERS = 30
+
+
+@pytest.fixture
+def seeded(app):
+    """A film on many users' lists. Seeding runs in its own app context, so requests start cold."""
+    with app.app_context():
+        data_manager = app.data_manager
+        users = [data_manager.add_user(f"User {i}", f"user{i}@example.com").id for i in range(USERS)]
+        entries = [add_film(data_manager, user_id, "Heat").id for user_id in users]
+        for user_id in users[1:]:
+            add_film(data_manager, user_id, f"Film of user {user_id}")
+
+    def add_reviews(count: int):
+        with app.app_context():
+            for i in range(count):
+                app.data_manager.add_review(users[i % USERS], entries[i % USERS], f"Review {i}", i % 10)
+
+    return {"owner": users[0], "movie": entries[0], "add_reviews": add_reviews}
+
+
+def statements_for(client, url: str) -> int:
+    with count_queries() as counter:
+        response = client.get(url)
+    assert response.status_code == 200, response.status_code
+    return counter.count
+
+
+def test_view_reviews_statement_count(client, seeded):
+    url = f"/reviews/movie/{seeded['movie']}"
+    # Version check, film, one page of reviews with their authors
+    seeded["add_reviews"](5)
+    assert statements_for(client, url) == 3
+    seeded["add_reviews"](60)
+    assert statements_for(client, url) == 3
+
+
+def test_list_users_statement_count(client, seeded):
+    # Version check, one page of users
+    assert statements_for(client, "/users") == 2
+
+
+def test_user_movies_statement_count(client, seeded):
+    log_in(client, "user0@example.com")
+    seeded["add_reviews"](60)
+    # Version check, one page of entries with their catalog films (the user comes from the session)
+    assert statements_for(client, f"/{seeded['owner']}") == 2
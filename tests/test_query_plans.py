@@ -0,0 +1,12 @@
+from commands.query_plan_commands import find_table_scans
+
+
+def test_every_data_manager_query_uses_an_index(app):
+    result = app.test_cli_runner().invoke(args=["check-query-plans"])
+    assert result.exit_code == 0, result.output
+
+
+def test_sorted_keyset_page_is_reported():
+    plan = ["SEARCH reviews USING INDEX ix_reviews_movie_id (movie_id=? AND rowid>?)", "USE TEMP B-TREE FOR ORDER BY"]
+    assert find_table_scans(plan) == []
+    assert find_table_scans(plan, keyset_page=True) == ["USE TEMP B-TREE FOR ORDER BY"]
@@ -0,0 +1,34 @@
+import pytest
+from helpers import log_in
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def session_app(request, make_app, tmp_path):
+    app = make_app(SESSION_BACKEND=request.param, SESSION_PATH=tmp_path / "sessions.sqlite")
+    with app.app_context():
+        app.data_manager.add_user("Ann", "ann@example.com")
+    return app
+
+
+def session_id(client) -> str:
+    return client.get_cookie("session").value
+
+
+def test_login_moves_the_session_to_a_new_id(session_app):
+    store = session_app.session_interface.store
+    client = session_app.test_client()
+    # Being turned away from a page stores a flash message, so the visitor gets a session before logging in
+    client.get("/1")
+    planted = session_id(client)
+    assert store.get(planted) is not None
+
+    log_in(client, "ann@example.com")
+    assert session_id(client) != planted
+    assert store.get(planted) is None
+
+    # Someone holding the old ID is not logged in
+    attacker = session_app.test_client()
+    attacker.set_cookie("session", planted)
+    assert attacker.get("/1").status_code == 302
+    assert client.get("/1").status_code == 200
+
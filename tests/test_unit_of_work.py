@@ -0,0 +1,109 @@
+import sqlite3
+from concurrent.futures import Future
+import pytest
+from sqlalchemy import event
+from datamanager.unit_of_work import GroupCommitter
+from models.app_models import db, User
+
+TRANSACTION_STATEMENTS = ("BEGIN", "COMMIT", "ROLLBACK", "SAVEPOINT", "RELEASE")
+
+
+@pytest.fixture
+def file_app(make_app, tmp_path):
+    """An application on a SQLite file, where transactions behave as in production."""
+    return make_app(DATABASE_URL=f"sqlite:///{tmp_path / 'app.sqlite'}")
+
+
+@pytest.fixture
+def sqlite_trace(file_app):
+    """Transaction statements SQLite really executed, as reported by the driver's trace callback."""
+    statements = []
+
+    def trace(statement):
+        if statement.split(" ", 1)[0].upper() in TRANSACTION_STATEMENTS:
+            statements.append(statement.split(" ", 1)[0].upper())
+
+    with file_app.app_context():
+        engine = db.engine
+    event.listen(engine, "checkout", lambda dbapi_connection, record, proxy: dbapi_connection.set_trace_callback(trace))
+    return statements
+
+
+def user_emails(app) -> set:
+    with app.app_context():
+        return {user.email for user in User.query.all()}
+
+
+def run_group(app, writes: list) -> list:
+    """Run writes as one group of the group committer and return their futures."""
+    batch = [(write, args, {}, Future()) for write, args in writes]
+    GroupCommitter(app)._run_group(batch)
+    return [future for *_, future in batch]
+
+
+def test_group_is_one_sqlite_transaction(file_app, sqlite_trace):
+    add_user = type(file_app.data_manager).add_user
+    futures = run_group(file_app, [(add_user, (file_app.data_manager, f"U{i}", f"u{i}@example.com"))
+                                   for i in range(8)])
+
+    assert all(future.exception() is None for future in futures)
+    assert sqlite_trace.count("BEGIN") == 1
+    assert sqlite_trace.count("COMMIT") == 1
+    assert sqlite_trace.count("SAVEPOINT") == 8
+    assert user_emails(file_app) == {f"u{i}@example.com" for i in range(8)}
+
+
+def test_failing_write_is_undone_alone(file_app, sqlite_trace):
+    add_user = type(file_app.data_manager).add_user
+    futures = run_group(file_app, [(add_user, (file_app.data_manager, "A", "a@example.com")),
+                                   (add_user, (file_app.data_manager, "A again", "a@example.com")),
+                                   (add_user, (file_app.data_manager, "B", "b@example.com"))])
+
+    assert isinstance(futures[1].exception(), ValueError)
+    assert sqlite_trace.count("COMMIT") == 1
+    assert user_emails(file_app) == {"a@example.com", "b@example.com"}
+
+
+def test_aborted_unit_rolls_back_released_writes(file_app, sqlite_trace):
+    data_manager = file_app.data_manager
+    with file_app.app_context():
+        with pytest.raises(RuntimeError):
+            with data_manager.unit_of_work() as unit:
+                for i in range(3):
+                    unit.savepoint = db.session.begin_nested()
+                    data_manager.add_user(f"U{i}", f"u{i}@example.com")
+                    unit.savepoint.commit()
+                unit.savepoint = None
+                raise RuntimeError("abort")
+
+    assert sqlite_trace.count("RELEASE") == 3
+    assert sqlite_trace.count("COMMIT") == 0
+    assert sqlite_trace.count("ROLLBACK") == 1
+    assert user_emails(file_app) == set()
+
+
+def test_unit_of_work_commits_writes_together(file_app, sqlite_trace):
+    data_manager = file_app.data_manager
+    with file_app.app_context():
+        with data_manager.unit_of_work():
+            data_manager.add_user("A", "a@example.com")
+            data_manager.add_user("B", "b@example.com")
+
+    assert sqlite_trace.count("BEGIN") == 1
+    assert sqlite_trace.count("COMMIT") == 1
+    assert user_emails(file_app) == {"a@example.com", "b@example.com"}
+
+
+def test_group_commit_results_are_read_back_from_the_primary(make_app, tmp_path):
+    primary_path, replica_path = tmp_path / "primary.sqlite", tmp_path / "replica.sqlite"
+    make_app(DATABASE_URL=f"sqlite:///{primary_path}")  # creates the schema
+    with sqlite3.connect(primary_path) as source, sqlite3.connect(replica_path) as target:
+        source.backup(target)
+    # The replica is never synced, so it lags behind every write
+    app = make_app(DATABASE_URL=f"sqlite:///{primary_path}", DATABASE_REPLICA_URLS=f"sqlite:///{replica_path}",
+                   GROUP_COMMIT_WINDOW_MS=5)
+    app.extensions["group_committer"].start()
+
+    with app.app_context():
+        user = app.data_manager.add_user("Ann", "ann@example.com")
+        assert user is not None and user.email == "ann@example.com"